@@ -0,0 +1,65 @@
+"""
+Loading a synthetic 100,000-estate board at process start: parsing and validating the
+TOML file (first load, which also writes the compiled cache), loading from the compiled
+cache, and building the catalog from in-memory rows as ``BoardCatalog.of`` does.
+
+    python -m benchmarks.bench_board_file
+"""
+import logging
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from monopoly.domain.entities.estate import BUILDABLE_CATEGORIES, EstateCategory, EstateId
+from monopoly.domain.entities.game.board_file import format_board, load_board
+from monopoly.domain.entities.game.catalog import MAX_STARS, BoardCatalog, EstateSpec
+
+ESTATES = 100_000
+
+
+def rows(count: int) -> list[tuple]:
+    rng = random.Random(1)
+    categories = list(EstateCategory)
+    board = []
+    for identity in range(1, count + 1):
+        price = rng.randrange(50, 500)
+        board.append((identity, f"Estate {identity}", price, price // 2, price // 2 * 11 // 10,
+                      price // 10, categories[identity % len(categories)]))
+    return board
+
+
+def from_rows(board: list[tuple]) -> BoardCatalog:
+    return BoardCatalog(
+        EstateSpec(EstateId(identity), name, price, mortgage, buyback, rent, category,
+                   category in BUILDABLE_CATEGORIES,
+                   MAX_STARS if category in BUILDABLE_CATEGORIES else 0)
+        for identity, name, price, mortgage, buyback, rent, category in board
+    )
+
+
+def timed(action) -> tuple[float, object]:
+    started = perf_counter()
+    result = action()
+    return perf_counter() - started, result
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    board = rows(ESTATES)
+    build, catalog = timed(lambda: from_rows(board))
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "board.toml"
+        path.write_text(format_board(catalog), encoding="utf-8")
+        cold, _ = timed(lambda: load_board(path))
+        warm = min(timed(lambda: load_board(path))[0] for _ in range(5))
+        size = path.stat().st_size
+
+    print(f"{ESTATES:,} estates, {size / 1e6:.1f} MB of TOML")
+    print(f"catalog from rows      {build * 1e3:8.1f} ms")
+    print(f"first load (validate)  {cold * 1e3:8.1f} ms")
+    print(f"compiled cache         {warm * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Micro-benchmark of Estate state transitions: time, state objects allocated and
+traced memory per transition.
+
+    python -m benchmarks.bench_estate_state
+"""
+import logging
+import tracemalloc
+from time import perf_counter
+
+from monopoly.domain.entities import estate_state
+from monopoly.domain.entities.estate import Estate, EstateCategory, EstateId
+from monopoly.domain.entities.player import PlayerId
+
+ROUNDS = 200_000
+# buy, mortgage, buyback, mortgage, 15 x advance_turn (auto-release)
+TRANSITIONS_PER_ROUND = 19
+
+
+def make_estate() -> Estate:
+    return Estate(
+        identity=EstateId(1),
+        name="Fragrance Hub",
+        price=100,
+        mortgage_price=50,
+        buyback_price=55,
+        category=EstateCategory.PERFUMERY,
+    )
+
+
+def run_cycle(estate: Estate, rounds: int) -> None:
+    player_id = PlayerId(1)
+    for _ in range(rounds):
+        estate.buy(player_id)
+        estate.mortgage(player_id)
+        estate.buyback(player_id)
+        estate.mortgage(player_id)
+        for _ in range(15):
+            estate.advance_turn()
+
+
+def count_state_allocations(rounds: int) -> int:
+    created = 0
+    originals = {}
+
+    def counting_init(original):
+        def init(self, *args, **kwargs):
+            nonlocal created
+            created += 1
+            original(self, *args, **kwargs)
+        return init
+
+    state_classes = (
+        estate_state.NotOwnedState, estate_state.OwnedState, estate_state.MortgagedState
+    )
+    for cls in state_classes:
+        originals[cls] = cls.__init__
+        cls.__init__ = counting_init(cls.__init__)
+    try:
+        run_cycle(make_estate(), rounds)
+    finally:
+        for cls, original in originals.items():
+            cls.__init__ = original
+    return created
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+
+    estate = make_estate()
+    run_cycle(estate, 1_000)
+    started = perf_counter()
+    run_cycle(estate, ROUNDS)
+    elapsed = perf_counter() - started
+    transitions = ROUNDS * TRANSITIONS_PER_ROUND
+
+    allocations = count_state_allocations(10_000)
+
+    tracemalloc.start()
+    run_cycle(make_estate(), 10_000)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"transitions:            {transitions}")
+    print(f"time per transition:    {elapsed / transitions * 1e9:.1f} ns")
+    print(f"state objects/round:    {allocations / 10_000:.2f}")
+    print(f"traced peak (10k rounds): {peak} bytes")
+
+
+if __name__ == "__main__":
+    main()
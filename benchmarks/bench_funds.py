@@ -0,0 +1,67 @@
+"""
+One million transfers between two players.
+
+    python -m benchmarks.bench_funds
+"""
+from time import perf_counter
+
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+
+TRANSFERS = 1_000_000
+
+
+def players() -> tuple[Player, Player]:
+    return (
+        Player(identity=PlayerId(1), funds=Funds(amount=10**9)),
+        Player(identity=PlayerId(2), funds=Funds(amount=10**9)),
+    )
+
+
+def bench_value_objects() -> float:
+    payer, payee = players()
+    started = perf_counter()
+    for i in range(TRANSFERS):
+        amount = Funds(amount=i % 500)
+        payer.funds = payer.funds.subtract(amount)
+        payee.funds = payee.funds.add(amount)
+    return perf_counter() - started
+
+
+def bench_transfer() -> float:
+    from monopoly.domain.entities.player import transfer
+
+    payer, payee = players()
+    started = perf_counter()
+    for i in range(TRANSFERS):
+        transfer(payer, payee, i % 500)
+    return perf_counter() - started
+
+
+def bench_transfer_many() -> float:
+    from monopoly.domain.entities.player import transfer_many
+
+    payer, payee = players()
+    batch = [(payer, payee, i % 500) for i in range(1000)]
+    started = perf_counter()
+    for _ in range(TRANSFERS // len(batch)):
+        transfer_many(batch)
+    return perf_counter() - started
+
+
+def main():
+    benchmarks = [("subtract/add with Funds", bench_value_objects)]
+    try:
+        from monopoly.domain.entities.player import transfer, transfer_many  # noqa: F401
+        benchmarks += [
+            ("transfer()", bench_transfer), ("transfer_many() x1000", bench_transfer_many)
+        ]
+    except ImportError:
+        pass
+    for name, bench in benchmarks:
+        elapsed = bench()
+        print(f"{name:26} {elapsed:.3f}s  {elapsed / TRANSFERS * 1e9:.0f} ns/transfer")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Games per second of the simulation loop building a new Game per seed versus reusing
+games from a GamePool, for full games and for short, high-churn ones. Also times
+building a game against resetting a played one.
+
+    python -m benchmarks.bench_game_pool
+"""
+import logging
+from time import perf_counter
+
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+
+POLICIES = (GreedyPolicy(), CautiousPolicy())
+GAMES = 400
+
+
+def games_per_second(config: SimulationConfig, pool_size: int) -> float:
+    simulator = Simulator(config=config, policies=POLICIES, pool_size=pool_size)
+    simulator.run(range(20))
+    return simulator.run(range(GAMES)).games_per_second
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    for label, config in (
+        ("full games (500 turns)", SimulationConfig()),
+        ("short games (10 turns)", SimulationConfig(max_turns=10)),
+    ):
+        fresh = games_per_second(config, 0)
+        pooled = games_per_second(config, 4)
+        print(f"{label:24} new Game {fresh:8,.0f} games/s   pooled {pooled:8,.0f} games/s "
+              f"({pooled / fresh:.2f}x)")
+
+    config = SimulationConfig()
+    started = perf_counter()
+    for _ in range(1000):
+        SimulatedGame.new_game(config)
+    build = (perf_counter() - started) / 1000
+    simulated = SimulatedGame(seed=1, config=config, policies=POLICIES)
+    simulated.run()
+    started = perf_counter()
+    for _ in range(1000):
+        simulated.game.reset()
+    reset = (perf_counter() - started) / 1000
+    print(f"build {build * 1e6:6.1f} us   reset {reset * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
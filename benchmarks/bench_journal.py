@@ -0,0 +1,74 @@
+"""
+Journal overhead on a 10,000-turn game, and replay speed of the resulting log.
+
+    python -m benchmarks.bench_journal
+"""
+import io
+from datetime import timedelta
+from time import perf_counter
+
+from monopoly.domain.journal import Journal, JournalWriter, replay
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+from monopoly.domain.snapshot import dump
+
+TURNS = 10_000
+CONFIG = SimulationConfig(max_turns=TURNS, turn_duration=timedelta(milliseconds=250))
+POLICIES = (GreedyPolicy(), CautiousPolicy())
+
+
+def play(
+    journal: io.BytesIO | None = None, snapshot_every: int = 100
+) -> tuple[SimulatedGame, float]:
+    simulated = SimulatedGame(seed=1, config=CONFIG, policies=POLICIES)
+    writer = None
+    if journal is not None:
+        writer = JournalWriter(journal, simulated.game, snapshot_every=snapshot_every)
+    started = perf_counter()
+    simulated.run()
+    elapsed = perf_counter() - started
+    if writer is not None:
+        writer.close()
+    return simulated, elapsed
+
+
+def main():
+    _, plain = play()
+    buffer = io.BytesIO()
+    live, journaled = play(buffer)
+    turns = live.game.current_turn
+    print(f"play {turns} turns:    {plain * 1e6 / turns:8.2f} us/turn without journal")
+    print(f"play {turns} turns:    {journaled * 1e6 / turns:8.2f} us/turn with journal "
+          f"({buffer.tell() / 1024:.0f} KiB)")
+
+    data = buffer.getvalue()
+    started = perf_counter()
+    journal = Journal(data)
+    indexed = perf_counter() - started
+    print(f"index journal:       {indexed * 1e3:8.2f} ms")
+
+    started = perf_counter()
+    replayed = replay(journal, SimulatedGame(seed=1, config=CONFIG, policies=POLICIES).game)
+    elapsed = perf_counter() - started
+    assert dump(replayed) == dump(live.game)
+    print(f"replay to the end:   {elapsed * 1e3:8.2f} ms (from the last snapshot)")
+
+    target = turns - 50
+    started = perf_counter()
+    replay(journal, SimulatedGame(seed=1, config=CONFIG, policies=POLICIES).game, turn=target)
+    elapsed = perf_counter() - started
+    print(f"replay to turn {target}: {elapsed * 1e3:6.2f} ms (from the nearest snapshot)")
+
+    # A single snapshot at turn 0: every event of the game is applied
+    unsnapshotted = io.BytesIO()
+    play(unsnapshotted, snapshot_every=TURNS + 1)
+    journal = Journal(unsnapshotted.getvalue())
+    started = perf_counter()
+    replayed = replay(journal, SimulatedGame(seed=1, config=CONFIG, policies=POLICIES).game)
+    elapsed = perf_counter() - started
+    assert dump(replayed) == dump(live.game)
+    print(f"replay from turn 0:  {elapsed * 1e3:8.2f} ms ({elapsed * 1e6 / turns:.2f} us/turn)")
+
+
+if __name__ == "__main__":
+    main()
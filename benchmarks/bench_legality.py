@@ -0,0 +1,44 @@
+"""
+Probing whether a purchase is legal: calling buy_estate and catching the refusal versus
+asking can_buy for a Verdict.
+
+    python -m benchmarks.bench_legality
+"""
+import logging
+from time import perf_counter
+
+from monopoly.domain.entities.estate import Estate, EstateCategory, EstateId
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.exceptions.base import DomainError
+from monopoly.domain.value_objects.funds import Funds
+
+PROBES = 200_000
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    owner, bidder = (Player(identity=PlayerId(seat), funds=Funds(amount=10**9)) for seat in (1, 2))
+    estate = Estate(identity=EstateId(1), name="Honey Street", price=60, mortgage_price=30,
+                    buyback_price=33, category=EstateCategory.CLOTHING)
+    owner.buy_estate(estate)
+
+    started = perf_counter()
+    for _ in range(PROBES):
+        try:
+            bidder.buy_estate(estate)
+        except DomainError:
+            pass
+    before = (perf_counter() - started) / PROBES
+
+    can_buy = bidder.can_buy
+    started = perf_counter()
+    for _ in range(PROBES):
+        can_buy(estate)
+    after = (perf_counter() - started) / PROBES
+
+    print(f"refused purchase probe: try/except {before * 1e9:6.0f} ns   "
+          f"can_buy {after * 1e9:5.0f} ns ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Planning which estates to mortgage to cover a debt on large custom boards: solve time of
+plan_liquidation and the cost of its plan next to mortgaging the cheapest estates per
+dollar raised.
+
+    python -m benchmarks.bench_liquidation
+"""
+import logging
+import random
+from time import perf_counter
+
+from monopoly.domain.entities.estate import BuildableEstate, EstateCategory, EstateId
+from monopoly.domain.entities.game.board import build_registry
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.liquidation import BROKEN_SET_RATE, plan_liquidation
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+
+HOLDINGS = (100, 300, 1000)
+REPEATS = 5
+
+
+def game_with(holding: int) -> tuple[Game, Player]:
+    rng = random.Random(holding)
+    categories = list(EstateCategory)
+    estates = []
+    for identity in range(1, 2 * holding + 1):
+        price = rng.randrange(60, 400, 5)
+        mortgage_price = price // 2
+        estates.append(BuildableEstate(
+            identity=EstateId(identity), name=f"Estate {identity}", price=price,
+            mortgage_price=mortgage_price,
+            buyback_price=mortgage_price + rng.randrange(1, mortgage_price // 3),
+            category=categories[identity % len(categories)],
+        ))
+    player = Player(identity=PlayerId(1), funds=Funds(amount=10**9))
+    game = Game(players=[player], estate_registry=build_registry(estates))
+    # Every estate of two categories, then the rest of the holding from the others
+    whole = set(categories[:2])
+    ordered = sorted(estates, key=lambda estate: (estate.category not in whole, estate.identity))
+    for estate in ordered:
+        if estate.category in whole or len(player.estates) < holding:
+            player.buy_estate(estate)
+    player.funds = Funds(amount=0)
+    return game, player
+
+
+def greedy_cost(game: Game, player: Player, amount: int) -> int:
+    complete = game.board_index.complete_categories(player.identity)
+    chosen, shortfall = [], amount
+    by_cost = sorted(
+        player.estates.values(), key=lambda estate: estate.buyback_price / estate.mortgage_price
+    )
+    for estate in by_cost:
+        if shortfall <= 0:
+            break
+        chosen.append(estate)
+        shortfall -= estate.mortgage_price
+    broken = {estate.category for estate in chosen if estate.category in complete}
+    return sum(estate.buyback_price for estate in chosen) + sum(
+        BROKEN_SET_RATE.apply(sum(estate.price for estate in game.estate_registry[category]))
+        for category in broken
+    )
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    for holding in HOLDINGS:
+        game, player = game_with(holding)
+        amount = sum(estate.mortgage_price for estate in player.estates.values()) // 4
+
+        started = perf_counter()
+        for _ in range(REPEATS):
+            plan = plan_liquidation(game, player, amount)
+        solve = (perf_counter() - started) / REPEATS
+
+        assert plan.raised >= amount
+        print(f"{len(player.estates):5} estates, debt {amount:7,}: solve {solve * 1e3:6.1f} ms   "
+              f"plan cost {plan.cost:7,} ({len(plan.estates)} estates)   "
+              f"cheapest per dollar {greedy_cost(game, player, amount):7,}")
+
+
+if __name__ == "__main__":
+    main()
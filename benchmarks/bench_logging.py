@@ -0,0 +1,52 @@
+"""
+Cost of Player.advance_turn and Player.trade_estates with logging at WARNING,
+where none of the domain's INFO/DEBUG records are emitted.
+
+    python -m benchmarks.bench_logging
+"""
+import logging
+from timeit import timeit
+
+from monopoly.domain.entities.game.board import create_estates
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+
+NUMBER = 20_000
+
+
+def setup() -> tuple[Player, Player]:
+    estates = create_estates()
+    player1 = Player(identity=PlayerId(1), funds=Funds(amount=100_000))
+    player2 = Player(identity=PlayerId(2), funds=Funds(amount=100_000))
+    for estate in estates[:9]:
+        player1.buy_estate(estate)
+    for estate in estates[9:]:
+        player2.buy_estate(estate)
+    for estate in estates[:3]:
+        player1.mortgage(estate)
+        estate.turns_until_buyback = 10**9
+    return player1, player2
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    player1, player2 = setup()
+    advance = timeit(player1.advance_turn, number=NUMBER) / NUMBER
+
+    give = [player1.estates[estate_id] for estate_id in list(player1.estates)[3:5]]
+    receive = [player2.estates[estate_id] for estate_id in list(player2.estates)[:2]]
+
+    def trade_back_and_forth():
+        player1.trade_estates(player2, give, receive, Funds(amount=10), Funds(amount=5))
+        player2.trade_estates(player1, give, receive, Funds(amount=10), Funds(amount=5))
+
+    trade = timeit(trade_back_and_forth, number=NUMBER) / NUMBER / 2
+
+    print(f"Player.advance_turn (9 estates): {advance * 1e6:.2f} us")
+    print(f"Player.trade_estates (2 for 2):  {trade * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Overhead of the metrics registry on the simulation turn loop.
+
+Wall or CPU time of whole games varies by several percent between identical runs on a
+shared box, which hides an overhead of that size. The cost of instrumentation is
+therefore measured per call on a tight Game.advance_turn loop (three instrumented
+operations per turn), then scaled by the operations counted per simulated turn. The
+direct comparison of whole games is printed as well, with its noise floor.
+
+    python -m benchmarks.bench_metrics
+"""
+import gc
+import logging
+from time import process_time
+from timeit import repeat
+
+from monopoly.domain.metrics import SAMPLE_EVERY, MetricsRegistry, instrumented
+from monopoly.domain.simulation.engine import SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+
+from benchmarks.suite import dealt_game
+
+GAMES = 20
+ROUNDS = 15
+SAMPLING = (1, SAMPLE_EVERY, 64)
+TURNS = 20_000
+# advance_turn, tax_update and rent_update
+OPERATIONS_PER_BARE_TURN = 3
+
+
+def bare_turn() -> float:
+    game = dealt_game(4, 18)
+
+    def take_turn(player) -> None:
+        pass
+
+    return min(repeat(lambda: game.advance_turn(take_turn), number=TURNS, repeat=5)) / TURNS
+
+
+def play(simulator: Simulator) -> tuple[float, int]:
+    gc.collect()
+    gc.disable()
+    try:
+        started = process_time()
+        report = simulator.run(range(GAMES))
+        return process_time() - started, report.total_turns
+    finally:
+        gc.enable()
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    plain_call = bare_turn()
+    per_call = {}
+    for sample_every in SAMPLING:
+        with instrumented(MetricsRegistry(), sample_every):
+            per_call[sample_every] = (bare_turn() - plain_call) / OPERATIONS_PER_BARE_TURN
+
+    simulator = Simulator(config=SimulationConfig(), policies=(GreedyPolicy(), CautiousPolicy()))
+    registry = MetricsRegistry()
+    play(simulator)
+    plain = [float("inf"), float("inf")]
+    timed = dict.fromkeys(SAMPLING, float("inf"))
+    for _ in range(ROUNDS):
+        for slot in range(2):
+            elapsed, turns = play(simulator)
+            plain[slot] = min(plain[slot], elapsed)
+        for sample_every in SAMPLING:
+            with instrumented(registry, sample_every):
+                elapsed, _ = play(simulator)
+            timed[sample_every] = min(timed[sample_every], elapsed)
+    calls = sum(
+        int(line.rsplit(" ", 1)[1]) for line in registry.snapshot().splitlines()
+        if line.startswith("monopoly_operations_total")
+    )
+    per_turn = calls / (ROUNDS * len(SAMPLING) * turns)
+    turn = min(plain) / turns
+
+    print(f"turn loop: {turn * 1e6:.2f} us/turn, {per_turn:.2f} instrumented operations/turn")
+    print(f"noise floor, two runs without metrics: {max(plain) / min(plain) - 1:+.1%}")
+    for sample_every in SAMPLING:
+        cost = per_call[sample_every]
+        print(f"1 in {sample_every:<2} timed: {cost * 1e9:6.0f} ns/operation -> "
+              f"{cost * per_turn / turn:+.1%} of a turn "
+              f"(whole games: {timed[sample_every] / min(plain) - 1:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Cost of one turn against board size: the game's mortgage expiry heap versus counting
+down every owned estate through Player.advance_turn, as turns used to.
+
+Half of the board is owned and mortgaged, with deadlines spread so that a handful of
+estates expire on every turn.
+
+    python -m benchmarks.bench_mortgage_expiry
+"""
+import logging
+from time import perf_counter
+
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+
+from benchmarks.bench_snapshot import board
+
+TURNS = 200
+
+
+def mortgaged_game(size: int) -> Game:
+    players = [Player(identity=PlayerId(seat), funds=Funds(amount=10**12)) for seat in (1, 2)]
+    game = Game(players=players, estate_registry=build_registry(create_estates(board(size))),
+                clock=VirtualClock())
+    game.start_game()
+    for player in players:
+        player.funds = Funds(amount=10**12)
+    estates = sorted(
+        (estate for members in game.estate_registry.values() for estate in members),
+        key=lambda estate: estate.identity,
+    )
+    for estate in estates:
+        player = players[estate.identity % 2]
+        player.buy_estate(estate)
+        if estate.identity % 2:
+            player.mortgage(estate)
+            # Spread the deadlines so expiries are not all bunched on one turn
+            estate.turns_until_buyback += estate.identity % (4 * TURNS)
+    return game
+
+
+def per_turn(game: Game, step) -> float:
+    started = perf_counter()
+    for _ in range(TURNS):
+        step(game)
+    return (perf_counter() - started) / TURNS
+
+
+def countdown(game: Game) -> None:
+    game.current_turn += 1
+    for player in game.players:
+        player.advance_turn()
+
+
+def heap(game: Game) -> None:
+    game.current_turn += 1
+    game.mortgage_expiry.advance(game.current_turn)
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    for size in (18, 1000, 10_000):
+        before = per_turn(mortgaged_game(size), countdown)
+        after = per_turn(mortgaged_game(size), heap)
+        full = per_turn(mortgaged_game(size), Game.advance_turn)
+        print(f"{size:6d} estates: countdown {before * 1e6:9.1f} us/turn"
+              f"   heap {after * 1e6:7.1f} us/turn"
+              f"   Game.advance_turn {full * 1e6:7.1f} us/turn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Perft-style count of legal moves: a seeded random playout visits POSITIONS positions and
+every player's full move set is generated at each, once with the bitboard generator and
+once by asking the can_* checks about every estate and estate pair. Both must agree on
+the total number of moves; the report is moves generated per second.
+
+    python -m benchmarks.bench_move_generator
+"""
+import logging
+import random
+from time import perf_counter
+
+from monopoly.domain.entities.estate import BuildableEstate
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.move_generator import MoveKind
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.entities.verdict import Verdict
+from monopoly.domain.value_objects.funds import Funds
+
+POSITIONS = 400
+PLAYERS = 4
+REPEATS = 5
+
+
+def by_checks(game: Game, estates: list, player: Player) -> int:
+    complete = game.board_index.complete_categories(player.identity)
+    moves = 0
+    for estate in estates:
+        moves += player.can_buy(estate) is Verdict.OK
+        moves += player.can_mortgage(estate) is Verdict.OK
+        moves += player.can_buyback(estate) is Verdict.OK
+        moves += (
+            estate.owner == player.identity and isinstance(estate, BuildableEstate)
+            and not estate.is_mortgaged() and estate.category in complete
+            and estate.stars < estate.max_stars
+        )
+    for partner in game.players:
+        if partner is not player:
+            for given in player.estates.values():
+                for received in partner.estates.values():
+                    moves += player.can_trade(partner, [given], [received]) is Verdict.OK
+    return moves
+
+
+def positions() -> list[Game]:
+    """
+    Snapshots along one random playout, each a separate game.
+    """
+    rng = random.Random(2024)
+    snapshots = []
+    players = [
+        Player(identity=PlayerId(seat), funds=Funds(amount=600)) for seat in range(1, PLAYERS + 1)
+    ]
+    game = Game(players=players, estate_registry=build_registry(create_estates()))
+    by_id = {
+        estate.identity: estate for members in game.estate_registry.values() for estate in members
+    }
+    while len(snapshots) < POSITIONS:
+        player = rng.choice(players)
+        legal = list(game.move_generator.legal_moves(player))
+        if not legal:
+            player.funds = player.funds.add(200)
+            continue
+        move = rng.choice(legal)
+        estate = by_id[move.estate]
+        if move.kind is MoveKind.BUY:
+            player.buy_estate(estate)
+        elif move.kind is MoveKind.MORTGAGE:
+            player.mortgage(estate)
+        elif move.kind is MoveKind.BUYBACK:
+            player.buyback(estate)
+        elif move.kind is MoveKind.BUILD:
+            estate.build_star()
+        else:
+            partner = next(other for other in players if other.identity == move.partner)
+            player.trade_estates(partner, [estate], [partner.estates[move.received]])
+        snapshots.append(copy(game))
+    return snapshots
+
+
+def copy(game: Game) -> Game:
+    estates = {
+        estate.identity: estate.clone()
+        for members in game.estate_registry.values() for estate in members
+    }
+    players = []
+    for player in game.players:
+        owned = {identity: estates[identity] for identity in player.estates}
+        players.append(Player(identity=player.identity, funds=player.funds, estates=owned))
+    return Game(players=players, estate_registry=build_registry(list(estates.values())))
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    games = positions()
+    boards = [
+        [estate for members in game.estate_registry.values() for estate in members]
+        for game in games
+    ]
+    generators = [game.move_generator for game in games]
+
+    expected = sum(by_checks(game, estates, player)
+                   for game, estates in zip(games, boards) for player in game.players)
+    assert expected == sum(
+        len(generator.legal_moves(player))
+        for game, generator in zip(games, generators) for player in game.players
+    )
+
+    started = perf_counter()
+    for _ in range(REPEATS):
+        for game, estates in zip(games, boards):
+            for player in game.players:
+                by_checks(game, estates, player)
+    before = perf_counter() - started
+
+    started = perf_counter()
+    for _ in range(REPEATS):
+        for game, generator in zip(games, generators):
+            for player in game.players:
+                len(generator.legal_moves(player))
+    after = perf_counter() - started
+
+    moves = expected * REPEATS
+    print(f"{POSITIONS} positions x {PLAYERS} players, {expected:,} legal moves per pass")
+    print(f"can_* checks {moves / before:12,.0f} moves/s")
+    print(f"bitboards    {moves / after:12,.0f} moves/s ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
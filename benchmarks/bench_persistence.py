@@ -0,0 +1,116 @@
+"""
+Turns persisted per second for 1,000 concurrent games in SQLite (WAL mode), advanced one
+turn each in rounds:
+
+- per mutation: every fund change, ownership change and state transition is written and
+  committed as it happens;
+- per turn: a UnitOfWork per game commits the rows its turn changed in one transaction;
+- per round: the units of all games commit together, one transaction per round.
+
+Games alone, not persisted, are timed as the reference.
+
+    python -m benchmarks.bench_persistence
+"""
+import logging
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+from monopoly.persistence.database import Database
+from monopoly.persistence.games import GameRepository, UnitOfWork
+
+GAMES = 1_000
+ROUNDS = 20
+
+
+class CountingRepository(GameRepository):
+    transactions = 0
+
+    def commit(self, units) -> int:
+        written = super().commit(units)
+        if written:
+            self.transactions += 1
+        return written
+
+
+class WriteThroughUnit(UnitOfWork):
+    """
+    Commits every change as it is made, as a repository without a unit of work would.
+    """
+
+    def emit(self, event) -> None:
+        super().emit(event)
+        self.commit()
+
+    def estate_changed(self, estate, previous_owner, previous_state) -> None:
+        super().estate_changed(estate, previous_owner, previous_state)
+        self.commit()
+
+
+def games() -> list[SimulatedGame]:
+    config = SimulationConfig(players=4, max_turns=10**6)
+    return [
+        SimulatedGame(seed, config, [GreedyPolicy(), CautiousPolicy()]) for seed in range(GAMES)
+    ]
+
+
+def play_round(simulated: list[SimulatedGame]) -> int:
+    turns = 0
+    for game in simulated:
+        if not game.game.is_game_over():
+            game.game.advance_turn(game.take_turn)
+            game.clock.advance(game.config.turn_duration)
+            turns += 1
+    return turns
+
+
+def run(mode: str, directory: Path) -> tuple[float, int, int]:
+    simulated = games()
+    if mode == "in memory":
+        started = perf_counter()
+        turns = sum(play_round(simulated) for _ in range(ROUNDS))
+        return perf_counter() - started, turns, 0
+
+    with Database(directory / f"{mode.replace(' ', '_')}.db") as database:
+        repository = CountingRepository(database)
+        unit_type = WriteThroughUnit if mode == "per mutation" else UnitOfWork
+        units = [
+            unit_type(repository, repository.add(game.game), game.game) for game in simulated
+        ]
+        started = perf_counter()
+        turns = 0
+        for _ in range(ROUNDS):
+            if mode == "per round":
+                turns += play_round(simulated)
+                repository.commit(units)
+                continue
+            for game, unit in zip(simulated, units):
+                if not game.game.is_game_over():
+                    game.game.advance_turn(game.take_turn)
+                    game.clock.advance(game.config.turn_duration)
+                    turns += 1
+                    unit.commit()
+        elapsed = perf_counter() - started
+        for unit in units:
+            unit.close()
+        return elapsed, turns, repository.transactions
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{GAMES} games x {ROUNDS} rounds")
+        rates = {}
+        for mode in ("in memory", "per mutation", "per turn", "per round"):
+            elapsed, turns, transactions = run(mode, Path(directory))
+            rates[mode] = turns / elapsed
+            line = f"  {mode:13} {rates[mode]:10,.0f} turns/s  {transactions:8,} transactions"
+            if "per mutation" in rates:
+                line += f"  {rates[mode] / rates['per mutation']:5.1f}x vs per mutation"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Cost of the sampling profiler on simulated games: off (nothing runs, nothing is hooked)
+against sampling every 1ms and 5ms. Each sample also shortens the interpreter's switch
+interval while the profiler runs, which is included in the measured cost.
+
+    python -m benchmarks.bench_profiling
+"""
+import logging
+from time import perf_counter
+
+from monopoly.domain.profiling import SamplingProfiler
+from monopoly.domain.simulation.engine import SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+
+GAMES = 100
+ROUNDS = 7
+INTERVALS = (0.001, 0.005)
+
+
+def play(simulator: Simulator, interval: float | None) -> tuple[float, SamplingProfiler | None]:
+    profiler = SamplingProfiler(interval=interval) if interval else None
+    started = perf_counter()
+    if profiler is None:
+        simulator.run(range(GAMES))
+    else:
+        with profiler:
+            simulator.run(range(GAMES))
+    return perf_counter() - started, profiler
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    simulator = Simulator(
+        config=SimulationConfig(players=4), policies=[GreedyPolicy(), CautiousPolicy()]
+    )
+    play(simulator, None)
+
+    best: dict[float | None, float] = {}
+    profilers: dict[float, SamplingProfiler] = {}
+    for _ in range(ROUNDS):
+        for interval in (None, *INTERVALS):
+            elapsed, profiler = play(simulator, interval)
+            best[interval] = min(best.get(interval, elapsed), elapsed)
+            if profiler is not None:
+                profilers[interval] = profiler
+
+    print(f"{GAMES} games, best of {ROUNDS}")
+    print(f"  off          {best[None] * 1000:8.1f} ms")
+    for interval in INTERVALS:
+        overhead = best[interval] / best[None] - 1
+        samples = profilers[interval].samples
+        print(f"  every {interval * 1000:g}ms  {best[interval] * 1000:8.1f} ms  "
+              f"{overhead:+6.1%}  {samples} samples")
+    print()
+    print(profilers[INTERVALS[0]].breakdown())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Applying the tax rate and the rent reduction to a million amounts with Decimal rates
+versus basis-point Rates.
+
+    python -m benchmarks.bench_rate
+"""
+from decimal import Decimal
+from time import perf_counter
+
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+AMOUNTS = 1_000_000
+TAX = "0.30"
+REDUCTION = "0.40"
+
+
+def timed(function, amounts: list[int]) -> float:
+    started = perf_counter()
+    function(amounts)
+    return perf_counter() - started
+
+
+def decimal_rates(amounts: list[int]) -> int:
+    tax, keep = Decimal(TAX), 1 - Decimal(REDUCTION)
+    total = 0
+    for amount in amounts:
+        rent = int(amount * keep)
+        total += Funds.of(rent).apply_rate(tax).amount
+    return total
+
+
+def basis_points(amounts: list[int]) -> int:
+    tax, keep = Rate.from_decimal(TAX), Rate.from_decimal(REDUCTION).complement()
+    total = 0
+    for amount in amounts:
+        rent = keep.apply(amount)
+        total += Funds.of(rent).apply_rate(tax).amount
+    return total
+
+
+def main():
+    amounts = [(index * 7919) % 50_000 for index in range(AMOUNTS)]
+    assert decimal_rates(amounts) == basis_points(amounts)
+    before = timed(decimal_rates, amounts)
+    after = timed(basis_points, amounts)
+    print(f"rent reduction + tax on {AMOUNTS:,} amounts: Decimal {before * 1e3:7.1f} ms   "
+          f"basis points {after * 1e3:7.1f} ms ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Cost of one rent reduction step and of a rent lookup against board size: the shared,
+epoch-versioned rent level versus rewriting the reduction on every estate as before.
+
+    python -m benchmarks.bench_rent_reduction
+"""
+import logging
+from decimal import Decimal
+from time import perf_counter
+
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import VirtualClock
+
+from benchmarks.bench_snapshot import board
+
+LOOKUPS = 200_000
+
+
+def board_game(size: int) -> Game:
+    return Game(players=[], estate_registry=build_registry(create_estates(board(size))),
+                clock=VirtualClock())
+
+
+def per_estate_step(size: int) -> float:
+    # Standalone estates each carry their own level, like every estate used to
+    estates = create_estates(board(size))
+    started = perf_counter()
+    for estate in estates:
+        estate.reduce_rent(percentage=Decimal("10"))
+    return perf_counter() - started
+
+
+def shared_step(game: Game) -> float:
+    # Five steps take the reduction from 0 to its 50% maximum
+    manager = game.rent_manager
+    started = perf_counter()
+    for _ in range(5):
+        manager.reduce_rent(manager.next_rent_reduction_turn)
+    return (perf_counter() - started) / 5
+
+
+def lookups(estates: list) -> tuple[float, float]:
+    picks = [estates[index * 7919 % len(estates)] for index in range(LOOKUPS)]
+    started = perf_counter()
+    for estate in picks:
+        estate.rent_reduction.complement().apply(estate.rent)
+    uncached = (perf_counter() - started) / LOOKUPS
+    started = perf_counter()
+    for estate in picks:
+        estate.current_rent()
+    return uncached, (perf_counter() - started) / LOOKUPS
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    for size in (18, 1000, 100_000):
+        game = board_game(size)
+        estates = [estate for members in game.estate_registry.values() for estate in members]
+        before = per_estate_step(size)
+        after = shared_step(game)
+        uncached, cached = lookups(estates)
+        print(f"{size:7d} estates: reduction step per estate {before * 1e6:10.1f} us   "
+              f"shared {after * 1e6:5.1f} us   rent lookup {uncached * 1e9:5.0f} ns "
+              f"uncached / {cached * 1e9:4.0f} ns cached")
+
+
+if __name__ == "__main__":
+    main()
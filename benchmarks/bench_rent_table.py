@@ -0,0 +1,69 @@
+"""
+Rent owed on landing and the owner's share after tax: the shared rent table versus
+computing both per call from Decimal rates and Funds.
+
+    python -m benchmarks.bench_rent_table
+"""
+import logging
+from time import perf_counter
+
+from monopoly.domain.entities.estate import BuildableEstate
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.rent_table import base_rent
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+LOOKUPS = 500_000
+
+
+def owned_game() -> Game:
+    players = [Player(identity=PlayerId(seat), funds=Funds(amount=10**9)) for seat in (1, 2)]
+    game = Game(players=players, estate_registry=build_registry(create_estates()))
+    for estates in game.estate_registry.values():
+        for position, estate in enumerate(sorted(estates, key=lambda estate: estate.identity)):
+            players[position % 2 if len(estates) > 2 else 0].buy_estate(estate)
+            if isinstance(estate, BuildableEstate):
+                estate.stars = estate.identity % 4
+    game.rent_manager.reduce_rent(game.rent_manager.next_rent_reduction_turn)
+    game.tax_manager.current_tax_rate = Rate(2000)
+    return game
+
+
+def computed(game: Game, estate) -> int:
+    stars = estate.stars if isinstance(estate, BuildableEstate) else 0
+    complete = game.board_index.owns_category(estate.owner, estate.category)
+    reduced = 1 - estate.rent_reduction.to_decimal()
+    owed = Funds.of(int(base_rent(estate.rent, stars, complete) * reduced))
+    return owed.subtract(owed.apply_rate(game.tax_manager.current_tax_rate.to_decimal())).amount
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    game = owned_game()
+    estates = [estate for members in game.estate_registry.values() for estate in members]
+    picks = [estates[index * 7 % len(estates)] for index in range(LOOKUPS)]
+    engine = game.rent_engine
+    assert [computed(game, estate) for estate in estates] == [
+        engine.owner_share(estate) for estate in estates
+    ]
+
+    started = perf_counter()
+    for estate in picks:
+        computed(game, estate)
+    before = (perf_counter() - started) / LOOKUPS
+
+    share = engine.owner_share
+    started = perf_counter()
+    for estate in picks:
+        share(estate)
+    after = (perf_counter() - started) / LOOKUPS
+
+    print(f"owner share of rent on landing: computed {before * 1e9:6.0f} ns"
+          f"   table {after * 1e9:5.0f} ns")
+    print(f"rent table: {len(engine.table)} entries shared by every game on the board")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Memory of 10,000 resident games on the default board, mid-game: full Game objects versus
+ResidentGame (shared BoardCatalog plus a per-game EstateTable, seats and manager record),
+measured with tracemalloc. Also times parking and resuming one game.
+
+    python -m benchmarks.bench_resident
+"""
+import gc
+import logging
+import random
+import tracemalloc
+from time import perf_counter
+
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.catalog import BoardCatalog
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.resident import ResidentGame
+from monopoly.domain.value_objects.funds import Funds
+
+GAMES = 10_000
+
+
+def mid_game(seed: int) -> Game:
+    rng = random.Random(seed)
+    players = [Player(identity=PlayerId(seat), funds=Funds(amount=5000)) for seat in (1, 2, 3)]
+    game = Game(players=players, estate_registry=build_registry(create_estates()))
+    for estates in game.estate_registry.values():
+        for estate in estates:
+            if rng.random() < 0.6:
+                owner = rng.choice(players)
+                owner.buy_estate(estate)
+                if rng.random() < 0.2:
+                    owner.mortgage(estate)
+    game.current_turn = rng.randrange(1, 200)
+    return game
+
+
+def bytes_per_game(build) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(seed) for seed in range(GAMES)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(kept) == GAMES
+    return (after - before) / GAMES
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    catalog = BoardCatalog.default()
+    full = bytes_per_game(mid_game)
+    # Games are parked as they are created, so only the resident form stays alive
+    resident = bytes_per_game(lambda seed: ResidentGame.park(mid_game(seed), catalog))
+    print(f"{GAMES:,} resident games: Game {full:8,.0f} B/game   "
+          f"ResidentGame {resident:6,.0f} B/game ({resident / full:.1%})")
+
+    game = mid_game(0)
+    started = perf_counter()
+    for _ in range(1000):
+        parked = ResidentGame.park(game, catalog)
+    park = (perf_counter() - started) / 1000
+    started = perf_counter()
+    for _ in range(1000):
+        parked.resume(clock=game.clock)
+    resume = (perf_counter() - started) / 1000
+    print(f"park {park * 1e6:6.1f} us   resume {resume * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Load test of the asyncio game host: 1,000 tables, each driven by in-process clients
+that buy estates and end turns as fast as the host answers.
+
+    python -m benchmarks.bench_server
+"""
+import asyncio
+import logging
+from time import perf_counter
+
+from monopoly.domain.exceptions.base import DomainError
+from monopoly.server.client import LocalClient
+from monopoly.server.host import GameHost
+
+TABLES = 1000
+SEATS = 2
+COMMANDS_PER_TABLE = 200
+
+
+async def drive(host: GameHost, latencies: list[float]) -> int:
+    table = host.open_table(players=SEATS)
+    clients = [LocalClient(host, table.table_id, seat + 1) for seat in range(SEATS)]
+    estates = sorted(table._estates.values(), key=lambda estate: estate.identity)
+    rejected = 0
+
+    for step in range(COMMANDS_PER_TABLE):
+        seat = table.seat
+        client = clients[seat]
+        # Every command changes the version, so the seat to move always knows it
+        client.version = table.version
+        player = table.game.players[seat]
+        estate = next(
+            (estate for estate in estates
+             if estate.owner is None and estate.price <= player.funds.amount),
+            None,
+        )
+        started = perf_counter()
+        try:
+            if estate is not None and step % 3:
+                await client.buy(estate.identity)
+            else:
+                await client.end_turn()
+        except DomainError:
+            rejected += 1
+        latencies.append(perf_counter() - started)
+    return rejected
+
+
+async def main_async() -> None:
+    latencies: list[float] = []
+    async with GameHost() as host:
+        started = perf_counter()
+        rejected = await asyncio.gather(*(drive(host, latencies) for _ in range(TABLES)))
+        elapsed = perf_counter() - started
+
+    latencies.sort()
+    count = len(latencies)
+    print(f"{TABLES} tables, {count} commands in {elapsed:.2f}s: "
+          f"{count / elapsed:,.0f} commands/s")
+    print(f"latency p50 {latencies[count // 2] * 1e3:.2f} ms, "
+          f"p99 {latencies[int(count * 0.99)] * 1e3:.2f} ms, "
+          f"max {latencies[-1] * 1e3:.2f} ms; {sum(rejected)} rejected")
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Snapshot size and speed of monopoly.domain.snapshot against pickle and copy.deepcopy.
+
+    python -m benchmarks.bench_snapshot
+"""
+import copy
+import pickle
+from time import perf_counter
+
+from monopoly.domain.entities.estate import EstateCategory
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig
+from monopoly.domain.simulation.policies import GreedyPolicy
+from monopoly.domain.snapshot import dump, fork, restore
+
+CATEGORIES = tuple(EstateCategory)
+
+
+def board(size: int) -> tuple:
+    return tuple(
+        (identity, f"Estate {identity}", 100 + identity % 200, 50, 55, 10 + identity % 20,
+         CATEGORIES[identity % len(CATEGORIES)])
+        for identity in range(1, size + 1)
+    )
+
+
+def game_at_turn(estates: int, turns: int = 60):
+    config = SimulationConfig(max_turns=turns, board=board(estates))
+    simulated = SimulatedGame(seed=1, config=config, policies=[GreedyPolicy()])
+    simulated.run()
+    return simulated.game
+
+
+def timed(function, repeat: int) -> float:
+    started = perf_counter()
+    for _ in range(repeat):
+        function()
+    return (perf_counter() - started) / repeat
+
+
+def main():
+    for estates, repeat in ((18, 2000), (1000, 50)):
+        game = game_at_turn(estates)
+        data = dump(game)
+        pickled = pickle.dumps(game, pickle.HIGHEST_PROTOCOL)
+        assert dump(restore(data)) == data and dump(fork(game)) == data
+
+        print(f"{estates} estates")
+        print(f"  size     snapshot {len(data):8d} B   pickle {len(pickled):8d} B")
+        rows = [
+            ("dump", lambda: dump(game), lambda: pickle.dumps(game, pickle.HIGHEST_PROTOCOL)),
+            ("restore", lambda: restore(data), lambda: pickle.loads(pickled)),
+            ("copy", lambda: fork(game), lambda: copy.deepcopy(game)),
+        ]
+        for name, ours, theirs in rows:
+            other = "deepcopy" if name == "copy" else "pickle"
+            print(f"  {name:8} {timed(ours, repeat) * 1e6:9.1f} us  vs "
+                  f"{other:8} {timed(theirs, repeat) * 1e6:9.1f} us")
+        print(f"  restore  vs deepcopy {timed(lambda: copy.deepcopy(game), repeat) * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
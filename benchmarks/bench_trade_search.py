@@ -0,0 +1,78 @@
+"""
+Finding the ten cheapest legal trades that get a player the two estates they want, for
+players holding 5, 20 and 60 estates: ranking every subset of the estates they could
+give versus the subset-sum search in ``find_trades``.
+
+    python -m benchmarks.bench_trade_search
+"""
+import logging
+import random
+from itertools import combinations
+from time import perf_counter
+
+from monopoly.domain.entities.estate import EstateCategory, EstateId, UnbuildableEstate
+from monopoly.domain.entities.game.trade_search import find_trades
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+
+HOLDINGS = (5, 20, 60)
+# Ranking every subset is only attempted up to this many estates
+BRUTE_FORCE_LIMIT = 20
+LIMIT = 10
+
+
+def players(holding: int) -> tuple[Player, Player, list[UnbuildableEstate]]:
+    rng = random.Random(holding)
+    player = Player(identity=PlayerId(1), funds=Funds(amount=10**6))
+    partner = Player(identity=PlayerId(2), funds=Funds(amount=10**6))
+    for identity in range(holding + 2):
+        estate = UnbuildableEstate(
+            identity=EstateId(identity), name=f"Estate {identity}",
+            price=rng.randrange(60, 400, 5),
+            mortgage_price=30, buyback_price=33, category=EstateCategory.AIRLINES,
+        )
+        (player if identity < holding else partner).buy_estate(estate)
+    player.funds = Funds(amount=50)
+    partner.funds = Funds(amount=50)
+    return player, partner, list(partner.estates.values())
+
+
+def ranked_subsets(player: Player, partner: Player, wanted: list) -> list[tuple[int, int]]:
+    value = sum(estate.price for estate in wanted)
+    half = (value + 1) // 2
+    own = list(player.estates.values())
+    keys = []
+    for size in range(len(own) + 1):
+        for give in combinations(own, size):
+            total = sum(estate.price for estate in give)
+            funds_to_give = max(0, half - total)
+            funds_to_receive = max(0, (total + 1) // 2 - value)
+            if funds_to_give <= player.funds.amount and funds_to_receive <= partner.funds.amount:
+                keys.append((total + funds_to_give - funds_to_receive, funds_to_give))
+    keys.sort()
+    return keys[:LIMIT]
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    for holding in HOLDINGS:
+        player, partner, wanted = players(holding)
+
+        started = perf_counter()
+        offers = find_trades(player, partner, wanted, limit=LIMIT, budget=1.0)
+        searched = perf_counter() - started
+
+        if holding <= BRUTE_FORCE_LIMIT:
+            started = perf_counter()
+            keys = ranked_subsets(player, partner, wanted)
+            brute = perf_counter() - started
+            assert keys == [(offer.net_value, offer.funds_to_give) for offer in offers]
+            brute_force = f"{brute * 1e3:9.1f} ms"
+        else:
+            brute_force = f"{'2^' + str(holding) + ' subsets':>12}"
+        print(f"{holding:3} estates: all subsets {brute_force}   search {searched * 1e3:7.2f} ms "
+              f"({len(offers)} offers, best net value {offers[0].net_value})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Benchmark suite over the domain hot paths at several player counts and board sizes, with
+machine-readable baselines and a regression gate. Standard library only, runs offline.
+
+    python -m benchmarks.suite                                   # run and print
+    python -m benchmarks.suite --save benchmarks/baseline.json   # record a baseline
+    python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 0.2
+
+``--compare`` exits with status 1 when any case is slower than its baseline by more than
+the threshold (a fraction: 0.2 allows 20%). Each case reports the best of ``--repeat``
+runs in nanoseconds per operation. ``--quick`` skips boards above 1,000 estates, and
+``--filter`` runs only the cases whose name contains the given text. Baselines are only
+comparable on the machine and Python they were recorded with.
+"""
+import argparse
+import json
+import logging
+import platform
+import random
+import sys
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterator
+
+from monopoly.domain.entities.estate import (
+    BUILDABLE_CATEGORIES,
+    Estate,
+    EstateCategory,
+    EstateId,
+    UnbuildableEstate,
+)
+from monopoly.domain.entities.game.board import build_registry
+from monopoly.domain.entities.game.catalog import MAX_STARS, BoardCatalog, EstateSpec
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+
+FORMAT = 1
+PLAYERS = (2, 4, 8)
+ESTATES = (18, 1_000, 100_000)
+QUICK_MAX_ESTATES = 1_000
+RICH = Funds.of(10**12)
+
+# Seconds timed and operations done in one run of a case
+Sample = tuple[float, int]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    run: Callable[..., Sample]
+    # Keyword arguments of ``run`` for each size the case is measured at
+    sizes: tuple[dict[str, int], ...] = ({},)
+
+    def variants(self, quick: bool) -> Iterator[tuple[str, dict[str, int]]]:
+        for size in self.sizes:
+            if quick and size.get("estates", 0) > QUICK_MAX_ESTATES:
+                continue
+            label = ",".join(f"{key}={value}" for key, value in size.items())
+            yield (f"{self.name}[{label}]" if label else self.name), size
+
+
+def board(estates: int) -> BoardCatalog:
+    """
+    Synthetic board of ``estates`` estates over every category, the same for a given size.
+    """
+    rng = random.Random(estates)
+    categories = list(EstateCategory)
+    specs = []
+    for identity in range(1, estates + 1):
+        category = categories[identity % len(categories)]
+        price = rng.randrange(50, 500)
+        specs.append(EstateSpec(
+            identity=EstateId(identity), name=f"Estate {identity}", price=price,
+            mortgage_price=price // 2, buyback_price=price // 2 * 11 // 10, rent=price // 10,
+            category=category, buildable=category in BUILDABLE_CATEGORIES,
+            max_stars=MAX_STARS if category in BUILDABLE_CATEGORIES else 0,
+        ))
+    return BoardCatalog(specs)
+
+
+def seated(players: int) -> list[Player]:
+    return [Player(identity=PlayerId(seat), funds=RICH) for seat in range(1, players + 1)]
+
+
+def dealt_game(players: int, estates: int) -> Game:
+    """
+    Game on a synthetic board with every estate dealt round the table, a fifth of them
+    mortgaged, on a clock that never runs out.
+    """
+    seats = seated(players)
+    cells = board(estates).create_estates()
+    game = Game(players=list(seats), estate_registry=build_registry(cells), clock=VirtualClock())
+    for index, estate in enumerate(cells):
+        owner = seats[index % players]
+        owner.buy_estate(estate)
+        if index % 5 == 0:
+            owner.mortgage(estate)
+    game.start_game()
+    for player in seats:
+        player.funds = RICH
+    return game
+
+
+def bench_funds(operations: int = 200_000) -> Sample:
+    funds = Funds.of(1000)
+    amounts = [Funds.of(value % 500) for value in range(operations)]
+    started = perf_counter()
+    for amount in amounts:
+        funds = funds.add(amount).subtract(amount)
+    return perf_counter() - started, 2 * operations
+
+
+def bench_estate_state(rounds: int = 50_000) -> Sample:
+    estate = UnbuildableEstate(
+        identity=EstateId(1), name="Fragrance Hub", price=100, mortgage_price=50,
+        buyback_price=55, rent=10, category=EstateCategory.PERFUMERY,
+    )
+    player_id = PlayerId(1)
+    started = perf_counter()
+    for _ in range(rounds):
+        estate.buy(player_id)
+        estate.mortgage(player_id)
+        estate.buyback(player_id)
+        estate.release()
+    return perf_counter() - started, 4 * rounds
+
+
+def bench_buy_estate(estates: int) -> Sample:
+    (player,) = seated(1)
+    cells = board(estates).create_estates()
+    started = perf_counter()
+    for estate in cells:
+        player.buy_estate(estate)
+    return perf_counter() - started, estates
+
+
+def bench_trade_estates(players: int, estates: int, trades: int = 2_000) -> Sample:
+    game = dealt_game(players, estates)
+    seats = {player.identity: player for player in game.players}
+    following = {
+        player.identity: game.players[(seat + 1) % players]
+        for seat, player in enumerate(game.players)
+    }
+    # Each estate is sold to the next seat for its price, so the 2x rule always holds
+    cells: list[Estate] = [
+        estate for estates in game.estate_registry.values() for estate in estates
+    ]
+    sales = [(estate, Funds.of(estate.price)) for estate in cells[:trades]]
+    sales = (sales * (trades // len(sales) + 1))[:trades]
+    started = perf_counter()
+    for estate, price in sales:
+        seller = seats[estate.owner]
+        seller.trade_estates(following[seller.identity], [estate], [], funds_to_receive=price)
+    return perf_counter() - started, trades
+
+
+def bench_player_advance_turn(estates: int) -> Sample:
+    game = dealt_game(1, estates)
+    (player,) = game.players
+    turns = max(5, 200_000 // estates)
+    started = perf_counter()
+    for _ in range(turns):
+        player.advance_turn()
+    return perf_counter() - started, turns
+
+
+def bench_reduce_rent(estates: int, turns: int = 20_000) -> Sample:
+    game = dealt_game(2, estates)
+    rent = game.rent_manager
+    rent.rent_reduction_interval_turns = 1
+    rent.max_rent_reduction = rent.rent_reduction_step
+    started = perf_counter()
+    for turn in range(1, turns + 1):
+        rent.reduce_rent(turn)
+        # Back to no reduction, so every call takes the reducing branch
+        rent.reset()
+    return perf_counter() - started, turns
+
+
+def bench_game_advance_turn(players: int, estates: int, turns: int = 2_000) -> Sample:
+    game = dealt_game(players, estates)
+
+    def take_turn(player: Player) -> None:
+        pass
+
+    started = perf_counter()
+    for _ in range(turns):
+        game.advance_turn(take_turn)
+    return perf_counter() - started, turns
+
+
+BOARDS = tuple({"estates": estates} for estates in ESTATES)
+TABLES = tuple(
+    {"players": players, "estates": estates} for players, estates in product(PLAYERS, ESTATES)
+)
+CASES = (
+    Case("funds.add_subtract", bench_funds),
+    Case("estate.transitions", bench_estate_state),
+    Case("player.buy_estate", bench_buy_estate, BOARDS),
+    Case("player.trade_estates", bench_trade_estates, TABLES),
+    Case("player.advance_turn", bench_player_advance_turn, BOARDS),
+    Case("rent_manager.reduce_rent", bench_reduce_rent, BOARDS),
+    Case("game.advance_turn", bench_game_advance_turn, TABLES),
+)
+
+
+def run(cases=CASES, *, repeat: int = 3, quick: bool = False, only: str = "") -> dict[str, float]:
+    """
+    Nanoseconds per operation of every case variant, best of ``repeat`` runs.
+    """
+    results: dict[str, float] = {}
+    for case in cases:
+        for name, size in case.variants(quick):
+            if only not in name:
+                continue
+            best = min(elapsed / operations for elapsed, operations in (
+                case.run(**size) for _ in range(repeat)
+            ))
+            results[name] = best * 1e9
+            print(f"{name:58} {results[name]:12,.1f} ns/op", flush=True)
+    return results
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: float | None
+    current: float
+
+    @property
+    def ratio(self) -> float | None:
+        return self.current / self.baseline if self.baseline else None
+
+    def regressed(self, threshold: float) -> bool:
+        ratio = self.ratio
+        return ratio is not None and ratio > 1 + threshold
+
+
+def compare(baseline: dict[str, float], current: dict[str, float]) -> list[Comparison]:
+    return [Comparison(name, baseline.get(name), value) for name, value in current.items()]
+
+
+def machine() -> dict[str, str]:
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+def save(path: Path, results: dict[str, float]) -> None:
+    document = {"format": FORMAT, "machine": machine(), "results": results}
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load(path: Path) -> tuple[dict[str, str], dict[str, float]]:
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("format") != FORMAT:
+        raise ValueError(f"{path} is not a baseline of format {FORMAT}")
+    return document["machine"], document["results"]
+
+
+def gate(baseline_path: Path, results: dict[str, float], threshold: float) -> int:
+    recorded_on, baseline = load(baseline_path)
+    if recorded_on != machine():
+        print(f"warning: {baseline_path} was recorded on another machine or Python: "
+              f"{recorded_on}", file=sys.stderr)
+
+    failures = 0
+    for comparison in compare(baseline, results):
+        if comparison.ratio is None:
+            verdict = "new"
+        elif comparison.regressed(threshold):
+            verdict = "REGRESSED"
+            failures += 1
+        else:
+            verdict = "ok"
+        change = f"{comparison.ratio - 1:+8.1%}" if comparison.ratio is not None else " " * 8
+        print(f"{comparison.name:58} {change}  {verdict}")
+    print(f"{failures} regression(s) over {threshold:.0%}")
+    return 1 if failures else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--save", type=Path, help="write the results as a baseline")
+    parser.add_argument("--compare", type=Path, help="fail on regressions against a baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown as a fraction (default 0.2)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best is kept")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"skip boards above {QUICK_MAX_ESTATES:,} estates")
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    options = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+    results = run(repeat=options.repeat, quick=options.quick, only=options.filter)
+    if options.save:
+        save(options.save, results)
+    if options.compare:
+        return gate(options.compare, results, options.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
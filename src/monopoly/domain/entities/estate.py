@@ -1,13 +1,60 @@
+import logging
 from dataclasses import dataclass, field
+from decimal import Decimal
 from enum import Enum
-from typing import NewType
+from typing import NewType, Protocol
 
-from monopoly.domain.entities.estate_state import EstateState, NotOwnedState
+from monopoly.domain.entities.estate_state import MORTGAGED, NOT_OWNED, EstateState
 from monopoly.domain.entities.player import PlayerId
+from monopoly.domain.entities.verdict import Verdict
+from monopoly.domain.events import EstateReleased, EventSink
+from monopoly.domain.exceptions.estate_exc import SharedRentLevelException
+from monopoly.domain.value_objects.rate import BASIS_POINTS, FULL, ZERO, Rate
+
+log = logging.getLogger(__name__)
 
 EstateId = NewType("EstateId", int)
 
-    
+_new = object.__new__
+
+
+class TurnClock:
+    """
+    Turn counter shared by the estates of one game. Buyback deadlines are stored as
+    absolute turns against it, so advancing a turn does not touch any estate.
+    """
+
+    __slots__ = ("turn",)
+
+    def __init__(self, turn: int = 0):
+        self.turn = turn
+
+
+# Estates outside a game count against a clock that never moves
+STANDALONE_TURNS = TurnClock()
+
+
+class RentLevel:
+    """
+    Rent reduction shared by the estates of one game. Every change bumps ``epoch``, which
+    invalidates the rent cached on each estate without visiting any of them. A ``shared``
+    level belongs to a game's RentManager, which alone may change it.
+    """
+
+    __slots__ = ("reduction", "keep", "epoch", "shared")
+
+    def __init__(self, reduction: Rate = ZERO, shared: bool = False):
+        self.epoch = 0
+        self.shared = shared
+        self.set(reduction)
+
+    def set(self, reduction: Rate) -> None:
+        self.reduction = reduction
+        # Basis points of the base rent still charged
+        self.keep = BASIS_POINTS - reduction.basis_points
+        self.epoch += 1
+
+
 class EstateCategory(str, Enum):
     PERFUMERY = "Perfumery"
     ELECTRONICS = "Electronics"
@@ -32,7 +79,13 @@ BUILDABLE_CATEGORIES = {
 }
 
 
-@dataclass(kw_only=True, slots=True)
+class EstateObserver(Protocol):
+    def estate_changed(
+        self, estate: "Estate", previous_owner: PlayerId | None, previous_state: EstateState
+    ) -> None: ...
+
+
+@dataclass(kw_only=True, slots=True, eq=False)
 class Estate:
     identity: EstateId
     name: str
@@ -40,11 +93,66 @@ class Estate:
     mortgage_price: int
     buyback_price: int
     category: EstateCategory
-    _state: "EstateState" = field(default_factory=lambda: NotOwnedState())
+    rent: int = 0
+    _state: "EstateState" = NOT_OWNED
     owner: PlayerId | None = None
+    buyback_deadline: int = 0
+    _turns: TurnClock = field(default=STANDALONE_TURNS, repr=False)
+    _observers: tuple[EstateObserver, ...] = field(default=(), repr=False)
+    _events: EventSink | None = field(default=None, repr=False)
+    _rent_level: RentLevel = field(default_factory=RentLevel, init=False, repr=False)
+    _rent_epoch: int = field(default=-1, init=False, repr=False)
+    _rent_cache: int = field(default=0, init=False, repr=False)
+
+    @property
+    def rent_reduction(self) -> Rate:
+        return self._rent_level.reduction
+
+    @rent_reduction.setter
+    def rent_reduction(self, reduction: Rate) -> None:
+        if self._rent_level.shared:
+            raise SharedRentLevelException(self.name)
+        self._rent_level.set(reduction)
+
+    def share_rent_level(self, level: RentLevel) -> None:
+        """
+        Follow ``level`` instead of this estate's own reduction, as estates in a game do.
+        """
+        self._rent_level = level
+        self._rent_epoch = -1
+
+    @property
+    def turns_until_buyback(self) -> int:
+        return max(0, self.buyback_deadline - self._turns.turn)
+
+    @turns_until_buyback.setter
+    def turns_until_buyback(self, turns: int) -> None:
+        self.buyback_deadline = self._turns.turn + turns
+        if self._state is MORTGAGED:
+            # A running countdown moved: schedulers such as MortgageExpiry follow it
+            for observer in self._observers:
+                observer.estate_changed(self, self.owner, MORTGAGED)
 
     def _set_state(self, new_state: EstateState) -> None:
+        previous_state = self._state
         self._state = new_state
+        for observer in self._observers:
+            observer.estate_changed(self, self.owner, previous_state)
+
+    def attach(self, observer: EstateObserver) -> None:
+        self._observers = (*self._observers, observer)
+
+    def detach(self, observer: EstateObserver) -> None:
+        self._observers = tuple(other for other in self._observers if other is not observer)
+
+    def can_buy(self, player_id: PlayerId) -> Verdict:
+        return self._state.check_buy(self, player_id)
+
+    def can_mortgage(self, player_id: PlayerId) -> Verdict:
+        return self._state.check_mortgage(self, player_id)
+
+    def can_buyback(self, player_id: PlayerId) -> Verdict:
+        return self._state.check_buyback(self, player_id)
 
     def buy(self, player_id: PlayerId) -> None:
         self._state.buy(self, player_id)
@@ -59,20 +167,91 @@ class Estate:
         self._state.advance_turn(self)
 
     def set_owner(self, player_id: PlayerId | None) -> None:
+        previous_owner = self.owner
         self.owner = player_id
+        for observer in self._observers:
+            observer.estate_changed(self, previous_owner, self._state)
 
+    def reset(self) -> None:
+        """
+        Back to unowned with no buyback pending, without notifying observers: the caller
+        resets whatever indexes the estate.
+        """
+        self._state = NOT_OWNED
+        self.owner = None
+        self.buyback_deadline = 0
 
-@dataclass(kw_only=True, slots=True)
+    def release(self) -> None:
+        if self._events is not None:
+            self._events.emit(EstateReleased(self.identity))
+        self.turns_until_buyback = 0
+        self._set_state(NOT_OWNED)
+        self.set_owner(None)
+
+    def clone(self) -> "Estate":
+        """
+        Copy of this estate with no observers and no event sink attached.
+        """
+        clone = _new(type(self))
+        clone.identity = self.identity
+        clone.name = self.name
+        clone.price = self.price
+        clone.mortgage_price = self.mortgage_price
+        clone.buyback_price = self.buyback_price
+        clone.category = self.category
+        clone.rent = self.rent
+        clone._rent_level = RentLevel(self._rent_level.reduction)
+        clone._rent_epoch = -1
+        clone._rent_cache = 0
+        clone._state = self._state
+        clone.owner = self.owner
+        clone.buyback_deadline = self.buyback_deadline
+        clone._turns = self._turns
+        clone._observers = ()
+        clone._events = None
+        return clone
+
+    def is_mortgaged(self) -> bool:
+        return self._state is MORTGAGED
+
+    def reduce_rent(self, percentage: int | Decimal) -> None:
+        """
+        Reduce the rent of a standalone estate. Inside a game the level is shared and only
+        RentManager reduces it, within its maximum and schedule.
+        """
+        self.rent_reduction = min(self.rent_reduction + Rate.from_percent(percentage), FULL)
+
+    def current_rent(self) -> int:
+        level = self._rent_level
+        if self._rent_epoch != level.epoch:
+            self._rent_cache = self.rent * level.keep // BASIS_POINTS
+            self._rent_epoch = level.epoch
+        return self._rent_cache
+
+
+@dataclass(kw_only=True, slots=True, eq=False)
 class BuildableEstate(Estate):
     stars: int = 0
     max_stars: int = 5
 
+    def clone(self) -> "BuildableEstate":
+        clone = Estate.clone(self)
+        clone.stars = self.stars
+        clone.max_stars = self.max_stars
+        return clone
+
+    def reset(self) -> None:
+        Estate.reset(self)
+        self.stars = 0
+
     def build_star(self) -> None:
         if self.stars < self.max_stars:
             self.stars += 1
-            print(f"Star built on {self.name}. Current stars: {self.stars}")
+            for observer in self._observers:
+                observer.estate_changed(self, self.owner, self._state)
+            log.info("Star built on %s. Current stars: %s", self.name, self.stars)
 
 
-@dataclass(kw_only=True, slots=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class UnbuildableEstate(Estate):
     pass
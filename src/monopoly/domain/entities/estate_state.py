@@ -1,11 +1,12 @@
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from .player import PlayerId
+from .verdict import Verdict
 from ..constants import TURNS_UNTIL_SALE
+from ..events import BuybackCountdown
+from ..exceptions.base import DomainError
 from ..exceptions.estate_exc import (
     EstateAlreadyOwnedException,
     EstateMortgagedException,
@@ -16,6 +17,7 @@ log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .estate import Estate
+    from .player import PlayerId
 
 class Action(str, Enum):
     BUY = "buy"
@@ -23,100 +25,160 @@ class Action(str, Enum):
     BUYBACK = "buyback"
 
 class EstateState(ABC):
+    """
+    Stateless behaviour of an estate in one phase of its life cycle.
+
+    Every state has a single shared instance (NOT_OWNED, OWNED, MORTGAGED); per-estate
+    data such as the buyback deadline lives on the Estate itself.
+
+    The rules live in the ``check_*`` methods, which return a Verdict without raising or
+    logging. ``buy``, ``mortgage`` and ``buyback`` refuse with the matching DomainError
+    when the check fails and otherwise perform the transition, which only the states
+    allowing it define.
+    """
+
+    __slots__ = ()
+
     @abstractmethod
-    def buy(self, estate: "Estate", player_id: PlayerId) -> None:
+    def check_buy(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
         pass
 
     @abstractmethod
-    def mortgage(self, estate: "Estate", player_id: PlayerId) -> None:
+    def check_mortgage(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
         pass
 
     @abstractmethod
-    def buyback(self, estate: "Estate", player_id: PlayerId) -> None:
+    def check_buyback(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
         pass
 
-    def advance_turn(self, estate: "Estate") -> None:
-        log.info(f"Nothing happens.")
+    def buy(self, estate: "Estate", player_id: "PlayerId") -> None:
+        verdict = self.check_buy(estate, player_id)
+        if verdict:
+            raise refusal(verdict, estate, Action.BUY)
+        self._buy(estate, player_id)
+
+    def mortgage(self, estate: "Estate", player_id: "PlayerId") -> None:
+        verdict = self.check_mortgage(estate, player_id)
+        if verdict:
+            raise refusal(verdict, estate, Action.MORTGAGE)
+        self._mortgage(estate, player_id)
+
+    def buyback(self, estate: "Estate", player_id: "PlayerId") -> None:
+        verdict = self.check_buyback(estate, player_id)
+        if verdict:
+            raise refusal(verdict, estate, Action.BUYBACK)
+        self._buyback(estate, player_id)
+
+    # The transitions _buy, _mortgage and _buyback are only defined on the states whose
+    # matching check can pass, and are only reached once it has
 
+    def advance_turn(self, estate: "Estate") -> None:
+        log.info("Nothing happens.")
 
 
-@dataclass
 class NotOwnedState(EstateState):
     """
     State when the estate is not owned by any player.
     """
 
-    def buy(self, estate: "Estate", player_id: PlayerId) -> None:
-        estate.set_owner(player_id=player_id)
-        estate._set_state(OwnedState())
-        log.info(f"{estate.name} has been purchased by Player {player_id}.")
+    __slots__ = ()
 
-    def mortgage(self, estate: "Estate", player_id: PlayerId) -> None:
-        # Cannot mortgage an estate that is not owned
-        log.error(f"Cannot mortgage {estate.name} as it is not owned.")
-        raise EstateNotOwnedException(estate.name, action=Action.MORTGAGE)
+    def check_buy(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.OK
 
-    def buyback(self, estate: "Estate", player_id: PlayerId) -> None:
-        # Cannot buy back an estate that is not mortgaged
-        log.error(f"Cannot buyback {estate.name} as it is not owned.")
-        raise EstateNotOwnedException(estate.name, action=Action.BUYBACK)
+    def check_mortgage(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.NOT_OWNED
 
+    def check_buyback(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.NOT_OWNED
+
+    def _buy(self, estate: "Estate", player_id: "PlayerId") -> None:
+        estate.set_owner(player_id=player_id)
+        estate._set_state(OWNED)
+        log.info("%s has been purchased by Player %s.", estate.name, player_id)
 
 
-@dataclass
 class OwnedState(EstateState):
     """
     State when the estate is owned by a player.
     """
 
-    def buy(self, estate: "Estate", player_id: PlayerId) -> None:
-        # Cannot buy an already owned estate
-        log.warning(f"{estate.name} is already owned by Player {estate.owner}.")
-        raise EstateAlreadyOwnedException(estate.name)
-
-    def mortgage(self, estate: "Estate", player_id: PlayerId) -> None:
-        if estate.owner != player_id:
-            log.error(f"Only the owner (Player {estate.owner}) can mortgage {estate.name}.")
-            raise EstatePermissionException(estate.name, action=Action.MORTGAGE)
+    __slots__ = ()
 
-        if isinstance(estate._state, MortgagedState):
-            log.error(f"{estate.name} is already mortgaged.")
-            raise EstateMortgagedException(estate.name, action=Action.MORTGAGE)
+    def check_buy(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.ALREADY_OWNED
 
-        estate._set_state(MortgagedState(turns_until_buyback=TURNS_UNTIL_SALE))
-        log.info(f"{estate.name} has been mortgaged for {estate.mortgage_price}.")
+    def check_mortgage(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.OK if estate.owner == player_id else Verdict.NOT_OWNER
 
-    def buyback(self, estate: "Estate", player_id: PlayerId) -> None:
-        # Cannot buy back an estate that is not mortgaged
-        log.error(f"Cannot buyback {estate.name} as it is not mortgaged.")
-        raise EstateMortgagedException(estate.name, action="buy")
+    def check_buyback(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.NOT_MORTGAGED
 
+    def _mortgage(self, estate: "Estate", player_id: "PlayerId") -> None:
+        estate.turns_until_buyback = TURNS_UNTIL_SALE
+        estate._set_state(MORTGAGED)
+        log.info("%s has been mortgaged for %s.", estate.name, estate.mortgage_price)
 
 
-@dataclass
 class MortgagedState(EstateState):
-    turns_until_buyback: int = 0
+    """
+    State when the estate is mortgaged and counts down to its forced release.
+    """
+
+    __slots__ = ()
 
-    def buy(self, estate: "Estate", player_id: PlayerId) -> None:
-        raise EstateMortgagedException(estate.name)
+    def check_buy(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.MORTGAGED
 
-    def mortgage(self, estate: "Estate", player_id: PlayerId) -> None:
-        log.info(f"{estate.name} is already mortgaged.")
-        raise EstateMortgagedException(estate.name, action=Action.MORTGAGE)
+    def check_mortgage(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.MORTGAGED
 
-    def buyback(self, estate: "Estate", player_id: PlayerId) -> None:
-        if estate.owner != player_id:
-            log.error(f"Only the owner (Player {estate.owner}) can buy back {estate.name}.")
-            raise EstatePermissionException(estate.name, action=Action.BUYBACK)
+    def check_buyback(self, estate: "Estate", player_id: "PlayerId") -> Verdict:
+        return Verdict.OK if estate.owner == player_id else Verdict.NOT_OWNER
 
-        estate._set_state(OwnedState())
-        log.info(f"{estate.name} has been bought back for {estate.buyback_price}.")
+    def _buyback(self, estate: "Estate", player_id: "PlayerId") -> None:
+        estate.turns_until_buyback = 0
+        estate._set_state(OWNED)
+        log.info("%s has been bought back for %s.", estate.name, estate.buyback_price)
 
     def advance_turn(self, estate: "Estate") -> None:
-        if self.turns_until_buyback > 0:
-            self.turns_until_buyback -= 1
-            log.info(f"{self.turns_until_buyback} turns remaining to buy back {estate.name}.")
-            if self.turns_until_buyback == 0:
-                estate._set_state(NotOwnedState())
-                estate.set_owner(None)
-                log.info(f"Buyback time for {estate.name} has expired. The estate is now available for purchase.")
+        if estate.turns_until_buyback > 0:
+            estate.turns_until_buyback -= 1
+            if estate._events is not None:
+                estate._events.emit(BuybackCountdown(estate.identity, estate.turns_until_buyback))
+            log.info("%s turns remaining to buy back %s.", estate.turns_until_buyback, estate.name)
+            if estate.turns_until_buyback == 0:
+                estate.release()
+                log.info(
+                    "Buyback time for %s has expired. The estate is now available for purchase.",
+                    estate.name,
+                )
+
+
+def refusal(verdict: Verdict, estate: "Estate", action: Action) -> DomainError:
+    """
+    Log a refused estate action and return the DomainError for the caller to raise.
+    """
+    if verdict is Verdict.ALREADY_OWNED:
+        log.warning("%s is already owned by Player %s.", estate.name, estate.owner)
+        return EstateAlreadyOwnedException(estate.name)
+    if verdict is Verdict.NOT_OWNED:
+        log.error("Cannot %s %s as it is not owned.", action.value, estate.name)
+        return EstateNotOwnedException(estate.name, action=action)
+    if verdict is Verdict.NOT_OWNER:
+        log.error("Only the owner (Player %s) can %s %s.", estate.owner, action.value, estate.name)
+        return EstatePermissionException(estate.name, action=action)
+    if verdict is Verdict.MORTGAGED:
+        log.info("%s is mortgaged. Cannot %s it.", estate.name, action.value)
+        if action is Action.BUY:
+            return EstateMortgagedException(estate.name)
+        return EstateMortgagedException(estate.name, action=action)
+    if verdict is Verdict.NOT_MORTGAGED:
+        log.error("Cannot buyback %s as it is not mortgaged.", estate.name)
+        return EstateMortgagedException(estate.name, action="buy")
+    return DomainError(f"Cannot {action.value} {estate.name}: {verdict.name}.")
+
+
+NOT_OWNED = NotOwnedState()
+OWNED = OwnedState()
+MORTGAGED = MortgagedState()
@@ -123,9 +123,15 @@ class Game:
     def pass_start(self, player: Player):
         if self.is_bonus_active():
             player.funds = player.funds.add(self.pass_start_bonus)
-            log.info(f"Player {player.identity} passed 'Start' and receive ${self.pass_start_bonus.amount}.")
+            log.info(
+                "Player %s passed 'Start' and receive $%s.",
+                player.identity, self.pass_start_bonus.amount,
+            )
         else:
-            log.info(f"Player {player.identity} passed 'Start', but the bonus was not issued (time expired).")
+            log.info(
+                "Player %s passed 'Start', but the bonus was not issued (time expired).",
+                player.identity,
+            )
 
     def update_tax_rate(self):
         if self.is_tax_increase_active():
@@ -134,7 +140,7 @@ class Game:
                 if self.current_tax_rate > 0.99:
                     self.current_tax_rate = 0.99
                 self.tax_rate_updated = True
-                log.info(f"The tax rate has been increased to {self.current_tax_rate * 100}%.")
+                log.info("The tax rate has been increased to %s%%.", self.current_tax_rate * 100)
 
 
     def reduce_rent(self):
@@ -146,7 +152,10 @@ class Game:
                     for estate in estates:
                         estate.reduce_rent(percentage=reduction_step * 100)
                 self.current_rent_reduction += reduction_step
-                log.info(f"Rent has been reduced by {reduction_step * 100}%. Current total reduction: {self.current_rent_reduction * 100}%.")
+                log.info(
+                    "Rent has been reduced by %s%%. Current total reduction: %s%%.",
+                    reduction_step * 100, self.current_rent_reduction * 100,
+                )
                 self.next_rent_reduction_turn = self.current_turn + self.rent_reduction_interval_turns
                 if self.current_rent_reduction >= self.max_rent_reduction:
                     log.info("Maximum rent reduction reached.")
@@ -158,7 +167,7 @@ class Game:
             return
 
         self.current_turn += 1
-        log.info(f"Turn {self.current_turn} begins.")
+        log.info("Turn %s begins.", self.current_turn)
 
         self.update_tax_rate()
         self.reduce_rent()
@@ -177,5 +186,5 @@ class Game:
         self.start_time = datetime.now()
         for player in self.players:
             player.funds = self.player_starting_funds
-        log.info(f"The game started at {self.start_time}")
+        log.info("The game started at %s", self.start_time)
 
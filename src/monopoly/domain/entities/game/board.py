@@ -0,0 +1,41 @@
+from monopoly.domain.entities.estate import Estate, EstateCategory
+from monopoly.domain.entities.game.catalog import BoardCatalog
+
+# identity, name, price, mortgage_price, buyback_price, rent, category
+BoardRow = tuple[int, str, int, int, int, int, EstateCategory]
+
+DEFAULT_BOARD: tuple[BoardRow, ...] = (
+    (1, "Fragrance Hub", 100, 50, 55, 10, EstateCategory.PERFUMERY),
+    (2, "Scent Station", 110, 55, 60, 11, EstateCategory.PERFUMERY),
+    (3, "Gadget World", 150, 75, 82, 15, EstateCategory.ELECTRONICS),
+    (4, "Tech Town", 160, 80, 88, 16, EstateCategory.ELECTRONICS),
+    (5, "Auto Plaza", 200, 100, 110, 25, EstateCategory.AUTOMOBILES),
+    (6, "Motor Market", 210, 105, 115, 25, EstateCategory.AUTOMOBILES),
+    (7, "Hotel California", 300, 150, 165, 30, EstateCategory.HOTELS),
+    (8, "Grand Lodge", 320, 160, 176, 32, EstateCategory.HOTELS),
+    (9, "Restaurant Royale", 250, 125, 137, 25, EstateCategory.RESTAURANTS),
+    (10, "Dine Divine", 260, 130, 143, 26, EstateCategory.RESTAURANTS),
+    (11, "Airline Terminal", 180, 90, 99, 18, EstateCategory.AIRLINES),
+    (12, "Sky Gateway", 190, 95, 105, 19, EstateCategory.AIRLINES),
+    (13, "Beverage Barn", 120, 60, 66, 12, EstateCategory.BEVERAGES),
+    (14, "Drink Depot", 130, 65, 71, 13, EstateCategory.BEVERAGES),
+    (15, "Web Services Hub", 160, 80, 88, 16, EstateCategory.WEB_SERVICES),
+    (16, "Cloud Central", 170, 85, 94, 17, EstateCategory.WEB_SERVICES),
+    (17, "Clothing Corner", 140, 70, 77, 14, EstateCategory.CLOTHING),
+    (18, "Fashion Forte", 150, 75, 83, 15, EstateCategory.CLOTHING),
+)
+
+
+def create_estates(board: tuple[BoardRow, ...] = DEFAULT_BOARD) -> list[Estate]:
+    """
+    Build a fresh set of estates for one game, so games never share mutable estate state.
+    The static data comes from the board's shared BoardCatalog.
+    """
+    return BoardCatalog.of(board).create_estates()
+
+
+def build_registry(estates: list[Estate]) -> dict[EstateCategory, set[Estate]]:
+    registry: dict[EstateCategory, set[Estate]] = {category: set() for category in EstateCategory}
+    for estate in estates:
+        registry[estate.category].add(estate)
+    return registry
@@ -0,0 +1,399 @@
+"""
+Boards defined in TOML files, validated once and cached in a compiled binary form.
+
+A board file has an optional ``[rules]`` table (BoardRules fields; rates in basis points,
+time limits as ``<field>_minutes``), optional ``[categories.<name>]`` tables overriding
+``buildable`` and ``max_stars`` for a category, and one ``[[estates]]`` table per estate:
+
+    [[estates]]
+    id = 1
+    name = "Fragrance Hub"
+    price = 100
+    mortgage = 50
+    buyback = 55
+    rent = 10
+    category = "Perfumery"
+
+``buildable`` and ``max_stars`` may also be set per estate. ``load_board`` keeps the
+compiled form in ``__boardcache__`` next to the file, keyed by the SHA-256 of its content,
+so parsing and validation happen once per distinct board.
+"""
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import tomllib
+from array import array
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from monopoly.domain.entities.estate import BUILDABLE_CATEGORIES, EstateCategory
+from monopoly.domain.entities.game.catalog import (
+    CATEGORIES,
+    MAX_STARS,
+    BoardCatalog,
+    BoardRules,
+)
+from monopoly.domain.entities.game.rent_table import STAR_RENT_MULTIPLIERS
+from monopoly.domain.exceptions.board_exc import InvalidBoardException
+from monopoly.domain.value_objects.rate import BASIS_POINTS, Rate
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "__boardcache__"
+FORMAT_VERSION = 1
+
+_MAGIC = b"MBRD"
+# magic, format version, written little-endian, estates
+_HEADER = struct.Struct("<4sHBI")
+_RULES = struct.Struct("<11q")
+_LENGTH = struct.Struct("<Q")
+# identities, prices, mortgage prices, buyback prices, rents, categories, buildable, stars
+_COLUMN_TYPES = ("i", "q", "q", "q", "q", "B", "B", "B")
+_NO_TIME = -1
+
+_MAX_IDENTITY = 2**31 - 1
+_MAX_AMOUNT = 2**63 - 1
+# Rents are only defined up to the last star multiplier
+_MAX_STARS_LIMIT = len(STAR_RENT_MULTIPLIERS) - 1
+
+_RATE_RULES = ("rent_reduction_step", "max_rent_reduction", "tax_step", "max_tax_rate")
+_COUNT_RULES = ("rent_reduction_interval_turns", "pass_start_bonus", "starting_funds")
+_TIME_RULES = (
+    "game_duration", "bonus_disable_after", "rent_reduction_start_after",
+    "tax_increase_start_after",
+)
+_ESTATE_KEYS = frozenset({"id", "name", "price", "mortgage", "buyback", "rent", "category"})
+_OPTIONAL_ESTATE_KEYS = frozenset({"buildable", "max_stars"})
+_CATEGORY_VALUES = {category.value: category for category in EstateCategory}
+
+
+def load_board(
+    path: str | os.PathLike[str], cache_dir: str | os.PathLike[str] | None = None
+) -> BoardCatalog:
+    """
+    Catalog of the board file at ``path``. The compiled form is read from ``cache_dir``
+    (``__boardcache__`` next to the file by default) when present for this exact content,
+    and written there otherwise; a cache that cannot be written only costs the next load.
+    """
+    path = Path(path)
+    source = path.read_bytes()
+    directory = Path(cache_dir) if cache_dir is not None else path.parent / CACHE_DIR_NAME
+    cached = directory / f"{hashlib.sha256(source).hexdigest()}.board"
+
+    try:
+        return read_compiled(cached.read_bytes())
+    except FileNotFoundError:
+        pass
+    except InvalidBoardException as error:
+        log.warning("Ignoring board cache %s: %s", cached, error)
+
+    catalog = parse_board(source.decode())
+    # Written aside and renamed, so concurrent loaders never read a partial cache
+    partial = cached.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        partial.write_bytes(compile_board(catalog))
+        os.replace(partial, cached)
+    except OSError as error:
+        log.warning("Could not cache compiled board %s: %s", cached, error)
+    else:
+        log.info("Compiled board %s to %s.", path, cached)
+    return catalog
+
+
+def parse_board(text: str) -> BoardCatalog:
+    """
+    Catalog of a board file's content, raising InvalidBoardException on the first problem.
+    """
+    try:
+        document = tomllib.loads(text)
+    except tomllib.TOMLDecodeError as error:
+        raise InvalidBoardException(str(error)) from error
+    _check_keys(document, frozenset(), {"rules", "categories", "estates"}, "the board")
+
+    rules = _parse_rules(_table(document, "rules", "the board"))
+    category_rules = {
+        _category(name, f"[categories.{name}]"): _parse_category(table, f"[categories.{name}]")
+        for name, table in _table(document, "categories", "the board").items()
+    }
+    estates = document.get("estates")
+    if not isinstance(estates, list) or not estates:
+        raise InvalidBoardException("the board has no [[estates]]")
+
+    identities: list[int] = []
+    names: list[str] = []
+    prices: list[int] = []
+    mortgage_prices: list[int] = []
+    buyback_prices: list[int] = []
+    rents: list[int] = []
+    codes: list[int] = []
+    buildable: list[bool] = []
+    max_stars: list[int] = []
+    code_of = {category: code for code, category in enumerate(CATEGORIES)}
+
+    for number, estate in enumerate(estates, start=1):
+        where = f"estate #{number}"
+        if not isinstance(estate, dict):
+            raise InvalidBoardException(f"{where} is not a table")
+        _check_keys(estate, _ESTATE_KEYS, _ESTATE_KEYS | _OPTIONAL_ESTATE_KEYS, where)
+        identity = _integer(estate, "id", where, 1, _MAX_IDENTITY)
+        where = f"estate {identity}"
+        name = estate["name"]
+        if not isinstance(name, str) or not name or "\0" in name:
+            raise InvalidBoardException(f"{where} needs a non-empty name without NUL")
+        price = _integer(estate, "price", where)
+        mortgage = _integer(estate, "mortgage", where, 0, price)
+        buyback = _integer(estate, "buyback", where, mortgage)
+        category = _category(estate["category"], where)
+        overrides = category_rules.get(category, {})
+        can_build = estate.get(
+            "buildable", overrides.get("buildable", category in BUILDABLE_CATEGORIES)
+        )
+        if not isinstance(can_build, bool):
+            raise InvalidBoardException(f"{where}: buildable must be true or false")
+        if "max_stars" in estate:
+            stars = _integer(estate, "max_stars", where, 0, _MAX_STARS_LIMIT)
+        else:
+            stars = overrides.get("max_stars", MAX_STARS) if can_build else 0
+        if stars and not can_build:
+            raise InvalidBoardException(f"{where} is not buildable but allows {stars} stars")
+
+        identities.append(identity)
+        names.append(name)
+        prices.append(price)
+        mortgage_prices.append(mortgage)
+        buyback_prices.append(buyback)
+        rents.append(_integer(estate, "rent", where))
+        codes.append(code_of[category])
+        buildable.append(can_build)
+        max_stars.append(stars)
+
+    if len(set(identities)) != len(identities):
+        seen: set[int] = set()
+        for identity in identities:
+            if identity in seen:
+                raise InvalidBoardException(f"estate {identity} is defined more than once")
+            seen.add(identity)
+
+    order = sorted(range(len(identities)), key=identities.__getitem__)
+    return BoardCatalog.from_columns(
+        array("i", [identities[row] for row in order]),
+        [names[row] for row in order],
+        array("q", [prices[row] for row in order]),
+        array("q", [mortgage_prices[row] for row in order]),
+        array("q", [buyback_prices[row] for row in order]),
+        array("q", [rents[row] for row in order]),
+        array("B", [codes[row] for row in order]),
+        array("B", [buildable[row] for row in order]),
+        array("B", [max_stars[row] for row in order]),
+        rules,
+    )
+
+
+def format_board(catalog: BoardCatalog) -> str:
+    """
+    Board file for ``catalog``, which ``parse_board`` reads back to an equal catalog.
+    """
+    rules = catalog.rules
+    lines = ["[rules]"]
+    lines += [f"{name} = {getattr(rules, name).basis_points}" for name in _RATE_RULES]
+    lines += [f"{name} = {getattr(rules, name)}" for name in _COUNT_RULES]
+    for name in _TIME_RULES:
+        limit = getattr(rules, name)
+        if limit is not None:
+            lines.append(f"{name}_minutes = {limit // timedelta(minutes=1)}")
+
+    for spec in catalog.specs:
+        lines += [
+            "",
+            "[[estates]]",
+            f"id = {spec.identity}",
+            f"name = {_toml_string(spec.name)}",
+            f"price = {spec.price}",
+            f"mortgage = {spec.mortgage_price}",
+            f"buyback = {spec.buyback_price}",
+            f"rent = {spec.rent}",
+            f"category = {_toml_string(spec.category.value)}",
+        ]
+        if spec.buildable != (spec.category in BUILDABLE_CATEGORIES):
+            lines.append(f"buildable = {'true' if spec.buildable else 'false'}")
+        if spec.max_stars != (MAX_STARS if spec.buildable else 0):
+            lines.append(f"max_stars = {spec.max_stars}")
+    return "\n".join(lines) + "\n"
+
+
+def compile_board(catalog: BoardCatalog) -> bytes:
+    rules = catalog.rules
+    parts = [
+        _HEADER.pack(_MAGIC, FORMAT_VERSION, sys.byteorder == "little", len(catalog)),
+        _RULES.pack(
+            *(getattr(rules, name).basis_points for name in _RATE_RULES),
+            *(getattr(rules, name) for name in _COUNT_RULES),
+            *(_seconds(getattr(rules, name)) for name in _TIME_RULES),
+        ),
+    ]
+    for blob in (
+        "\0".join(category.value for category in CATEGORIES).encode(),
+        "\0".join(catalog.names).encode(),
+    ):
+        parts += [_LENGTH.pack(len(blob)), blob]
+    parts += [
+        column.tobytes() for column in (
+            catalog.identities, catalog.prices, catalog.mortgage_prices,
+            catalog.buyback_prices, catalog.rents, catalog.category_codes, catalog.buildable,
+            catalog.max_stars,
+        )
+    ]
+    return b"".join(parts)
+
+
+def read_compiled(data: bytes) -> BoardCatalog:
+    view = memoryview(data)
+    try:
+        magic, version, little_endian, rows = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise InvalidBoardException(f"not a compiled board of format {FORMAT_VERSION}")
+        rules = _unpack_rules(_RULES.unpack_from(view, _HEADER.size))
+        offset = _HEADER.size + _RULES.size
+        category_blob, offset = _read_blob(view, offset)
+        names_blob, offset = _read_blob(view, offset)
+    except struct.error as error:
+        raise InvalidBoardException("truncated compiled board") from error
+
+    swap = bool(little_endian) != (sys.byteorder == "little")
+    columns = []
+    for typecode in _COLUMN_TYPES:
+        column = array(typecode)
+        end = offset + rows * column.itemsize
+        if end > len(view):
+            raise InvalidBoardException("truncated compiled board")
+        column.frombytes(view[offset:end])
+        if swap:
+            column.byteswap()
+        columns.append(column)
+        offset = end
+    if offset != len(view):
+        raise InvalidBoardException("trailing data after the compiled board")
+
+    names = names_blob.decode().split("\0") if rows else []
+    if len(names) != rows:
+        raise InvalidBoardException("compiled board names do not match its estates")
+    categories = category_blob.decode().split("\0")
+    if categories != [category.value for category in CATEGORIES]:
+        # Written with another category order: translate the codes to this one
+        try:
+            table = bytes(CATEGORIES.index(EstateCategory(value)) for value in categories)
+        except ValueError as error:
+            raise InvalidBoardException(str(error)) from error
+        columns[5] = array("B", columns[5].tobytes().translate(table.ljust(256, b"\0")))
+    identities, prices, mortgage_prices, buyback_prices, rents, codes, buildable, stars = columns
+    return BoardCatalog.from_columns(
+        identities, names, prices, mortgage_prices, buyback_prices, rents, codes, buildable,
+        stars, rules,
+    )
+
+
+def _read_blob(view: memoryview, offset: int) -> tuple[bytes, int]:
+    (length,) = _LENGTH.unpack_from(view, offset)
+    start = offset + _LENGTH.size
+    if start + length > len(view):
+        raise struct.error("blob past the end")
+    return bytes(view[start:start + length]), start + length
+
+
+def _unpack_rules(values: tuple[int, ...]) -> BoardRules:
+    rates = values[:len(_RATE_RULES)]
+    counts = values[len(_RATE_RULES):len(_RATE_RULES) + len(_COUNT_RULES)]
+    times = values[len(_RATE_RULES) + len(_COUNT_RULES):]
+    return BoardRules(
+        **{name: Rate.of(points) for name, points in zip(_RATE_RULES, rates)},
+        **dict(zip(_COUNT_RULES, counts)),
+        **{
+            name: None if seconds == _NO_TIME else timedelta(seconds=seconds)
+            for name, seconds in zip(_TIME_RULES, times)
+        },
+    )
+
+
+def _seconds(limit: timedelta | None) -> int:
+    return _NO_TIME if limit is None else int(limit.total_seconds())
+
+
+def _parse_rules(table: dict[str, Any]) -> BoardRules:
+    keys = {*_RATE_RULES, *_COUNT_RULES, *(f"{name}_minutes" for name in _TIME_RULES)}
+    _check_keys(table, frozenset(), keys, "[rules]")
+    values: dict[str, Any] = {}
+    for name in _RATE_RULES:
+        if name in table:
+            values[name] = Rate.of(_integer(table, name, "[rules]", 0, BASIS_POINTS))
+    for name in _COUNT_RULES:
+        if name in table:
+            minimum = 1 if name == "rent_reduction_interval_turns" else 0
+            values[name] = _integer(table, name, "[rules]", minimum)
+    for name in _TIME_RULES:
+        if f"{name}_minutes" in table:
+            values[name] = timedelta(minutes=_integer(table, f"{name}_minutes", "[rules]"))
+    rules = BoardRules(**values)
+    # A step past its maximum would overshoot the cap on the very first change
+    for step, maximum in (("rent_reduction_step", "max_rent_reduction"),
+                          ("tax_step", "max_tax_rate")):
+        if getattr(rules, step) > getattr(rules, maximum):
+            raise InvalidBoardException(f"[rules]: {step} must not exceed {maximum}")
+    return rules
+
+
+def _parse_category(table: Any, where: str) -> dict[str, Any]:
+    if not isinstance(table, dict):
+        raise InvalidBoardException(f"{where} is not a table")
+    _check_keys(table, frozenset(), _OPTIONAL_ESTATE_KEYS, where)
+    if not isinstance(table.get("buildable", True), bool):
+        raise InvalidBoardException(f"{where}: buildable must be true or false")
+    if "max_stars" in table:
+        _integer(table, "max_stars", where, 0, _MAX_STARS_LIMIT)
+    return table
+
+
+def _category(value: Any, where: str) -> EstateCategory:
+    try:
+        return _CATEGORY_VALUES[value]
+    except (KeyError, TypeError):
+        raise InvalidBoardException(f"{where}: unknown category {value!r}") from None
+
+
+def _table(document: dict[str, Any], key: str, where: str) -> dict[str, Any]:
+    table = document.get(key, {})
+    if not isinstance(table, dict):
+        raise InvalidBoardException(f"{key} in {where} is not a table")
+    return table
+
+
+def _check_keys(
+    table: dict[str, Any], required: frozenset[str], allowed: set[str] | frozenset[str],
+    where: str,
+) -> None:
+    missing = required - table.keys()
+    if missing:
+        raise InvalidBoardException(f"{where} is missing {', '.join(sorted(missing))}")
+    unknown = table.keys() - allowed
+    if unknown:
+        raise InvalidBoardException(f"{where} has unknown keys {', '.join(sorted(unknown))}")
+
+
+def _integer(
+    table: dict[str, Any], key: str, where: str, minimum: int = 0, maximum: int = _MAX_AMOUNT
+) -> int:
+    value = table[key]
+    if type(value) is not int or not minimum <= value <= maximum:
+        raise InvalidBoardException(
+            f"{where}: {key} must be an integer from {minimum} to {maximum}, not {value!r}"
+        )
+    return value
+
+
+def _toml_string(text: str) -> str:
+    # JSON string escapes are valid TOML basic-string escapes, bar DEL
+    return json.dumps(text, ensure_ascii=False).replace("\x7f", "\\u007f")
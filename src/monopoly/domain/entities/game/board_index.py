@@ -0,0 +1,145 @@
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from ..estate import Estate, EstateCategory, EstateId
+    from ..estate_state import EstateState
+    from ..player import PlayerId
+
+
+class BoardIndex:
+    """
+    Ownership index over the estates of one game, kept up to date incrementally.
+
+    The index observes every estate, so buy, mortgage, buyback, trades and auto-release
+    update it as they happen and every query is O(1).
+    """
+
+    def __init__(self, estates: Iterable["Estate"]):
+        self._estates: dict["EstateId", "Estate"] = {}
+        self._category_sizes: dict["EstateCategory", int] = {}
+        self._owners: dict["EstateId", "PlayerId | None"] = {}
+        self._counts: dict[tuple["PlayerId", "EstateCategory"], int] = {}
+        self._complete: dict["PlayerId", set["EstateCategory"]] = {}
+        self._unowned: set["EstateId"] = set()
+        self._mortgaged: set["EstateId"] = set()
+
+        for estate in estates:
+            self._estates[estate.identity] = estate
+            sizes = self._category_sizes
+            sizes[estate.category] = sizes.get(estate.category, 0) + 1
+            self._owners[estate.identity] = None
+            self._unowned.add(estate.identity)
+        for estate in self._estates.values():
+            self._sync(estate)
+            estate.attach(self)
+
+    def detach(self) -> None:
+        for estate in self._estates.values():
+            estate.detach(self)
+
+    def reset(self) -> None:
+        """
+        Forget every owner and mortgage, for estates reset without notifications.
+        """
+        self._owners = dict.fromkeys(self._estates)
+        self._counts.clear()
+        self._complete.clear()
+        self._unowned = set(self._estates)
+        self._mortgaged.clear()
+
+    def estate_changed(
+        self, estate: "Estate", previous_owner: "PlayerId | None", previous_state: "EstateState"
+    ) -> None:
+        self._sync(estate)
+
+    def _sync(self, estate: "Estate") -> None:
+        identity = estate.identity
+        category = estate.category
+        old_owner = self._owners[identity]
+        new_owner = estate.owner
+
+        if old_owner != new_owner:
+            if old_owner is None:
+                self._unowned.discard(identity)
+            else:
+                key = (old_owner, category)
+                if self._counts[key] == self._category_sizes[category]:
+                    self._complete[old_owner].discard(category)
+                self._counts[key] -= 1
+
+            if new_owner is None:
+                self._unowned.add(identity)
+            else:
+                key = (new_owner, category)
+                count = self._counts.get(key, 0) + 1
+                self._counts[key] = count
+                if count == self._category_sizes[category]:
+                    self._complete.setdefault(new_owner, set()).add(category)
+
+            self._owners[identity] = new_owner
+
+        if estate.is_mortgaged():
+            self._mortgaged.add(identity)
+        else:
+            self._mortgaged.discard(identity)
+
+    def owned_count(self, player_id: "PlayerId", category: "EstateCategory") -> int:
+        return self._counts.get((player_id, category), 0)
+
+    def owns_category(self, player_id: "PlayerId", category: "EstateCategory") -> bool:
+        return category in self._complete.get(player_id, ())
+
+    def complete_categories(self, player_id: "PlayerId") -> frozenset["EstateCategory"]:
+        return frozenset(self._complete.get(player_id, ()))
+
+    def is_unowned(self, estate_id: "EstateId") -> bool:
+        return estate_id in self._unowned
+
+    def is_mortgaged(self, estate_id: "EstateId") -> bool:
+        return estate_id in self._mortgaged
+
+    @property
+    def unowned(self) -> frozenset["EstateId"]:
+        return frozenset(self._unowned)
+
+    @property
+    def mortgaged(self) -> frozenset["EstateId"]:
+        return frozenset(self._mortgaged)
+
+    def check_consistency(self) -> list[str]:
+        """
+        Rebuild the index from scratch and describe every difference from the incremental one.
+        """
+        problems: list[str] = []
+        counts: dict[tuple["PlayerId", "EstateCategory"], int] = {}
+        for identity, estate in self._estates.items():
+            if self._owners[identity] != estate.owner:
+                problems.append(
+                    f"estate {identity}: indexed owner {self._owners[identity]}, "
+                    f"actual {estate.owner}"
+                )
+            if (identity in self._unowned) != (estate.owner is None):
+                problems.append(f"estate {identity}: unowned set out of date")
+            if (identity in self._mortgaged) != estate.is_mortgaged():
+                problems.append(f"estate {identity}: mortgaged set out of date")
+            if estate.owner is not None:
+                key = (estate.owner, estate.category)
+                counts[key] = counts.get(key, 0) + 1
+
+        indexed_counts = {key: count for key, count in self._counts.items() if count}
+        if indexed_counts != counts:
+            problems.append(f"category counts {indexed_counts} != actual {counts}")
+
+        complete = {
+            (player_id, category)
+            for (player_id, category), count in counts.items()
+            if count == self._category_sizes[category]
+        }
+        indexed_complete = {
+            (player_id, category)
+            for player_id, categories in self._complete.items()
+            for category in categories
+        }
+        if indexed_complete != complete:
+            problems.append(f"complete categories {indexed_complete} != actual {complete}")
+        return problems
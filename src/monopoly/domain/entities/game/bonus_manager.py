@@ -1,8 +1,9 @@
-from dataclasses import dataclass
-from decimal import Decimal
+from dataclasses import dataclass, field
 import logging
 
 from monopoly.domain.entities.game.time_manager import TimeManager
+from monopoly.domain.events import EventSink, StartPassed
+from monopoly.domain.value_objects.funds import Funds
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,14 +14,21 @@ log = logging.getLogger(__name__)
 
 @dataclass
 class BonusManager:
-    pass_start_bonus: Decimal = Decimal("2000")
-    player_starting_funds: Decimal = Decimal("2000")
+    pass_start_bonus: Funds = Funds(amount=2000)
+    player_starting_funds: Funds = Funds(amount=2000)
+    events: EventSink | None = field(default=None, repr=False)
 
     def pass_start(self, player: "Player", time_manager: TimeManager):
         if time_manager.elapsed_time() < time_manager.bonus_disable_after:
-            player.funds += self.pass_start_bonus
+            player.funds = player.funds.add(self.pass_start_bonus)
+            if self.events is not None:
+                self.events.emit(StartPassed(player.identity, self.pass_start_bonus.amount))
             log.info(
-                f"Player {player.identity} passed 'Start' and received ${self.pass_start_bonus}.")
+                "Player %s passed 'Start' and received $%s.",
+                player.identity, self.pass_start_bonus.amount,
+            )
         else:
             log.info(
-                f"Player {player.identity} passed 'Start', but the bonus was not issued (time expired).")
+                "Player %s passed 'Start', but the bonus was not issued (time expired).",
+                player.identity,
+            )
@@ -0,0 +1,295 @@
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Mapping, overload
+
+from monopoly.domain.entities.estate import (
+    BUILDABLE_CATEGORIES,
+    BuildableEstate,
+    Estate,
+    EstateCategory,
+    EstateId,
+    UnbuildableEstate,
+)
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+if TYPE_CHECKING:
+    from .board import BoardRow
+    from .game import Game
+
+# Stars a buildable estate can hold unless the board says otherwise
+MAX_STARS = 5
+# Category of each code in a catalog's category column
+CATEGORIES: tuple[EstateCategory, ...] = tuple(EstateCategory)
+_CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+
+
+@dataclass(frozen=True, slots=True)
+class EstateSpec:
+    """
+    Static data of one estate, the same in every game on the board.
+    """
+
+    identity: EstateId
+    name: str
+    price: int
+    mortgage_price: int
+    buyback_price: int
+    rent: int
+    category: EstateCategory
+    buildable: bool
+    max_stars: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class BoardRules:
+    """
+    Money and timing rules of a board. The defaults are those of the game's managers, and
+    time limits left as None keep TimeManager's fast_mode defaults.
+    """
+
+    rent_reduction_step: Rate = Rate(1000)
+    rent_reduction_interval_turns: int = 20
+    max_rent_reduction: Rate = Rate(5000)
+    tax_step: Rate = Rate(1000)
+    max_tax_rate: Rate = Rate(9900)
+    pass_start_bonus: int = 2000
+    starting_funds: int = 2000
+    game_duration: timedelta | None = None
+    bonus_disable_after: timedelta | None = None
+    rent_reduction_start_after: timedelta | None = None
+    tax_increase_start_after: timedelta | None = None
+
+    def apply(self, game: "Game") -> None:
+        """
+        Set the rules on ``game`` before its first turn. Game.reset keeps them.
+        """
+        rent = game.rent_manager
+        rent.rent_reduction_step = self.rent_reduction_step
+        rent.rent_reduction_interval_turns = self.rent_reduction_interval_turns
+        rent.max_rent_reduction = self.max_rent_reduction
+        rent.next_rent_reduction_turn = self.rent_reduction_interval_turns
+        game.tax_manager.tax_step = self.tax_step
+        game.tax_manager.max_tax_rate = self.max_tax_rate
+        game.bonus_manager.pass_start_bonus = Funds.of(self.pass_start_bonus)
+        game.bonus_manager.player_starting_funds = Funds.of(self.starting_funds)
+
+        time = game.time_manager
+        if self.game_duration is not None:
+            time.game_duration = self.game_duration
+        if self.bonus_disable_after is not None:
+            time.bonus_disable_after = self.bonus_disable_after
+        if self.rent_reduction_start_after is not None:
+            time.rent_reduction_start_after = self.rent_reduction_start_after
+        if self.tax_increase_start_after is not None:
+            time.tax_increase_start_after = self.tax_increase_start_after
+
+
+class _Specs(Sequence[EstateSpec]):
+    """
+    Rows of a catalog as EstateSpec, built on access.
+    """
+
+    __slots__ = ("_catalog",)
+
+    def __init__(self, catalog: "BoardCatalog"):
+        self._catalog = catalog
+
+    def __len__(self) -> int:
+        return len(self._catalog.identities)
+
+    @overload
+    def __getitem__(self, row: int) -> EstateSpec: ...
+
+    @overload
+    def __getitem__(self, row: slice) -> list[EstateSpec]: ...
+
+    def __getitem__(self, row: int | slice) -> EstateSpec | list[EstateSpec]:
+        if isinstance(row, slice):
+            return [self._catalog.row(index) for index in range(len(self))[row]]
+        return self._catalog.row(row)
+
+
+class BoardCatalog:
+    """
+    Immutable description of a board, loaded once per process and shared by every game on
+    it. Estates are kept in identity order; ``position`` maps an EstateId to its row, which
+    is how per-game tables such as EstateTable refer to them.
+
+    Rows are stored as columns rather than one object per estate, so a compiled board of
+    any size loads as a handful of arrays. ``specs`` gives the rows as EstateSpec.
+    """
+
+    __slots__ = (
+        "identities", "names", "prices", "mortgage_prices", "buyback_prices", "rents",
+        "category_codes", "buildable", "max_stars", "rules", "_first", "_positions",
+        "_categories",
+    )
+
+    def __init__(self, specs: Iterable[EstateSpec], rules: BoardRules = BoardRules()):
+        ordered = sorted(specs, key=lambda spec: spec.identity)
+        self._adopt(
+            array("i", [spec.identity for spec in ordered]),
+            [spec.name for spec in ordered],
+            array("q", [spec.price for spec in ordered]),
+            array("q", [spec.mortgage_price for spec in ordered]),
+            array("q", [spec.buyback_price for spec in ordered]),
+            array("q", [spec.rent for spec in ordered]),
+            array("B", [_CATEGORY_CODES[spec.category] for spec in ordered]),
+            array("B", [spec.buildable for spec in ordered]),
+            array("B", [spec.max_stars for spec in ordered]),
+            rules,
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        identities: array,
+        names: list[str],
+        prices: array,
+        mortgage_prices: array,
+        buyback_prices: array,
+        rents: array,
+        category_codes: array,
+        buildable: array,
+        max_stars: array,
+        rules: BoardRules = BoardRules(),
+    ) -> "BoardCatalog":
+        """
+        Catalog over columns already in identity order and validated, as a compiled board
+        stores them. The columns are adopted, not copied.
+        """
+        catalog = cls.__new__(cls)
+        catalog._adopt(
+            identities, names, prices, mortgage_prices, buyback_prices, rents,
+            category_codes, buildable, max_stars, rules,
+        )
+        return catalog
+
+    def _adopt(
+        self, identities: array, names: list[str], prices: array, mortgage_prices: array,
+        buyback_prices: array, rents: array, category_codes: array, buildable: array,
+        max_stars: array, rules: BoardRules,
+    ) -> None:
+        self.identities = identities
+        self.names = names
+        self.prices = prices
+        self.mortgage_prices = mortgage_prices
+        self.buyback_prices = buyback_prices
+        self.rents = rents
+        self.category_codes = category_codes
+        self.buildable = buildable
+        self.max_stars = max_stars
+        self.rules = rules
+        # Identities are sorted and unique, so consecutive ones need no lookup table
+        rows = len(identities)
+        if rows and identities[-1] - identities[0] == rows - 1:
+            self._first: int | None = identities[0]
+            self._positions: Mapping[EstateId, int] = MappingProxyType({})
+        else:
+            self._first = None
+            self._positions = MappingProxyType(dict(zip(identities, range(rows))))
+        self._categories: Mapping[EstateCategory, tuple[EstateId, ...]] | None = None
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def of(board: tuple["BoardRow", ...]) -> "BoardCatalog":
+        """
+        Catalog of a board given as rows of ``board.DEFAULT_BOARD``'s layout, built once per
+        distinct board.
+        """
+        return BoardCatalog(
+            EstateSpec(
+                identity=EstateId(identity),
+                name=name,
+                price=price,
+                mortgage_price=mortgage_price,
+                buyback_price=buyback_price,
+                rent=rent,
+                category=category,
+                buildable=category in BUILDABLE_CATEGORIES,
+                max_stars=MAX_STARS if category in BUILDABLE_CATEGORIES else 0,
+            )
+            for identity, name, price, mortgage_price, buyback_price, rent, category in board
+        )
+
+    @staticmethod
+    def default() -> "BoardCatalog":
+        from .board import DEFAULT_BOARD
+
+        return BoardCatalog.of(DEFAULT_BOARD)
+
+    def __len__(self) -> int:
+        return len(self.identities)
+
+    @property
+    def specs(self) -> Sequence[EstateSpec]:
+        return _Specs(self)
+
+    @property
+    def categories(self) -> Mapping[EstateCategory, tuple[EstateId, ...]]:
+        """
+        Estates of each category on the board, in identity order, grouped on first use.
+        """
+        if self._categories is None:
+            members: dict[EstateCategory, list[EstateId]] = {}
+            for identity, code in zip(self.identities, self.category_codes):
+                members.setdefault(CATEGORIES[code], []).append(EstateId(identity))
+            self._categories = MappingProxyType(
+                {category: tuple(identities) for category, identities in members.items()}
+            )
+        return self._categories
+
+    def position(self, estate_id: EstateId) -> int:
+        if self._first is None:
+            return self._positions[estate_id]
+        row = estate_id - self._first
+        if 0 <= row < len(self.identities):
+            return row
+        raise KeyError(estate_id)
+
+    def row(self, position: int) -> EstateSpec:
+        return EstateSpec(
+            identity=EstateId(self.identities[position]),
+            name=self.names[position],
+            price=self.prices[position],
+            mortgage_price=self.mortgage_prices[position],
+            buyback_price=self.buyback_prices[position],
+            rent=self.rents[position],
+            category=CATEGORIES[self.category_codes[position]],
+            buildable=bool(self.buildable[position]),
+            max_stars=self.max_stars[position],
+        )
+
+    def spec(self, estate_id: EstateId) -> EstateSpec:
+        return self.row(self.position(estate_id))
+
+    def create_estates(self) -> list[Estate]:
+        """
+        Fresh estates for one game, in identity order, so games never share mutable state.
+        Names and rents are the catalog's own objects; each estate only holds references.
+        """
+        estates: list[Estate] = []
+        columns = zip(
+            self.identities, self.names, self.prices, self.mortgage_prices,
+            self.buyback_prices, self.rents, self.category_codes, self.buildable, self.max_stars,
+        )
+        for identity, name, price, mortgage, buyback, rent, code, buildable, stars in columns:
+            if buildable:
+                estate: Estate = BuildableEstate(
+                    identity=EstateId(identity), name=name, price=price,
+                    mortgage_price=mortgage, buyback_price=buyback,
+                    rent=rent, category=CATEGORIES[code], max_stars=stars,
+                )
+            else:
+                estate = UnbuildableEstate(
+                    identity=EstateId(identity), name=name, price=price,
+                    mortgage_price=mortgage, buyback_price=buyback,
+                    rent=rent, category=CATEGORIES[code],
+                )
+            estates.append(estate)
+        return estates
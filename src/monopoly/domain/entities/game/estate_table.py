@@ -0,0 +1,84 @@
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from monopoly.domain.entities.estate import (
+    STANDALONE_TURNS,
+    BuildableEstate,
+    EstateId,
+    TurnClock,
+)
+from monopoly.domain.entities.estate_state import MORTGAGED, NOT_OWNED, OWNED
+
+if TYPE_CHECKING:
+    from ..estate import Estate
+    from ..player import PlayerId
+    from .catalog import BoardCatalog
+
+_STATES = (NOT_OWNED, OWNED, MORTGAGED)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+_MORTGAGED = _STATE_CODES[MORTGAGED]
+
+# Owner column value of an estate nobody owns
+NO_OWNER = 0
+
+
+class EstateTable:
+    """
+    Mutable state of the estates of one game as compact columns, one row per estate of a
+    shared BoardCatalog in catalog order: owner (0 for none), state machine position,
+    absolute buyback deadline and stars. Everything static is read from the catalog.
+    """
+
+    __slots__ = ("catalog", "owner", "state", "buyback_deadline", "stars")
+
+    def __init__(self, catalog: "BoardCatalog"):
+        rows = len(catalog)
+        self.catalog = catalog
+        self.owner = array("i", bytes(4 * rows))
+        self.state = array("b", bytes(rows))
+        self.buyback_deadline = array("i", bytes(4 * rows))
+        self.stars = array("b", bytes(rows))
+
+    @classmethod
+    def capture(cls, catalog: "BoardCatalog", estates: Iterable["Estate"]) -> "EstateTable":
+        table = cls(catalog)
+        for estate in estates:
+            row = catalog.position(estate.identity)
+            table.owner[row] = estate.owner or NO_OWNER
+            table.state[row] = _STATE_CODES[estate._state]
+            table.buyback_deadline[row] = estate.buyback_deadline
+            if isinstance(estate, BuildableEstate):
+                table.stars[row] = estate.stars
+        return table
+
+    def create_estates(self, turns: TurnClock = STANDALONE_TURNS) -> list["Estate"]:
+        """
+        Estates of the catalog in the state this table records, counting buyback deadlines
+        against ``turns``.
+        """
+        estates = self.catalog.create_estates()
+        for row, estate in enumerate(estates):
+            estate.owner = self.owner[row] or None
+            estate._state = _STATES[self.state[row]]
+            estate.buyback_deadline = self.buyback_deadline[row]
+            estate._turns = turns
+            if isinstance(estate, BuildableEstate):
+                estate.stars = self.stars[row]
+        return estates
+
+    def owner_of(self, estate_id: "EstateId") -> "PlayerId | None":
+        return self.owner[self.catalog.position(estate_id)] or None
+
+    def is_mortgaged(self, estate_id: "EstateId") -> bool:
+        return self.state[self.catalog.position(estate_id)] == _MORTGAGED
+
+    def owned_by(self, player_id: "PlayerId") -> Iterator["EstateId"]:
+        for identity, owner in zip(self.catalog.identities, self.owner):
+            if owner == player_id:
+                yield EstateId(identity)
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self) + self.owner.__sizeof__() + self.state.__sizeof__()
+            + self.buyback_deadline.__sizeof__() + self.stars.__sizeof__()
+        )
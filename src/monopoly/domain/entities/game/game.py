@@ -1,18 +1,25 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable
 
+from monopoly.domain.entities.estate import TurnClock
+from monopoly.domain.entities.game.board_index import BoardIndex
 from monopoly.domain.entities.game.bonus_manager import BonusManager
-from monopoly.domain.entities.game.estate_manager import EstateManager
+from monopoly.domain.entities.game.mortgage_expiry import MortgageExpiry
+from monopoly.domain.entities.game.move_generator import MoveGenerator
 from monopoly.domain.entities.game.player_manager import PlayerManager
 from monopoly.domain.entities.game.rent_manager import RentManager
+from monopoly.domain.entities.game.rent_table import RentEngine, RentTable
 from monopoly.domain.entities.game.tax_manager import TaxManager
-from monopoly.domain.entities.game.time_manager import TimeManager
+from monopoly.domain.entities.game.time_manager import Clock, TimeManager
+from monopoly.domain.events import EventSink, GameEnded, GameStarted, TurnStarted, to_micros
 
 if TYPE_CHECKING:
     from ..estate import EstateCategory, Estate
     from ..player import Player
+    from ...value_objects.funds import Funds
 
 log = logging.getLogger(__name__)
 
@@ -21,51 +28,150 @@ class Game:
     players: list["Player"]
     estate_registry: dict["EstateCategory", set["Estate"]]
     fast_mode: bool = False
+    clock: Clock = datetime.now
 
     time_manager: TimeManager = field(init=False)
     tax_manager: TaxManager = field(init=False)
     rent_manager: RentManager = field(init=False)
     bonus_manager: BonusManager = field(init=False)
     player_manager: PlayerManager = field(init=False)
-    estate_manager: EstateManager = field(init=False)
+    board_index: BoardIndex = field(init=False)
+    mortgage_expiry: MortgageExpiry = field(init=False)
+    turn_clock: TurnClock = field(init=False, repr=False)
+    _seats: tuple["Player", ...] = field(init=False, repr=False)
+    _starting_funds: tuple["Funds", ...] = field(init=False, repr=False)
 
-    current_turn: int = 0
-    winner: "Player" | None = None
+    winner: "Player | None" = None
+    events: EventSink | None = field(default=None, repr=False)
 
     def __post_init__(self):
-        self.time_manager = TimeManager(fast_mode=self.fast_mode)
+        self.time_manager = TimeManager(fast_mode=self.fast_mode, clock=self.clock)
         self.tax_manager = TaxManager()
         self.rent_manager = RentManager()
         self.bonus_manager = BonusManager()
         self.player_manager = PlayerManager(players=self.players)
-        self.estate_manager = EstateManager(estate_registry=self.estate_registry)
+        estates = [estate for members in self.estate_registry.values() for estate in members]
+        self.board_index = BoardIndex(estates)
+
+        # Buyback deadlines are absolute turns, so they carry over to the game's clock as is
+        self.turn_clock = TurnClock()
+        for estate in estates:
+            estate._turns = self.turn_clock
+            estate.share_rent_level(self.rent_manager.level)
+        self.mortgage_expiry = MortgageExpiry(estates, self.players)
 
         self.rent_manager.next_rent_reduction_turn = self.rent_manager.rent_reduction_interval_turns
+        self._seats = tuple(self.players)
+        self._starting_funds = tuple(player.funds for player in self.players)
+
+    @cached_property
+    def rent_engine(self) -> RentEngine:
+        """
+        Rent owed on landing, from the rent table shared by every game on this board.
+        """
+        return RentEngine(
+            RentTable.shared(
+                estate for estates in self.estate_registry.values() for estate in estates
+            ),
+            self.rent_manager.level,
+            self.tax_manager,
+            self.board_index,
+        )
+
+    @cached_property
+    def move_generator(self) -> MoveGenerator:
+        """
+        Legal moves of the players, created on first use and kept up to date from then on.
+        """
+        return MoveGenerator(
+            (estate for estates in self.estate_registry.values() for estate in estates),
+            self.players,
+        )
+
+    def reset(self) -> None:
+        """
+        Return the game in place to the state it was created in: the same players in their
+        original seats and funds, every estate unowned and the managers back to their
+        starting state. Manager settings, such as those applied from BoardRules, are kept.
+        Estates, indexes and the shared rent level and turn clock are reused, which is what
+        makes a reset much cheaper than building a new Game. The event sink is kept.
+        """
+        self.players[:] = self._seats
+        self.player_manager.eliminated.clear()
+        for player, funds in zip(self._seats, self._starting_funds):
+            player.funds = funds
+            player.estates.clear()
+        for estates in self.estate_registry.values():
+            for estate in estates:
+                estate.reset()
+        self.board_index.reset()
+        self.mortgage_expiry.reset()
+        if "move_generator" in self.__dict__:
+            self.move_generator.reset()
+
+        self.time_manager.reset()
+        self.tax_manager.reset()
+        self.rent_manager.reset()
+        self.turn_clock.turn = 0
+        self.winner = None
+
+    @property
+    def current_turn(self) -> int:
+        return self.turn_clock.turn
+
+    @current_turn.setter
+    def current_turn(self, turn: int) -> None:
+        self.turn_clock.turn = turn
+
+    def attach_events(self, sink: EventSink | None) -> None:
+        """
+        Route the domain events of this game, its managers, players and estates to ``sink``.
+        Pass None to stop emitting.
+        """
+        self.events = sink
+        self.tax_manager.events = sink
+        self.rent_manager.events = sink
+        self.bonus_manager.events = sink
+        self.player_manager.events = sink
+        for player in (*self.players, *self.player_manager.eliminated):
+            player._events = sink
+        for estates in self.estate_registry.values():
+            for estate in estates:
+                estate._events = sink
 
     def initialize_game(self):
-        self.time_manager.start_time = datetime.now()
+        self.time_manager.start_time = self.time_manager.now()
         for player in self.players:
             player.funds = self.bonus_manager.player_starting_funds
-        log.info(f"The game started at {self.time_manager.start_time}.")
+        if self.events is not None:
+            self.events.emit(GameStarted(
+                self.bonus_manager.player_starting_funds.amount,
+                to_micros(self.time_manager.start_time),
+            ))
+        log.info("The game started at %s.", self.time_manager.start_time)
 
     def start_game(self):
         self.initialize_game()
 
-    def advance_turn(self):
+    def advance_turn(self, take_turn: Callable[["Player"], None] | None = None):
         if self.winner:
             self.end_game()
             return
 
         self.current_turn += 1
-        log.info(f"Turn {self.current_turn} begins.")
+        if self.events is not None:
+            self.events.emit(TurnStarted(self.current_turn))
+        log.info("Turn %s begins.", self.current_turn)
 
         self.tax_manager.update_tax_rate(self.time_manager)
 
-        self.rent_manager.reduce_rent(self.current_turn, self.estate_registry)
+        self.rent_manager.reduce_rent(self.current_turn)
+
+        self.mortgage_expiry.advance(self.current_turn)
 
-        self.player_manager.advance_turns()
+        self.player_manager.advance_turns(take_turn)
 
-        if self.time_manager.is_game_over():
+        if self.time_manager.is_time_up():
             self.end_game()
 
     def is_game_over(self) -> bool:
@@ -75,9 +181,13 @@ class Game:
         self.time_manager.end_game()
         log.info("The game has ended.")
         self.winner = self.get_winner()
+        if self.events is not None:
+            self.events.emit(
+                GameEnded(self.winner.identity, to_micros(self.time_manager.end_time))
+            )
 
     def get_winner(self) -> "Player":
         winner = max(self.players, key=lambda p: p.funds)
-        log.info(f"The winner is Player {winner.identity} with ${winner.funds}.")
+        log.info("The winner is Player %s with %s.", winner.identity, winner.funds)
         self.winner = winner
         return winner
\ No newline at end of file
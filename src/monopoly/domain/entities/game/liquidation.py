@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from monopoly.domain.entities.verdict import Verdict
+from monopoly.domain.value_objects.rate import Rate
+
+if TYPE_CHECKING:
+    from ..estate import Estate, EstateCategory
+    from ..player import Player
+    from .game import Game
+
+# Share of a complete category's total price charged once when any of its estates is mortgaged
+BROKEN_SET_RATE = Rate(2500)
+
+# Cells of the amount axis; bigger shortfalls are solved in coarser units
+RESOLUTION = 1024
+
+_UNREACHABLE = 1 << 62
+
+
+@dataclass(frozen=True, slots=True)
+class LiquidationPlan:
+    """
+    Estates to mortgage together, the funds they raise and what the choice costs: the
+    buyback prices to pay later and the penalty for each complete category it breaks.
+    """
+
+    estates: tuple["Estate", ...]
+    raised: int
+    buyback_cost: int
+    broken_sets: frozenset["EstateCategory"]
+    cost: int
+
+    def apply(self, player: "Player") -> None:
+        player.mortgage_all(self.estates)
+
+
+def _cover(row: list[int], weight: int, cost: int) -> list[int]:
+    """
+    Row after optionally taking one item: cell c is the cheapest way to raise c units.
+    """
+    cells = len(row)
+    shifted = [row[0]] * min(weight, cells) + row[:max(0, cells - weight)]
+    return [kept if kept <= taken + cost else taken + cost for kept, taken in zip(row, shifted)]
+
+
+def plan_liquidation(
+    game: "Game",
+    player: "Player",
+    amount: int,
+    *,
+    broken_set_rate: Rate = BROKEN_SET_RATE,
+    resolution: int = RESOLUTION,
+) -> LiquidationPlan | None:
+    """
+    Cheapest set of estates for ``player`` to mortgage so their funds reach ``amount``, or
+    None when mortgaging everything would not be enough.
+
+    This is a covering knapsack: estates weigh their mortgage price and cost their buyback
+    price, and the estates of each complete category form a group that also costs the
+    broken-set penalty once if any of them is taken. Amounts are counted in units of
+    ``shortfall / resolution``, which bounds the solve at O(estates x resolution); the plan
+    is then made exact by topping it up if rounding left it short and dropping the estates
+    it does not need, and never costs more than covering greedily by cost per dollar.
+    Shortfalls within ``resolution`` are solved exactly.
+    """
+    shortfall = amount - player.funds.amount
+    candidates = [
+        estate for estate in player.estates.values() if player.can_mortgage(estate) is Verdict.OK
+    ]
+    if shortfall <= 0:
+        return LiquidationPlan((), 0, 0, frozenset(), 0)
+    if sum(estate.mortgage_price for estate in candidates) < shortfall:
+        return None
+
+    complete = game.board_index.complete_categories(player.identity)
+    penalties = {
+        category: broken_set_rate.apply(
+            sum(estate.price for estate in game.estate_registry[category])
+        )
+        for category in complete
+    }
+    groups: dict["EstateCategory | None", list["Estate"]] = {}
+    for estate in candidates:
+        group = estate.category if estate.category in complete else None
+        groups.setdefault(group, []).append(estate)
+
+    unit = -(-shortfall // resolution)
+    cells = -(-shortfall // unit) + 1
+
+    # Each step keeps the rows needed to read the choice back: (group, row before, member rows)
+    steps: list[tuple["EstateCategory | None", list[int], list[list[int]]]] = []
+    row = [0] + [_UNREACHABLE] * (cells - 1)
+    for category, members in groups.items():
+        penalty = penalties.get(category, 0)
+        before = row
+        member_rows = [[value + penalty for value in before] if penalty else before]
+        for estate in members:
+            member_rows.append(_cover(member_rows[-1], _units(estate, unit), estate.buyback_price))
+        after = member_rows[-1]
+        row = [min(skip, take) for skip, take in zip(before, after)] if penalty else after
+        steps.append((category, before, member_rows))
+
+    chosen: list["Estate"] = []
+    cell = cells - 1
+    if row[cell] < _UNREACHABLE:
+        for category, before, member_rows in reversed(steps):
+            if penalties.get(category) and row[cell] == before[cell]:
+                row = before
+                continue
+            members = groups[category]
+            for index in range(len(members), 0, -1):
+                if member_rows[index][cell] != member_rows[index - 1][cell]:
+                    chosen.append(members[index - 1])
+                    cell = max(0, cell - _units(members[index - 1], unit))
+            row = before
+    chosen = _repair(chosen, candidates, shortfall)
+    # Rounding errors add up over large plans, where covering greedily can come out ahead
+    greedy = _repair([], candidates, shortfall)
+    if _cost(greedy, penalties) < _cost(chosen, penalties):
+        chosen = greedy
+
+    broken = frozenset(estate.category for estate in chosen if estate.category in penalties)
+    buyback_cost = sum(estate.buyback_price for estate in chosen)
+    return LiquidationPlan(
+        estates=tuple(sorted(chosen, key=lambda estate: estate.identity)),
+        raised=sum(estate.mortgage_price for estate in chosen),
+        buyback_cost=buyback_cost,
+        broken_sets=broken,
+        cost=_cost(chosen, penalties),
+    )
+
+
+def _cost(chosen: list["Estate"], penalties: dict["EstateCategory", int]) -> int:
+    broken = {estate.category for estate in chosen if estate.category in penalties}
+    return sum(estate.buyback_price for estate in chosen) + sum(
+        penalties[category] for category in broken
+    )
+
+
+def _units(estate: "Estate", unit: int) -> int:
+    return (estate.mortgage_price + unit // 2) // unit
+
+
+def _repair(chosen: list["Estate"], candidates: list["Estate"], shortfall: int) -> list["Estate"]:
+    """
+    Make a plan found in rounded units exact: top it up with the estates that cost least
+    per dollar raised until it covers ``shortfall``, then drop the costliest estates it can
+    do without.
+    """
+    picked = {estate.identity for estate in chosen}
+    raised = sum(estate.mortgage_price for estate in chosen)
+    if raised < shortfall:
+        by_cost = sorted(
+            candidates,
+            key=lambda estate: estate.buyback_price / max(1, estate.mortgage_price),
+        )
+        for estate in by_cost:
+            if raised >= shortfall:
+                break
+            if estate.identity not in picked:
+                chosen.append(estate)
+                raised += estate.mortgage_price
+    kept = []
+    for estate in sorted(chosen, key=lambda estate: estate.buyback_price, reverse=True):
+        if raised - estate.mortgage_price >= shortfall:
+            raised -= estate.mortgage_price
+        else:
+            kept.append(estate)
+    return kept
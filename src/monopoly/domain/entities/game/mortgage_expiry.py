@@ -0,0 +1,110 @@
+import logging
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import TYPE_CHECKING, Iterable
+
+from monopoly.domain.entities.estate_state import MORTGAGED
+
+if TYPE_CHECKING:
+    from ..estate import Estate, EstateId
+    from ..estate_state import EstateState
+    from ..player import Player, PlayerId
+
+log = logging.getLogger(__name__)
+
+
+class MortgageExpiry:
+    """
+    Min-heap of mortgaged estates keyed by the absolute turn their buyback window closes.
+
+    The scheduler observes every estate: mortgaging schedules the estate, moving its
+    deadline reschedules it, buyback or any other way out of MORTGAGED cancels it.
+    Cancelled entries stay in the heap and are skipped when they surface, so a turn only
+    touches the estates that expire on it.
+    Trades keep the mortgage running; the estate is released from whoever owns it then.
+    """
+
+    def __init__(self, estates: Iterable["Estate"], players: list["Player"]):
+        self._estates = list(estates)
+        self._players = players
+        self._heap: list[tuple[int, int, "Estate"]] = []
+        self._scheduled: dict["EstateId", int] = {}
+        self._sequence = count()
+
+        for estate in self._estates:
+            if estate.is_mortgaged():
+                self._schedule(estate)
+            estate.attach(self)
+
+    def detach(self) -> None:
+        for estate in self._estates:
+            estate.detach(self)
+
+    def reset(self) -> None:
+        self._heap.clear()
+        self._scheduled.clear()
+
+    def estate_changed(
+        self, estate: "Estate", previous_owner: "PlayerId | None", previous_state: "EstateState"
+    ) -> None:
+        if estate._state is MORTGAGED:
+            if (previous_state is not MORTGAGED
+                    or self._scheduled.get(estate.identity) != estate.buyback_deadline):
+                # Newly mortgaged, or its deadline was moved: the older entry goes stale
+                self._schedule(estate)
+        elif previous_state is MORTGAGED:
+            self._scheduled.pop(estate.identity, None)
+            # Cancelled entries are only dropped lazily; rebuild once they dominate the heap
+            if len(self._heap) > 2 * len(self._scheduled) + 64:
+                self._compact()
+
+    def _schedule(self, estate: "Estate") -> None:
+        deadline = estate.buyback_deadline
+        self._scheduled[estate.identity] = deadline
+        heappush(self._heap, (deadline, next(self._sequence), estate))
+
+    def _compact(self) -> None:
+        scheduled = self._scheduled
+        self._heap = [
+            entry for entry in self._heap if scheduled.get(entry[2].identity) == entry[0]
+        ]
+        heapify(self._heap)
+
+    def deadline(self, estate_id: "EstateId") -> int | None:
+        """
+        Turn on which the estate is released, or None when it is not mortgaged.
+        """
+        return self._scheduled.get(estate_id)
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def advance(self, turn: int) -> list["Estate"]:
+        """
+        Release every estate whose buyback window closed on or before ``turn``.
+        """
+        heap = self._heap
+        scheduled = self._scheduled
+        released: list["Estate"] = []
+        while heap and heap[0][0] <= turn:
+            deadline, _, estate = heappop(heap)
+            if scheduled.get(estate.identity) != deadline:
+                continue
+            if estate.buyback_deadline > turn:
+                # The countdown was extended directly on the estate: look again later
+                self._schedule(estate)
+                continue
+
+            owner = estate.owner
+            for player in self._players:
+                if player.identity == owner:
+                    player.estates.pop(estate.identity, None)
+                    break
+            # release() leaves MORTGAGED, which unschedules the estate
+            estate.release()
+            released.append(estate)
+            log.info(
+                "Buyback time for %s has expired. The estate is now available for purchase.",
+                estate.name,
+            )
+        return released
@@ -0,0 +1,225 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple
+
+from monopoly.domain.entities.estate import BuildableEstate
+from monopoly.domain.entities.estate_state import MORTGAGED
+
+if TYPE_CHECKING:
+    from ..estate import Estate, EstateCategory, EstateId
+    from ..estate_state import EstateState
+    from ..player import Player, PlayerId
+
+
+def estate_ids(mask: int) -> Iterator["EstateId"]:
+    """
+    Identities of the estates in ``mask``, lowest first.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class MoveKind(Enum):
+    BUY = "buy"
+    MORTGAGE = "mortgage"
+    BUYBACK = "buyback"
+    BUILD = "build"
+    TRADE = "trade"
+
+
+class Move(NamedTuple):
+    kind: MoveKind
+    estate: "EstateId"
+    # Trades only: the other side and the estate received for ``estate``
+    partner: "PlayerId | None" = None
+    received: "EstateId | None" = None
+
+
+@dataclass(slots=True)
+class LegalMoves:
+    """
+    Every legal action of one player, as bitmasks over EstateId.
+
+    Trades are one estate for one estate with no cash, the pairs ``Player.trade_estates``
+    accepts under its 2x value rule; ``trades`` maps (partner, estate given) to the mask of
+    the partner's estates that may be received for it.
+    """
+
+    buy: int = 0
+    mortgage: int = 0
+    buyback: int = 0
+    build: int = 0
+    trades: dict[tuple["PlayerId", "EstateId"], int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return (
+            self.buy.bit_count() + self.mortgage.bit_count() + self.buyback.bit_count()
+            + self.build.bit_count() + sum(mask.bit_count() for mask in self.trades.values())
+        )
+
+    def __iter__(self) -> Iterator[Move]:
+        for kind, mask in (
+            (MoveKind.BUY, self.buy),
+            (MoveKind.MORTGAGE, self.mortgage),
+            (MoveKind.BUYBACK, self.buyback),
+            (MoveKind.BUILD, self.build),
+        ):
+            for estate_id in estate_ids(mask):
+                yield Move(kind, estate_id)
+        for (partner, given), received in self.trades.items():
+            for estate_id in estate_ids(received):
+                yield Move(MoveKind.TRADE, given, partner, estate_id)
+
+
+class _PriceIndex:
+    """
+    Estates sorted by one price column. ``at_most(amount)`` is the mask of estates costing
+    no more than ``amount`` and ``between(low, high)`` the mask of those within the bounds.
+    """
+
+    __slots__ = ("_prices", "_prefix")
+
+    def __init__(self, priced: Iterable[tuple[int, int]]):
+        ordered = sorted(priced)
+        self._prices = [price for price, _ in ordered]
+        self._prefix = [0]
+        for _, bit in ordered:
+            self._prefix.append(self._prefix[-1] | bit)
+
+    def at_most(self, amount: int) -> int:
+        return self._prefix[bisect_right(self._prices, amount)]
+
+    def between(self, low: int, high: int) -> int:
+        prefix = self._prefix
+        return prefix[bisect_right(self._prices, high)] & ~prefix[bisect_left(self._prices, low)]
+
+
+class MoveGenerator:
+    """
+    Legal-move generator over bitmasks of the estates of one game, bit ``i`` standing for
+    the estate with identity ``i``.
+
+    Ownership, mortgaged and fully built status are kept up to date by observing every
+    estate, and prices are indexed once, so ``legal_moves`` is a handful of bitwise
+    operations and bisections per player without visiting any Estate. Stars must change
+    through ``BuildableEstate.build_star`` for the generator to see them.
+    """
+
+    def __init__(self, estates: Iterable["Estate"], players: list["Player"]):
+        self._estates = list(estates)
+        self._players = players
+        self._owned: dict["PlayerId", int] = {}
+        self._unowned = 0
+        self._mortgaged = 0
+        self._fully_built = 0
+        self._buildable = 0
+        self._categories: dict["EstateCategory", int] = {}
+
+        for estate in self._estates:
+            bit = 1 << estate.identity
+            self._categories[estate.category] = self._categories.get(estate.category, 0) | bit
+            if isinstance(estate, BuildableEstate):
+                self._buildable |= bit
+            if estate.owner is None:
+                self._unowned |= bit
+            else:
+                self._owned[estate.owner] = self._owned.get(estate.owner, 0) | bit
+            self._sync_status(estate, bit)
+            estate.attach(self)
+
+        self._prices = _PriceIndex(
+            (estate.price, 1 << estate.identity) for estate in self._estates
+        )
+        self._buyback_prices = _PriceIndex(
+            (estate.buyback_price, 1 << estate.identity) for estate in self._estates
+        )
+        # Estates of the partner acceptable for each estate given in a one-for-one trade
+        self._trade_windows: dict["EstateId", int] = {
+            estate.identity: self._prices.between((estate.price + 1) // 2, 2 * estate.price)
+            for estate in self._estates
+        }
+
+    def detach(self) -> None:
+        for estate in self._estates:
+            estate.detach(self)
+
+    def reset(self) -> None:
+        """
+        Forget every owner, mortgage and star, for estates reset without notifications.
+        """
+        self._owned.clear()
+        self._unowned = 0
+        for estate in self._estates:
+            self._unowned |= 1 << estate.identity
+        self._mortgaged = 0
+        self._fully_built = 0
+
+    def estate_changed(
+        self, estate: "Estate", previous_owner: "PlayerId | None", previous_state: "EstateState"
+    ) -> None:
+        bit = 1 << estate.identity
+        owner = estate.owner
+        if previous_owner != owner:
+            if previous_owner is None:
+                self._unowned &= ~bit
+            else:
+                self._owned[previous_owner] &= ~bit
+            if owner is None:
+                self._unowned |= bit
+            else:
+                self._owned[owner] = self._owned.get(owner, 0) | bit
+        self._sync_status(estate, bit)
+
+    def _sync_status(self, estate: "Estate", bit: int) -> None:
+        if estate._state is MORTGAGED:
+            self._mortgaged |= bit
+        else:
+            self._mortgaged &= ~bit
+        if bit & self._buildable and estate.stars >= estate.max_stars:
+            self._fully_built |= bit
+        else:
+            self._fully_built &= ~bit
+
+    def owned(self, player_id: "PlayerId") -> int:
+        return self._owned.get(player_id, 0)
+
+    def complete(self, player_id: "PlayerId") -> int:
+        """
+        Mask of the categories ``player_id`` holds in full.
+        """
+        owned = self._owned.get(player_id, 0)
+        complete = 0
+        for members in self._categories.values():
+            if owned & members == members:
+                complete |= members
+        return complete
+
+    def legal_moves(self, player: "Player") -> LegalMoves:
+        identity = player.identity
+        funds = player.funds.amount
+        owned = self._owned.get(identity, 0)
+        unmortgaged = owned & ~self._mortgaged
+
+        trades: dict[tuple["PlayerId", "EstateId"], int] = {}
+        for partner in self._players:
+            if partner.identity == identity:
+                continue
+            theirs = self._owned.get(partner.identity, 0)
+            if not theirs:
+                continue
+            windows = self._trade_windows
+            for given in estate_ids(owned):
+                received = theirs & windows[given]
+                if received:
+                    trades[partner.identity, given] = received
+
+        return LegalMoves(
+            buy=self._unowned & self._prices.at_most(funds),
+            mortgage=unmortgaged,
+            buyback=owned & self._mortgaged & self._buyback_prices.at_most(funds),
+            build=unmortgaged & self._buildable & ~self._fully_built & self.complete(identity),
+            trades=trades,
+        )
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+from monopoly.domain.events import EventSink, PlayerEliminated
 
 if TYPE_CHECKING:
     from ..player import Player
@@ -7,8 +9,18 @@ if TYPE_CHECKING:
 @dataclass
 class PlayerManager:
     players: list["Player"]
+    eliminated: list["Player"] = field(default_factory=list)
+    events: EventSink | None = field(default=None, repr=False)
+
+    def advance_turns(self, take_turn: Callable[["Player"], None] | None = None):
+        # Mortgage countdowns are handled by the game's MortgageExpiry, not per player
+        if take_turn is None:
+            return
+        for player in list(self.players):
+            take_turn(player)
 
-    def advance_turns(self):
-        for player in self.players:
-            player.advance_turn()
-            # Here you can add a call to the player.take_turn(game) method
+    def eliminate(self, player: "Player"):
+        self.players.remove(player)
+        self.eliminated.append(player)
+        if self.events is not None:
+            self.events.emit(PlayerEliminated(player.identity))
@@ -0,0 +1,46 @@
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from monopoly.domain.entities.game.game import Game
+
+
+class GamePool:
+    """
+    Bounded pool of games built by ``factory``, for hosts and simulations that play many
+    short games on the same board. Released games are reset and kept for the next
+    ``acquire`` while fewer than ``max_size`` are idle; the rest are dropped, so a burst
+    does not pin memory for good.
+    """
+
+    def __init__(self, factory: Callable[[], Game], max_size: int = 16):
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        self.factory = factory
+        self.max_size = max_size
+        self._idle: list[Game] = []
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def acquire(self) -> Game:
+        if self._idle:
+            self.reused += 1
+            return self._idle.pop()
+        self.created += 1
+        return self.factory()
+
+    def release(self, game: Game) -> None:
+        if len(self._idle) >= self.max_size:
+            return
+        game.reset()
+        self._idle.append(game)
+
+    @contextmanager
+    def lease(self) -> Iterator[Game]:
+        game = self.acquire()
+        try:
+            yield game
+        finally:
+            self.release(game)
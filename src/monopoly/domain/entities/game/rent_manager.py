@@ -1,34 +1,51 @@
 from dataclasses import dataclass, field
-from decimal import Decimal
 import logging
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from ..estate import Estate, EstateCategory
 
+from monopoly.domain.entities.estate import RentLevel
+from monopoly.domain.events import EventSink, RentReduced
+from monopoly.domain.value_objects.rate import ZERO, Rate
 
 log = logging.getLogger(__name__)
 
 @dataclass
 class RentManager:
-    rent_reduction_step: Decimal = Decimal("0.10")
+    rent_reduction_step: Rate = Rate(1000)
     rent_reduction_interval_turns: int = 20
-    max_rent_reduction: Decimal = Decimal("0.50")
-    current_rent_reduction: Decimal = Decimal("0")
+    max_rent_reduction: Rate = Rate(5000)
     next_rent_reduction_turn: int = field(default=20)
+    events: EventSink | None = field(default=None, repr=False)
+    # Shared by every estate of the game; estates cache their rent per level epoch
+    level: RentLevel = field(default_factory=lambda: RentLevel(shared=True), repr=False)
+
+    def reset(self) -> None:
+        """
+        Back to no reduction, keeping the settings. The level object is kept too, as the
+        estates of the game share it.
+        """
+        self.next_rent_reduction_turn = self.rent_reduction_interval_turns
+        self.level.set(ZERO)
+
+    @property
+    def current_rent_reduction(self) -> Rate:
+        return self.level.reduction
+
+    @current_rent_reduction.setter
+    def current_rent_reduction(self, reduction: Rate) -> None:
+        self.level.set(reduction)
 
-    def reduce_rent(self, current_turn: int, estate_registry: dict["EstateCategory", set["Estate"]]):
+    def reduce_rent(self, current_turn: int):
         if (current_turn >= self.next_rent_reduction_turn and
             self.current_rent_reduction < self.max_rent_reduction):
             remaining_reduction = self.max_rent_reduction - self.current_rent_reduction
             reduction_step = min(self.rent_reduction_step, remaining_reduction)
-            for category, estates in estate_registry.items():
-                for estate in estates:
-                    estate.reduce_rent(percentage=reduction_step * 100)
             self.current_rent_reduction += reduction_step
             log.info(
-                f"Rent has been reduced by {reduction_step * 100}%. "
-                f"Current total reduction: {self.current_rent_reduction * 100}%.")
+                "Rent has been reduced by %s. Current total reduction: %s.",
+                reduction_step, self.current_rent_reduction)
             self.next_rent_reduction_turn += self.rent_reduction_interval_turns
+            if self.events is not None:
+                self.events.emit(RentReduced(
+                    reduction_step, self.current_rent_reduction, self.next_rent_reduction_turn
+                ))
             if self.current_rent_reduction >= self.max_rent_reduction:
                 log.info("Maximum rent reduction reached.")
@@ -0,0 +1,126 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+from monopoly.domain.entities.estate import BuildableEstate
+from monopoly.domain.value_objects.rate import BASIS_POINTS
+
+if TYPE_CHECKING:
+    from ..estate import Estate, EstateId, RentLevel
+    from .board_index import BoardIndex
+    from .tax_manager import TaxManager
+
+# Rent multiple of the base rent for each star level
+STAR_RENT_MULTIPLIERS = (1, 5, 15, 45, 60, 75)
+# An owner holding the whole category charges this multiple while the estate has no stars
+CATEGORY_RENT_MULTIPLIER = 2
+
+# Layout of one star level: [not complete, complete] x [in use, mortgaged]
+_COMPLETE = 2
+_MORTGAGED = 1
+_PER_STAR = 4
+
+
+def base_rent(rent: int, stars: int, complete: bool) -> int:
+    if stars:
+        return rent * STAR_RENT_MULTIPLIERS[stars]
+    return rent * CATEGORY_RENT_MULTIPLIER if complete else rent
+
+
+class RentTable:
+    """
+    Immutable rents of one board before the game's rent reduction and tax, for every
+    estate, star level (0..max_stars), category completion and mortgaged status.
+
+    The table only depends on the board definition, so every game on the same board
+    shares one instance: use ``RentTable.shared``.
+    """
+
+    __slots__ = ("_offsets", "_rents")
+
+    def __init__(self, board: Iterable[tuple["EstateId", int, int]]):
+        offsets: dict["EstateId", int] = {}
+        rents: list[int] = []
+        for identity, rent, max_stars in board:
+            offsets[identity] = len(rents)
+            for stars in range(max_stars + 1):
+                for complete in (False, True):
+                    rents += (base_rent(rent, stars, complete), 0)
+        self._offsets = offsets
+        self._rents = tuple(rents)
+
+    @classmethod
+    def shared(cls, estates: Iterable["Estate"]) -> "RentTable":
+        return _shared(tuple(sorted(
+            (estate.identity, estate.rent,
+             estate.max_stars if isinstance(estate, BuildableEstate) else 0)
+            for estate in estates
+        )))
+
+    def rent(
+        self,
+        estate_id: "EstateId",
+        stars: int = 0,
+        complete: bool = False,
+        mortgaged: bool = False,
+    ) -> int:
+        return self._rents[
+            self._offsets[estate_id]
+            + stars * _PER_STAR
+            + complete * _COMPLETE
+            + mortgaged * _MORTGAGED
+        ]
+
+    def __len__(self) -> int:
+        return len(self._rents)
+
+
+@lru_cache(maxsize=64)
+def _shared(board: tuple[tuple["EstateId", int, int], ...]) -> RentTable:
+    return RentTable(board)
+
+
+class RentEngine:
+    """
+    Rent owed on landing in one game: the shared table combined with the game's rent
+    reduction and tax rate. Both are basis-point rates, so a lookup is integer arithmetic
+    on the table entry.
+    """
+
+    __slots__ = ("table", "_rents", "_offsets", "_level", "_tax", "_index")
+
+    def __init__(
+        self, table: RentTable, level: "RentLevel", tax: "TaxManager", index: "BoardIndex"
+    ):
+        self.table = table
+        self._rents = table._rents
+        self._offsets = table._offsets
+        self._level = level
+        self._tax = tax
+        self._index = index
+
+    def owed(self, estate: "Estate") -> int:
+        """
+        Rent a visitor owes for landing on ``estate``; 0 when it is unowned or mortgaged.
+        """
+        owner = estate.owner
+        if owner is None or estate.is_mortgaged():
+            return 0
+        stars = estate.stars if isinstance(estate, BuildableEstate) else 0
+        complete = self._index.owns_category(owner, estate.category)
+        rent = self._rents[
+            self._offsets[estate.identity] + stars * _PER_STAR + complete * _COMPLETE
+        ]
+        return rent * self._level.keep // BASIS_POINTS
+
+    def tax(self, amount: int) -> int:
+        """
+        Tax withheld from a rent payment of ``amount``, rounded down like Funds.apply_rate.
+        """
+        return amount * self._tax.current_tax_rate.basis_points // BASIS_POINTS
+
+    def owner_share(self, estate: "Estate") -> int:
+        """
+        What the owner receives when a visitor pays the rent on ``estate`` in full.
+        """
+        owed = self.owed(estate)
+        return owed - self.tax(owed)
@@ -1,24 +1,30 @@
 import logging
-from dataclasses import dataclass
-from decimal import Decimal
+from dataclasses import dataclass, field
 
 from monopoly.domain.entities.game.time_manager import TimeManager
+from monopoly.domain.events import EventSink, TaxRateChanged
+from monopoly.domain.value_objects.rate import Rate
 
 log = logging.getLogger(__name__)
 
 @dataclass
 class TaxManager:
-    current_tax_rate: Decimal = Decimal("0")
+    current_tax_rate: Rate = Rate(0)
     tax_rate_updated: bool = False
-    tax_step: Decimal = Decimal("0.10")
-    max_tax_rate: Decimal = Decimal("0.99")
+    tax_step: Rate = Rate(1000)
+    max_tax_rate: Rate = Rate(9900)
+    events: EventSink | None = field(default=None, repr=False)
+
+    def reset(self) -> None:
+        self.current_tax_rate = Rate(0)
+        self.tax_rate_updated = False
 
     def update_tax_rate(self, time_manager: TimeManager):
         if (time_manager.elapsed_time() >= time_manager.tax_increase_start_after and
             not self.tax_rate_updated and
             self.current_tax_rate < self.max_tax_rate):
-            self.current_tax_rate += self.tax_step
-            if self.current_tax_rate > self.max_tax_rate:
-                self.current_tax_rate = self.max_tax_rate
+            self.current_tax_rate = min(self.current_tax_rate + self.tax_step, self.max_tax_rate)
             self.tax_rate_updated = True
-            log.info(f"The tax rate has been increased to {self.current_tax_rate * 100}%.")
+            if self.events is not None:
+                self.events.emit(TaxRateChanged(self.current_tax_rate))
+            log.info("The tax rate has been increased to %s.", self.current_tax_rate)
@@ -1,11 +1,36 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from typing import Callable
+
+Clock = Callable[[], datetime]
+
+# Time a VirtualClock starts at
+VIRTUAL_EPOCH = datetime(2000, 1, 1)
+
+
+@dataclass
+class VirtualClock:
+    """
+    Manually advanced clock for headless runs, so game time does not depend on wall time.
+    """
+
+    now: datetime = VIRTUAL_EPOCH
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def reset(self) -> None:
+        self.now = VIRTUAL_EPOCH
+
+    def advance(self, delta: timedelta) -> None:
+        self.now += delta
 
 
 @dataclass
 class TimeManager:
     fast_mode: bool = False
-    start_time: datetime = field(default_factory=datetime.now)
+    clock: Clock = datetime.now
+    start_time: datetime = field(init=False)
     end_time: datetime | None = None
     game_duration: timedelta = field(init=False)
 
@@ -14,6 +39,7 @@ class TimeManager:
     tax_increase_start_after: timedelta = field(init=False)
 
     def __post_init__(self):
+        self.start_time = self.clock()
         if self.fast_mode:
             self.bonus_disable_after = timedelta(minutes=31)
             self.rent_reduction_start_after = timedelta(minutes=41)
@@ -25,11 +51,21 @@ class TimeManager:
             self.tax_increase_start_after = timedelta(minutes=61)
             self.game_duration = timedelta(minutes=46)
 
+    def reset(self) -> None:
+        self.start_time = self.clock()
+        self.end_time = None
+
+    def now(self) -> datetime:
+        return self.clock()
+
     def elapsed_time(self) -> timedelta:
-        return datetime.now() - self.start_time
+        return self.clock() - self.start_time
+
+    def is_time_up(self) -> bool:
+        return self.elapsed_time() >= self.game_duration
 
     def is_game_over(self) -> bool:
         return bool(self.end_time)
 
     def end_game(self):
-        self.end_time = datetime.now()
\ No newline at end of file
+        self.end_time = self.clock()
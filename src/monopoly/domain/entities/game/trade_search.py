@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from itertools import chain
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from ..estate import Estate, EstateCategory
+    from ..player import Player
+    from .game import Game
+
+
+@dataclass(frozen=True, slots=True)
+class TradeOffer:
+    """
+    A trade ``Player.trade_estates`` accepts, from the searching player's side.
+    """
+
+    give: tuple["Estate", ...]
+    receive: tuple["Estate", ...]
+    funds_to_give: int = 0
+    funds_to_receive: int = 0
+
+    @property
+    def given(self) -> int:
+        return sum(estate.price for estate in self.give) + self.funds_to_give
+
+    @property
+    def received(self) -> int:
+        return sum(estate.price for estate in self.receive) + self.funds_to_receive
+
+    @property
+    def net_value(self) -> int:
+        """
+        Value handed over: estate prices and cash given, less the cash received.
+        """
+        return self.given - self.funds_to_receive
+
+
+def _descending(bits: int) -> Iterator[int]:
+    while bits:
+        top = bits.bit_length() - 1
+        yield top
+        bits ^= 1 << top
+
+
+def _ascending(bits: int) -> Iterator[int]:
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _subsets(
+    items: list["Estate"], reach: list[int], index: int, total: int
+) -> Iterator[tuple["Estate", ...]]:
+    """
+    Subsets of ``items[:index]`` whose prices add up to ``total``. ``reach[i]`` has bit s
+    set when some subset of the first i items sums to s, so no branch is a dead end.
+    """
+    if index == 0:
+        yield ()
+        return
+    if reach[index - 1] >> total & 1:
+        yield from _subsets(items, reach, index - 1, total)
+    item = items[index - 1]
+    rest = total - item.price
+    if rest >= 0 and reach[index - 1] >> rest & 1:
+        for subset in _subsets(items, reach, index - 1, rest):
+            yield (*subset, item)
+
+
+def find_trades(
+    player: "Player",
+    partner: "Player",
+    receive: Iterable["Estate"],
+    *,
+    keep: Iterable["Estate"] = (),
+    limit: int = 10,
+    budget: float = 0.05,
+    timer: Callable[[], float] = perf_counter,
+) -> list[TradeOffer]:
+    """
+    Legal trades in which ``partner`` hands over every estate of ``receive``, cheapest
+    first: ranked by ``net_value``, then by cash given.
+
+    The searching player pays with any subset of their estates outside ``keep`` plus cash,
+    and the partner may add cash. Subset sums over the estate prices are found with a DP
+    over bitsets, then the subsets are listed in rank order until ``limit`` offers are
+    found or ``budget`` seconds have passed; the offers found so far are returned either way.
+    """
+    started = timer()
+    wanted = tuple(receive)
+    if not wanted or any(estate.identity not in partner.estates for estate in wanted):
+        return []
+    kept = {estate.identity for estate in keep} | {estate.identity for estate in wanted}
+    items = sorted(
+        (estate for estate in player.estates.values() if estate.identity not in kept),
+        key=lambda estate: (estate.price, estate.identity),
+    )
+
+    reach = [1]
+    for estate in items:
+        reach.append(reach[-1] | reach[-1] << estate.price)
+    sums = reach[-1]
+
+    value = sum(estate.price for estate in wanted)
+    # Estate value given at which no cash changes hands and the 2x rule is just met
+    half = (value + 1) // 2
+    cash = player.funds.amount
+    lowest = max(0, half - cash)
+    highest = 2 * (value + partner.funds.amount)
+
+    below = sums & ((1 << half + 1) - 1) >> lowest << lowest
+    above = sums >> half + 1 << half + 1 & ((1 << highest + 1) - 1)
+
+    offers: list[TradeOffer] = []
+    # Below half the player tops up with cash and every total costs the same net value, so
+    # less cash ranks first; above it the net value grows with the estates given.
+    for total in chain(_descending(below), _ascending(above)):
+        funds_to_give = max(0, half - total)
+        funds_to_receive = max(0, (total + 1) // 2 - value)
+        for give in _subsets(items, reach, len(items), total):
+            offers.append(TradeOffer(give, wanted, funds_to_give, funds_to_receive))
+            if len(offers) >= limit or timer() - started > budget:
+                return offers
+        if timer() - started > budget:
+            break
+    return offers
+
+
+def trades_completing(
+    game: "Game", player: "Player", partner: "Player", category: "EstateCategory", **options
+) -> list[TradeOffer]:
+    """
+    Ranked trades with ``partner`` that leave ``player`` holding all of ``category``, or
+    none unless ``partner`` holds every estate of it ``player`` lacks. Options are those of
+    ``find_trades``.
+    """
+    members = game.estate_registry[category]
+    missing = [estate for estate in members if estate.identity not in player.estates]
+    if not missing or any(estate.identity not in partner.estates for estate in missing):
+        return []
+    return find_trades(player, partner, missing, keep=members, **options)
@@ -1,11 +1,26 @@
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, NewType
+from typing import TYPE_CHECKING, Iterable, NewType
 
-from monopoly.domain.exceptions.base import InsufficientFundsError
-from monopoly.domain.exceptions.estate_exc import TradeDifferenceExceededException, EstateNotOwnedException, \
-    TradeMustIncludeAtLeastOneEstateException
-from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.entities.estate_state import Action, refusal
+from monopoly.domain.entities.verdict import Verdict
+from monopoly.domain.events import (
+    EstateBought,
+    EstateBoughtBack,
+    EstateMortgaged,
+    EstatesTraded,
+    EventSink,
+    FundsTransferred,
+    FundsWithdrawn,
+)
+from monopoly.domain.exceptions.base import DomainError, InsufficientFundsError
+from monopoly.domain.exceptions.estate_exc import (
+    EstateNotOwnedException,
+    InvalidFundsException,
+    TradeDifferenceExceededException,
+    TradeMustIncludeAtLeastOneEstateException,
+)
+from monopoly.domain.value_objects.funds import Amount, Funds, to_amount
 
 if TYPE_CHECKING:
     from monopoly.domain.entities.estate import Estate, EstateId
@@ -21,51 +36,124 @@ class Player:
     identity: PlayerId
     funds: Funds
     estates: dict["EstateId", "Estate"] = field(default_factory=dict)
+    _events: EventSink | None = field(default=None, repr=False)
 
     def _add_estate(self, estate: "Estate") -> None:
         estate_id = estate.identity
         self.estates[estate_id] = estate
         estate.set_owner(self.identity)
-        log.info(f"Estate '{estate.name}' added to Player {self.identity}'s estates.")
+        log.info("Estate '%s' added to Player %s's estates.", estate.name, self.identity)
 
     def _remove_estate(self, estate: "Estate") -> None:
         estate_id = estate.identity
         if estate_id in self.estates:
             del self.estates[estate_id]
             estate.set_owner(None)
-            log.info(f"Estate '{estate.name}' removed from Player {self.identity}'s estates.")
-        else:
-            log.error(f"Player {self.identity} does not own estate '{estate.name}' and cannot remove it.")
-            raise EstateNotOwnedException(f"Player {self.identity} does not own estate '{estate.name}'.")
-
-    def buy_estate(self, estate: "Estate") -> None:
-        if self.funds.amount >= estate.price:
-            estate.buy(player_id=self.identity)
-            self.funds = self.funds.subtract(Funds(amount=estate.price))
-            self._add_estate(estate)
-            log.info(f"Player {self.identity} successfully bought {estate.name}")
+            log.info("Estate '%s' removed from Player %s's estates.", estate.name, self.identity)
         else:
             log.error(
-                f"Player {self.identity} does not have enough funds to purchase {estate.name}."
+                "Player %s does not own estate '%s' and cannot remove it.",
+                self.identity, estate.name,
             )
-            raise InsufficientFundsError(
-                f"Player {self.identity} does not have enough funds to purchase {estate.name}."
+            raise EstateNotOwnedException(
+                f"Player {self.identity} does not own estate '{estate.name}'."
             )
 
+    def can_buy(self, estate: "Estate") -> Verdict:
+        if self.funds.amount < estate.price:
+            return Verdict.INSUFFICIENT_FUNDS
+        return estate._state.check_buy(estate, self.identity)
+
+    def can_mortgage(self, estate: "Estate") -> Verdict:
+        return estate._state.check_mortgage(estate, self.identity)
+
+    def can_buyback(self, estate: "Estate") -> Verdict:
+        if self.funds.amount < estate.buyback_price:
+            return Verdict.INSUFFICIENT_FUNDS
+        return estate._state.check_buyback(estate, self.identity)
+
+    def can_trade(
+        self,
+        other_player: "Player",
+        estates_to_give: list["Estate"],
+        estates_to_receive: list["Estate"],
+        funds_to_give: Funds = Funds(amount=0),
+        funds_to_receive: Funds = Funds(amount=0),
+    ) -> Verdict:
+        if not estates_to_give and not estates_to_receive:
+            return Verdict.EMPTY_TRADE
+
+        total_given = funds_to_give.amount
+        for estate in estates_to_give:
+            if estate.identity not in self.estates:
+                return Verdict.NOT_YOURS_TO_GIVE
+            total_given += estate.price
+        total_received = funds_to_receive.amount
+        for estate in estates_to_receive:
+            if estate.identity not in other_player.estates:
+                return Verdict.NOT_THEIRS_TO_GIVE
+            total_received += estate.price
+
+        if total_given > 2 * total_received or total_received > 2 * total_given:
+            return Verdict.TRADE_IMBALANCED
+        if self.funds.amount < funds_to_give.amount:
+            return Verdict.INSUFFICIENT_FUNDS
+        if other_player.funds.amount < funds_to_receive.amount:
+            return Verdict.OTHER_INSUFFICIENT_FUNDS
+        return Verdict.OK
+
+    def buy_estate(self, estate: "Estate") -> None:
+        if verdict := self.can_buy(estate):
+            raise self._refusal(verdict, estate, Action.BUY)
+        estate.buy(player_id=self.identity)
+        self.funds = self.funds.subtract(estate.price)
+        self._add_estate(estate)
+        if self._events is not None:
+            self._events.emit(EstateBought(self.identity, estate.identity, estate.price))
+        log.info("Player %s successfully bought %s", self.identity, estate.name)
+
     def mortgage(self, estate: "Estate"):
         estate.mortgage(player_id=self.identity)
-        self.funds = self.funds.add(other=Funds(amount=estate.mortgage_price))
-        log.info(f"Player {self.identity} successfully mortgaged {estate.name}")
+        self.funds = self.funds.add(estate.mortgage_price)
+        if self._events is not None:
+            self._events.emit(EstateMortgaged(
+                self.identity, estate.identity, estate.mortgage_price, estate.turns_until_buyback
+            ))
+        log.info("Player %s successfully mortgaged %s", self.identity, estate.name)
 
-    def buyback(self, estate: "Estate"):
-        if self.funds.amount < estate.buyback_price:
-            log.info(f"Cannot buy back {estate.name}: Not enough funds.")
-            raise InsufficientFundsError(f"Player {self.identity} does not have enough funds to buy back {estate.name}.")
+    def mortgage_all(self, estates: Iterable["Estate"]) -> None:
+        """
+        Mortgage every estate of ``estates`` as one operation: either all of them are
+        mortgaged and the funds credited once, or none is and the first refusal is raised.
+        """
+        estates = list({estate.identity: estate for estate in estates}.values())
+        for estate in estates:
+            if verdict := self.can_mortgage(estate):
+                raise refusal(verdict, estate, Action.MORTGAGE)
+
+        raised = 0
+        for estate in estates:
+            estate.mortgage(player_id=self.identity)
+            raised += estate.mortgage_price
+            if self._events is not None:
+                self._events.emit(EstateMortgaged(
+                    self.identity, estate.identity,
+                    estate.mortgage_price, estate.turns_until_buyback,
+                ))
+        self.funds = self.funds.add(raised)
+        log.info("Player %s mortgaged %s estates for $%s", self.identity, len(estates), raised)
 
+    def buyback(self, estate: "Estate"):
+        if verdict := self.can_buyback(estate):
+            raise self._refusal(verdict, estate, Action.BUYBACK)
         estate.buyback(player_id=self.identity)
 
-        self.funds = self.funds.subtract(other=Funds(amount=estate.buyback_price))
-        log.info(f"Player {self.identity} successfully buybacked {estate.name}")
+        self.funds = self.funds.subtract(estate.buyback_price)
+        if self._events is not None:
+            self._events.emit(
+                EstateBoughtBack(self.identity, estate.identity, estate.buyback_price)
+            )
+        log.info("Player %s successfully buybacked %s", self.identity, estate.name)
 
     def advance_turn(self):
         for estate in self.estates.values():
@@ -73,7 +161,28 @@ class Player:
 
         self.estates = {estate_id: estate for estate_id, estate in self.estates.items() if estate.owner == self.identity}
 
-        log.info(f"Player {self.identity} estates after advance_turn: {[estate.name for estate in self.estates.values()]}")
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "Player %s estates after advance_turn: %s",
+                self.identity, [estate.name for estate in self.estates.values()],
+            )
+
+    def withdraw(self, amount: Amount) -> None:
+        value = to_amount(amount)
+        if self.funds.amount < value:
+            log.error("Player %s does not have enough funds to pay $%s.", self.identity, value)
+            raise InsufficientFundsError(
+                f"Player {self.identity} does not have enough funds to pay ${value}."
+            )
+        self.funds = self.funds.subtract(value)
+        if self._events is not None:
+            self._events.emit(FundsWithdrawn(self.identity, value))
+
+    def forfeit_estates(self) -> None:
+        for estate in self.estates.values():
+            estate.release()
+        self.estates = {}
+        log.info("Player %s forfeited all estates.", self.identity)
 
     def trade_estates(
         self,
@@ -83,63 +192,173 @@ class Player:
         funds_to_give: Funds = Funds(amount=0),
         funds_to_receive: Funds = Funds(amount=0),
     ) -> None:
-        total_given = sum(estate.price for estate in estates_to_give) + funds_to_give.amount
-        total_received = sum(estate.price for estate in estates_to_receive) + funds_to_receive.amount
-
-        log.debug(f"Player {self.identity} is attempting to trade with Player {other_player.identity}.")
-        log.debug(f"Total given: ${total_given}, Total received: ${total_received}")
+        log.debug(
+            "Player %s is attempting to trade with Player %s.",
+            self.identity, other_player.identity,
+        )
 
-        if not estates_to_give and not estates_to_receive:
-            log.error("Trade must include at least one estate to give or receive.")
-            raise TradeMustIncludeAtLeastOneEstateException()
-
-        for estate in estates_to_give:
-            estate_id = estate.identity
-            if estate_id not in self.estates:
-                log.error(f"Player {self.identity} does not own estate '{estate.name}' and cannot trade it.")
-                raise EstateNotOwnedException(estate.name, action="trade")
-
-        for estate in estates_to_receive:
-            estate_id = estate.identity
-            if estate_id not in other_player.estates:
-                log.error(f"Player {other_player.identity} does not own estate '{estate.name}' and cannot trade it.")
-                raise EstateNotOwnedException(estate.name, action="trade")
-
-        if total_given > 2 * total_received or total_received > 2 * total_given:
-            raise TradeDifferenceExceededException(
-                player_id=self.identity,
-                given=total_given,
-                received=total_received
+        verdict = self.can_trade(
+            other_player, estates_to_give, estates_to_receive, funds_to_give, funds_to_receive
+        )
+        if verdict:
+            raise self._trade_refusal(
+                verdict, other_player,
+                estates_to_give, estates_to_receive, funds_to_give, funds_to_receive,
             )
 
-        if self.funds.amount < funds_to_give.amount:
-            log.error(f"Player {self.identity} does not have enough funds to give ${funds_to_give.amount}.")
-            raise InsufficientFundsError(f"Player {self.identity} does not have enough funds to give ${funds_to_give.amount}.")
-        if other_player.funds.amount < funds_to_receive.amount:
-            log.error(f"Player {other_player.identity} does not have enough funds to give ${funds_to_receive.amount}.")
-            raise InsufficientFundsError(f"Player {other_player.identity} does not have enough funds to give ${funds_to_receive.amount}.")
-
         try:
             if funds_to_give.amount > 0:
                 self.funds = self.funds.subtract(funds_to_give)
                 other_player.funds = other_player.funds.add(funds_to_give)
-                log.info(f"Player {self.identity} gave ${funds_to_give.amount} to Player {other_player.identity}.")
+                log.info(
+                    "Player %s gave $%s to Player %s.",
+                    self.identity, funds_to_give.amount, other_player.identity,
+                )
 
             if funds_to_receive.amount > 0:
                 other_player.funds = other_player.funds.subtract(funds_to_receive)
                 self.funds = self.funds.add(funds_to_receive)
-                log.info(f"Player {other_player.identity} gave ${funds_to_receive.amount} to Player {self.identity}.")
+                log.info(
+                    "Player %s gave $%s to Player %s.",
+                    other_player.identity, funds_to_receive.amount, self.identity,
+                )
 
             for estate in estates_to_give:
                 self._remove_estate(estate)
                 other_player._add_estate(estate)
-                log.info(f"Player {self.identity} traded estate '{estate.name}' to Player {other_player.identity}.")
+                log.info(
+                    "Player %s traded estate '%s' to Player %s.",
+                    self.identity, estate.name, other_player.identity,
+                )
 
             for estate in estates_to_receive:
                 other_player._remove_estate(estate)
                 self._add_estate(estate)
-                log.info(f"Player {other_player.identity} traded estate '{estate.name}' to Player {self.identity}.")
+                log.info(
+                    "Player %s traded estate '%s' to Player %s.",
+                    other_player.identity, estate.name, self.identity,
+                )
 
         except Exception as e:
-            log.error(f"Trade failed: {e}")
+            log.error("Trade failed: %s", e)
             raise
+
+        if self._events is not None:
+            self._events.emit(EstatesTraded(
+                self.identity,
+                other_player.identity,
+                tuple(estate.identity for estate in estates_to_give),
+                tuple(estate.identity for estate in estates_to_receive),
+                funds_to_give.amount,
+                funds_to_receive.amount,
+            ))
+
+    def _refusal(self, verdict: Verdict, estate: "Estate", action: Action) -> DomainError:
+        if verdict is not Verdict.INSUFFICIENT_FUNDS:
+            return refusal(verdict, estate, action)
+        purpose = "purchase" if action is Action.BUY else "buy back"
+        log.error(
+            "Player %s does not have enough funds to %s %s.", self.identity, purpose, estate.name
+        )
+        return InsufficientFundsError(
+            f"Player {self.identity} does not have enough funds to {purpose} {estate.name}."
+        )
+
+    def _trade_refusal(
+        self,
+        verdict: Verdict,
+        other_player: "Player",
+        estates_to_give: list["Estate"],
+        estates_to_receive: list["Estate"],
+        funds_to_give: Funds,
+        funds_to_receive: Funds,
+    ) -> DomainError:
+        if verdict is Verdict.EMPTY_TRADE:
+            log.error("Trade must include at least one estate to give or receive.")
+            return TradeMustIncludeAtLeastOneEstateException()
+        if verdict is Verdict.NOT_YOURS_TO_GIVE or verdict is Verdict.NOT_THEIRS_TO_GIVE:
+            giver, estates = (
+                (self, estates_to_give) if verdict is Verdict.NOT_YOURS_TO_GIVE
+                else (other_player, estates_to_receive)
+            )
+            estate = next(estate for estate in estates if estate.identity not in giver.estates)
+            log.error(
+                "Player %s does not own estate '%s' and cannot trade it.",
+                giver.identity, estate.name,
+            )
+            return EstateNotOwnedException(estate.name, action="trade")
+        if verdict is Verdict.TRADE_IMBALANCED:
+            total_given = sum(estate.price for estate in estates_to_give) + funds_to_give.amount
+            total_received = (
+                sum(estate.price for estate in estates_to_receive) + funds_to_receive.amount
+            )
+            log.debug("Total given: $%s, Total received: $%s", total_given, total_received)
+            return TradeDifferenceExceededException(
+                player_id=self.identity,
+                given=total_given,
+                received=total_received
+            )
+        payer, amount = (
+            (self, funds_to_give) if verdict is Verdict.INSUFFICIENT_FUNDS
+            else (other_player, funds_to_receive)
+        )
+        log.error(
+            "Player %s does not have enough funds to give $%s.", payer.identity, amount.amount
+        )
+        return InsufficientFundsError(
+            f"Player {payer.identity} does not have enough funds to give ${amount.amount}."
+        )
+
+
+def transfer(payer: Player, payee: Player, amount: Amount) -> None:
+    value = to_amount(amount)
+    if value < 0:
+        raise InvalidFundsException(amount=value, action="transfer")
+    if payer.funds.amount < value:
+        log.error("Player %s does not have enough funds to pay $%s.", payer.identity, value)
+        raise InsufficientFundsError(
+            f"Player {payer.identity} does not have enough funds to pay ${value}."
+        )
+    # Both balances are computed before either player is changed
+    paid = payer.funds.subtract(value)
+    received = payee.funds.add(value)
+    payer.funds = paid
+    payee.funds = received
+    if payer._events is not None:
+        payer._events.emit(FundsTransferred(payer.identity, payee.identity, value))
+
+
+def transfer_many(transfers: Iterable[tuple[Player, Player, Amount]]) -> None:
+    """
+    Move money between several players at once. Only each player's net change is applied,
+    and nothing is applied unless every payer can cover its net debit.
+    """
+    players: dict[int, Player] = {}
+    balances: dict[int, int] = {}
+    events: list[tuple[Player, FundsTransferred]] = []
+    for payer, payee, amount in transfers:
+        value = to_amount(amount)
+        if value < 0:
+            raise InvalidFundsException(amount=value, action="transfer")
+        if payer._events is not None:
+            events.append((payer, FundsTransferred(payer.identity, payee.identity, value)))
+        players[id(payer)] = payer
+        players[id(payee)] = payee
+        balances[id(payer)] = balances.get(id(payer), 0) - value
+        balances[id(payee)] = balances.get(id(payee), 0) + value
+
+    for key, balance in balances.items():
+        player = players[key]
+        if player.funds.amount + balance < 0:
+            log.error(
+                "Player %s does not have enough funds to pay $%s.", player.identity, -balance
+            )
+            raise InsufficientFundsError(
+                f"Player {player.identity} does not have enough funds to pay ${-balance}."
+            )
+
+    for key, balance in balances.items():
+        if balance:
+            players[key].funds = players[key].funds.add(balance)
+    for payer, event in events:
+        payer._events.emit(event)
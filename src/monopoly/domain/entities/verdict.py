@@ -0,0 +1,24 @@
+from enum import IntEnum
+
+
+class Verdict(IntEnum):
+    """
+    Outcome of a legality check such as ``Player.can_buy``. OK is 0 and every refusal is
+    truthy, so ``if verdict:`` reads as "if refused". Checks return these shared members
+    and never raise, log or allocate.
+    """
+
+    OK = 0
+    NOT_OWNED = 1
+    ALREADY_OWNED = 2
+    NOT_OWNER = 3
+    MORTGAGED = 4
+    NOT_MORTGAGED = 5
+    INSUFFICIENT_FUNDS = 6
+    # The other side of a trade cannot pay its share
+    OTHER_INSUFFICIENT_FUNDS = 7
+    EMPTY_TRADE = 8
+    # An estate offered in a trade is not owned by the side giving it
+    NOT_YOURS_TO_GIVE = 9
+    NOT_THEIRS_TO_GIVE = 10
+    TRADE_IMBALANCED = 11
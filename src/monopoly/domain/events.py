@@ -0,0 +1,191 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import ClassVar, Protocol
+
+from monopoly.domain.value_objects.rate import Rate
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_micros(moment: datetime) -> int:
+    """
+    Game clocks are naive, so times are stored as exact microseconds from a naive epoch.
+    """
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def from_micros(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+class DomainEvent:
+    """
+    Base of every event emitted by the domain. ``layout`` lists the field encodings used
+    by the journal: i = int, r = Rate, t = tuple of ints.
+    """
+
+    __slots__ = ()
+    layout: ClassVar[str] = ""
+
+
+class EventSink(Protocol):
+    def emit(self, event: DomainEvent) -> None: ...
+
+
+class EventBus:
+    """
+    Fans events out to several sinks.
+    """
+
+    def __init__(self, *sinks: EventSink):
+        self.sinks = list(sinks)
+
+    def subscribe(self, sink: EventSink) -> None:
+        self.sinks.append(sink)
+
+    def unsubscribe(self, sink: EventSink) -> None:
+        self.sinks.remove(sink)
+
+    def emit(self, event: DomainEvent) -> None:
+        for sink in self.sinks:
+            sink.emit(event)
+
+
+# Player
+
+
+@dataclass(frozen=True, slots=True)
+class EstateBought(DomainEvent):
+    layout: ClassVar[str] = "iii"
+    player_id: int
+    estate_id: int
+    price: int
+
+
+@dataclass(frozen=True, slots=True)
+class EstateMortgaged(DomainEvent):
+    layout: ClassVar[str] = "iiii"
+    player_id: int
+    estate_id: int
+    amount: int
+    turns_until_buyback: int
+
+
+@dataclass(frozen=True, slots=True)
+class EstateBoughtBack(DomainEvent):
+    layout: ClassVar[str] = "iii"
+    player_id: int
+    estate_id: int
+    amount: int
+
+
+@dataclass(frozen=True, slots=True)
+class EstatesTraded(DomainEvent):
+    layout: ClassVar[str] = "iittii"
+    player_id: int
+    other_player_id: int
+    given: tuple[int, ...]
+    received: tuple[int, ...]
+    funds_given: int
+    funds_received: int
+
+
+@dataclass(frozen=True, slots=True)
+class FundsTransferred(DomainEvent):
+    layout: ClassVar[str] = "iii"
+    payer_id: int
+    payee_id: int
+    amount: int
+
+
+@dataclass(frozen=True, slots=True)
+class FundsWithdrawn(DomainEvent):
+    layout: ClassVar[str] = "ii"
+    player_id: int
+    amount: int
+
+
+# Estate state machine
+
+
+@dataclass(frozen=True, slots=True)
+class BuybackCountdown(DomainEvent):
+    layout: ClassVar[str] = "ii"
+    estate_id: int
+    turns_until_buyback: int
+
+
+@dataclass(frozen=True, slots=True)
+class EstateReleased(DomainEvent):
+    layout: ClassVar[str] = "i"
+    estate_id: int
+
+
+# Game and managers
+
+
+@dataclass(frozen=True, slots=True)
+class GameStarted(DomainEvent):
+    layout: ClassVar[str] = "ii"
+    starting_funds: int
+    start_time: int
+
+
+@dataclass(frozen=True, slots=True)
+class TurnStarted(DomainEvent):
+    layout: ClassVar[str] = "i"
+    turn: int
+
+
+@dataclass(frozen=True, slots=True)
+class TaxRateChanged(DomainEvent):
+    layout: ClassVar[str] = "r"
+    rate: Rate
+
+
+@dataclass(frozen=True, slots=True)
+class RentReduced(DomainEvent):
+    layout: ClassVar[str] = "rri"
+    step: Rate
+    total: Rate
+    next_reduction_turn: int
+
+
+@dataclass(frozen=True, slots=True)
+class StartPassed(DomainEvent):
+    layout: ClassVar[str] = "ii"
+    player_id: int
+    bonus: int
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerEliminated(DomainEvent):
+    layout: ClassVar[str] = "i"
+    player_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class GameEnded(DomainEvent):
+    layout: ClassVar[str] = "ii"
+    winner_id: int
+    end_time: int
+
+
+EVENT_TYPES: tuple[type[DomainEvent], ...] = (
+    EstateBought,
+    EstateMortgaged,
+    EstateBoughtBack,
+    EstatesTraded,
+    FundsTransferred,
+    FundsWithdrawn,
+    BuybackCountdown,
+    EstateReleased,
+    GameStarted,
+    TurnStarted,
+    TaxRateChanged,
+    RentReduced,
+    StartPassed,
+    PlayerEliminated,
+    GameEnded,
+)
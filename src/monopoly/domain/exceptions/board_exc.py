@@ -0,0 +1,7 @@
+from .base import DomainError
+
+
+class InvalidBoardException(DomainError):
+    def __init__(self, reason: str):
+        self.message = f"Invalid board definition: {reason}"
+        super().__init__(self.message)
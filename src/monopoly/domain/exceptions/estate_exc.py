@@ -25,6 +25,14 @@ class EstateAlreadyOwnedException(DomainError):
         self.message = f"Estate '{estate_name}' is already owned by another player."
         super().__init__(self.message)
 
+class SharedRentLevelException(DomainError):
+    def __init__(self, estate_name: str):
+        self.message = (
+            f"The rent of '{estate_name}' follows its game's rent level. "
+            f"Reduce it through the RentManager."
+        )
+        super().__init__(self.message)
+
 class EstatePermissionException(DomainError):
     def __init__(self, estate_name: str, action: str = "perform the action"):
         self.message = f"Cannot {action} '{estate_name}': permission denied."
@@ -46,6 +54,11 @@ class InvalidFundsException(DomainError):
         self.message = f"Invalid funds amount: {amount}. Cannot {action}."
         super().__init__(self.message)
 
+class InvalidRateException(DomainError):
+    def __init__(self, value: object, reason: str = "rates cannot be negative"):
+        self.message = f"Invalid rate: {value}. {reason.capitalize()}."
+        super().__init__(self.message)
+
 class TradeMustIncludeAtLeastOneEstateException(DomainError):
     def __init__(self):
         self.message = "Trade must include at least one estate."
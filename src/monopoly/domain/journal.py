@@ -0,0 +1,418 @@
+import struct
+from dataclasses import fields
+from operator import attrgetter
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterator
+
+from monopoly.domain.entities.estate_state import MORTGAGED, OWNED
+from monopoly.domain.events import (
+    EVENT_TYPES,
+    BuybackCountdown,
+    DomainEvent,
+    EstateBought,
+    EstateBoughtBack,
+    EstateMortgaged,
+    EstateReleased,
+    EstatesTraded,
+    FundsTransferred,
+    FundsWithdrawn,
+    GameEnded,
+    GameStarted,
+    PlayerEliminated,
+    RentReduced,
+    StartPassed,
+    TaxRateChanged,
+    TurnStarted,
+    from_micros,
+)
+from monopoly.domain.exceptions.base import DomainError
+from monopoly.domain.snapshot import dump, restore_into
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+if TYPE_CHECKING:
+    from monopoly.domain.entities.estate import Estate
+    from monopoly.domain.entities.game.game import Game
+    from monopoly.domain.entities.player import Player
+
+MAGIC = b"MNPJ"
+# 2: rates are stored as basis points instead of Decimal strings
+VERSION = 2
+SNAPSHOT = 0
+
+_HEADER = struct.Struct("<4sH")
+_RECORD = struct.Struct("<IB")
+_INT = struct.Struct("<q")
+_COUNT = struct.Struct("<H")
+
+
+class JournalError(DomainError):
+    pass
+
+
+# Codec
+
+
+class _Codec:
+    """
+    Binary encoding of one event type. Events made only of ints use a single precompiled
+    struct; the rest are encoded field by field. Rates are written as basis points.
+    """
+
+    def __init__(self, kind: int, event_type: type[DomainEvent]):
+        self.kind = kind
+        self.event_type = event_type
+        names = [field.name for field in fields(event_type)]
+        getter = attrgetter(*names)
+        self.fields: Callable[[DomainEvent], tuple] = (
+            getter if len(names) > 1 else lambda event: (getter(event),)
+        )
+        layout = event_type.layout
+        self.fixed = struct.Struct("<" + "q" * len(layout)) if set(layout) <= {"i"} else None
+        # Record header and payload packed in one call for fixed layouts
+        self._record = struct.Struct(_RECORD.format + "q" * len(layout)) if self.fixed else None
+
+    def record(self, event: DomainEvent) -> bytes:
+        if self._record is not None:
+            return self._record.pack(self.fixed.size, self.kind, *self.fields(event))
+        payload = self.encode(event)
+        return _RECORD.pack(len(payload), self.kind) + payload
+
+    def encode(self, event: DomainEvent) -> bytes:
+        if self.fixed is not None:
+            return self.fixed.pack(*self.fields(event))
+        parts = []
+        for code, value in zip(self.event_type.layout, self.fields(event)):
+            if code == "i":
+                parts.append(_INT.pack(value))
+            elif code == "r":
+                parts.append(_INT.pack(value.basis_points))
+            else:
+                parts.append(_COUNT.pack(len(value)) + struct.pack(f"<{len(value)}q", *value))
+        return b"".join(parts)
+
+    def decode(self, buffer: bytes | memoryview, offset: int) -> tuple:
+        if self.fixed is not None:
+            return self.fixed.unpack_from(buffer, offset)
+        values = []
+        for code in self.event_type.layout:
+            if code == "i":
+                values.append(_INT.unpack_from(buffer, offset)[0])
+                offset += _INT.size
+            elif code == "r":
+                values.append(Rate.of(_INT.unpack_from(buffer, offset)[0]))
+                offset += _INT.size
+            else:
+                (length,) = _COUNT.unpack_from(buffer, offset)
+                offset += _COUNT.size
+                values.append(struct.unpack_from(f"<{length}q", buffer, offset))
+                offset += length * _INT.size
+        return tuple(values)
+
+
+CODECS = tuple(_Codec(kind, event_type) for kind, event_type in enumerate(EVENT_TYPES, start=1))
+_CODEC_BY_TYPE = {codec.event_type: codec for codec in CODECS}
+
+
+def encode_event(event: DomainEvent) -> bytes:
+    return _CODEC_BY_TYPE[type(event)].record(event)
+
+
+def _players(game: "Game") -> dict[int, "Player"]:
+    return {
+        player.identity: player
+        for player in (*game.players, *game.player_manager.eliminated)
+    }
+
+
+def _estates(game: "Game") -> dict[int, "Estate"]:
+    return {
+        estate.identity: estate
+        for estates in game.estate_registry.values()
+        for estate in estates
+    }
+
+
+# Writing
+
+
+class JournalWriter:
+    """
+    Append-only binary log of a game's events.
+
+    The writer attaches itself as the game's event sink. It writes a snapshot when attached
+    and then one before every ``snapshot_every``-th turn, so replay to any turn only has to
+    apply the events since the closest earlier snapshot.
+    """
+
+    def __init__(self, target: str | BinaryIO, game: "Game", snapshot_every: int = 100):
+        if isinstance(target, str):
+            self._file = open(target, "wb")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+        self.game = game
+        self.snapshot_every = snapshot_every
+        self._write = self._file.write
+
+        self._write(_HEADER.pack(MAGIC, VERSION))
+        self.snapshot(game.current_turn)
+        game.attach_events(self)
+
+    def emit(self, event: DomainEvent) -> None:
+        if type(event) is TurnStarted and event.turn % self.snapshot_every == 0:
+            # current_turn is already incremented; nothing else of the turn has run yet
+            self.snapshot(event.turn - 1)
+        self._write(_CODEC_BY_TYPE[type(event)].record(event))
+
+    def snapshot(self, turn: int) -> None:
+        payload = _INT.pack(turn) + dump(self.game, turn)
+        self._write(_RECORD.pack(len(payload), SNAPSHOT) + payload)
+
+    def close(self) -> None:
+        if self.game.events is self:
+            self.game.attach_events(None)
+        self._file.flush()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "JournalWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Reading
+
+
+class Journal:
+    """
+    A journal loaded into memory. Iterating yields events and ``(turn, snapshot)`` pairs,
+    snapshots in the ``monopoly.domain.snapshot`` format, in the order they were written.
+    """
+
+    def __init__(self, data: bytes):
+        if len(data) < _HEADER.size:
+            raise JournalError("Journal is truncated.")
+        magic, version = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise JournalError("Not a game journal.")
+        if version != VERSION:
+            raise JournalError(f"Unsupported journal version {version}.")
+        self.data = data
+        self.snapshots: list[tuple[int, int]] = []
+        self._index()
+
+    @classmethod
+    def load(cls, path: str) -> "Journal":
+        with open(path, "rb") as file:
+            return cls(file.read())
+
+    def _index(self) -> None:
+        # Record headers only: payloads are skipped, snapshots are remembered by offset
+        data = self.data
+        offset = _HEADER.size
+        end = len(data)
+        unpack = _RECORD.unpack_from
+        while offset < end:
+            if offset + _RECORD.size > end:
+                raise JournalError(f"Truncated record at offset {offset}.")
+            length, kind = unpack(data, offset)
+            if kind == SNAPSHOT:
+                self.snapshots.append((_INT.unpack_from(data, offset + _RECORD.size)[0], offset))
+            offset += _RECORD.size + length
+        if offset != end:
+            raise JournalError("Journal ends inside a record.")
+
+    def records(self, offset: int = _HEADER.size) -> Iterator[tuple[int, tuple | int, int]]:
+        """
+        Raw ``(kind, fields, next_offset)`` records from ``offset``; snapshots yield their turn.
+        """
+        data = self.data
+        end = len(data)
+        unpack = _RECORD.unpack_from
+        while offset < end:
+            length, kind = unpack(data, offset)
+            start = offset + _RECORD.size
+            offset = start + length
+            if kind == SNAPSHOT:
+                yield kind, _INT.unpack_from(data, start)[0], offset
+            else:
+                yield kind, CODECS[kind - 1].decode(data, start), offset
+
+    def __iter__(self) -> Iterator[DomainEvent | tuple[int, bytes]]:
+        for kind, fields, offset in self.records():
+            if kind == SNAPSHOT:
+                yield fields, self.state_at(offset)
+            else:
+                yield EVENT_TYPES[kind - 1](*fields)
+
+    def state_at(self, next_offset: int) -> bytes:
+        for _, offset in self.snapshots:
+            length, _ = _RECORD.unpack_from(self.data, offset)
+            if offset + _RECORD.size + length == next_offset:
+                start = offset + _RECORD.size + _INT.size
+                return self.data[start:offset + _RECORD.size + length]
+        raise JournalError(f"No snapshot ends at offset {next_offset}.")
+
+    def snapshot_before(self, turn: int | None) -> tuple[int, int]:
+        """
+        ``(turn, offset)`` of the latest snapshot taken at or before ``turn``.
+        """
+        best = None
+        for snapshot_turn, offset in self.snapshots:
+            if turn is not None and snapshot_turn > turn:
+                break
+            best = snapshot_turn, offset
+        if best is None:
+            raise JournalError(f"The journal has no snapshot before turn {turn}.")
+        return best
+
+
+# Replay
+
+
+def replay(journal: Journal | str, game: "Game", turn: int | None = None) -> "Game":
+    """
+    Rebuild the state at the end of ``turn`` (or of the whole journal) onto ``game``, a
+    fresh game over the same board and seats. Events are applied directly; no game rule
+    is re-executed.
+    """
+    if isinstance(journal, str):
+        journal = Journal.load(journal)
+    _, offset = journal.snapshot_before(turn)
+    length, _ = _RECORD.unpack_from(journal.data, offset)
+    next_offset = offset + _RECORD.size + length
+    restore_into(game, journal.state_at(next_offset))
+
+    apply = _Replayer(game).handlers
+    for kind, fields, _ in journal.records(next_offset):
+        if kind == SNAPSHOT:
+            continue
+        if kind == _TURN_STARTED and turn is not None and fields[0] > turn:
+            break
+        apply[kind](*fields)
+    return game
+
+
+_TURN_STARTED = EVENT_TYPES.index(TurnStarted) + 1
+
+
+class _Replayer:
+    def __init__(self, game: "Game"):
+        self.game = game
+        self.players = _players(game)
+        self.estates = _estates(game)
+        handlers = {
+            EstateBought: self.estate_bought,
+            EstateMortgaged: self.estate_mortgaged,
+            EstateBoughtBack: self.estate_bought_back,
+            EstatesTraded: self.estates_traded,
+            FundsTransferred: self.funds_transferred,
+            FundsWithdrawn: self.funds_withdrawn,
+            BuybackCountdown: self.buyback_countdown,
+            EstateReleased: self.estate_released,
+            GameStarted: self.game_started,
+            TurnStarted: self.turn_started,
+            TaxRateChanged: self.tax_rate_changed,
+            RentReduced: self.rent_reduced,
+            StartPassed: self.start_passed,
+            PlayerEliminated: self.player_eliminated,
+            GameEnded: self.game_ended,
+        }
+        self.handlers = [None] + [handlers[event_type] for event_type in EVENT_TYPES]
+
+    def estate_bought(self, player_id: int, estate_id: int, price: int) -> None:
+        player = self.players[player_id]
+        estate = self.estates[estate_id]
+        player.funds = player.funds.subtract(price)
+        estate.set_owner(player.identity)
+        estate._set_state(OWNED)
+        player.estates[estate.identity] = estate
+
+    def estate_mortgaged(self, player_id: int, estate_id: int, amount: int, turns: int) -> None:
+        player = self.players[player_id]
+        estate = self.estates[estate_id]
+        player.funds = player.funds.add(amount)
+        estate.turns_until_buyback = turns
+        estate._set_state(MORTGAGED)
+
+    def estate_bought_back(self, player_id: int, estate_id: int, amount: int) -> None:
+        player = self.players[player_id]
+        estate = self.estates[estate_id]
+        player.funds = player.funds.subtract(amount)
+        estate.turns_until_buyback = 0
+        estate._set_state(OWNED)
+
+    def estates_traded(
+        self,
+        player_id: int,
+        other_player_id: int,
+        given: tuple[int, ...],
+        received: tuple[int, ...],
+        funds_given: int,
+        funds_received: int,
+    ) -> None:
+        player = self.players[player_id]
+        other = self.players[other_player_id]
+        player.funds = player.funds.subtract(funds_given).add(funds_received)
+        other.funds = other.funds.add(funds_given).subtract(funds_received)
+        for estate_id in given:
+            self._move(self.estates[estate_id], player, other)
+        for estate_id in received:
+            self._move(self.estates[estate_id], other, player)
+
+    @staticmethod
+    def _move(estate: "Estate", source: "Player", target: "Player") -> None:
+        del source.estates[estate.identity]
+        target.estates[estate.identity] = estate
+        estate.set_owner(target.identity)
+
+    def funds_transferred(self, payer_id: int, payee_id: int, amount: int) -> None:
+        payer = self.players[payer_id]
+        payee = self.players[payee_id]
+        payer.funds = payer.funds.subtract(amount)
+        payee.funds = payee.funds.add(amount)
+
+    def funds_withdrawn(self, player_id: int, amount: int) -> None:
+        player = self.players[player_id]
+        player.funds = player.funds.subtract(amount)
+
+    def buyback_countdown(self, estate_id: int, turns: int) -> None:
+        self.estates[estate_id].turns_until_buyback = turns
+
+    def estate_released(self, estate_id: int) -> None:
+        estate = self.estates[estate_id]
+        if estate.owner is not None:
+            self.players[estate.owner].estates.pop(estate.identity, None)
+        estate.release()
+
+    def game_started(self, starting_funds: int, start_time: int) -> None:
+        for player in self.game.players:
+            player.funds = Funds.of(starting_funds)
+        self.game.time_manager.start_time = from_micros(start_time)
+
+    def turn_started(self, turn: int) -> None:
+        self.game.current_turn = turn
+
+    def tax_rate_changed(self, rate: Rate) -> None:
+        self.game.tax_manager.current_tax_rate = rate
+        self.game.tax_manager.tax_rate_updated = True
+
+    def rent_reduced(self, step: Rate, total: Rate, next_reduction_turn: int) -> None:
+        self.game.rent_manager.current_rent_reduction = total
+        self.game.rent_manager.next_rent_reduction_turn = next_reduction_turn
+
+    def start_passed(self, player_id: int, bonus: int) -> None:
+        player = self.players[player_id]
+        player.funds = player.funds.add(bonus)
+
+    def player_eliminated(self, player_id: int) -> None:
+        player = self.players[player_id]
+        self.game.players.remove(player)
+        self.game.player_manager.eliminated.append(player)
+
+    def game_ended(self, winner_id: int, end_time: int) -> None:
+        self.game.winner = self.players[winner_id]
+        self.game.time_manager.end_time = from_micros(end_time)
@@ -0,0 +1,40 @@
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+DOMAIN_LOGGER = "monopoly.domain"
+
+
+def domain_loggers() -> list[logging.Logger]:
+    manager = logging.Logger.manager
+    return [
+        logger
+        for name, logger in list(manager.loggerDict.items())
+        if isinstance(logger, logging.Logger)
+        and (name == DOMAIN_LOGGER or name.startswith(DOMAIN_LOGGER + "."))
+    ]
+
+
+def set_domain_log_level(level: int) -> None:
+    """
+    Set the threshold for all domain records. Domain log calls use %-style arguments,
+    so nothing below the threshold is ever formatted.
+    """
+    logging.getLogger(DOMAIN_LOGGER).setLevel(level)
+
+
+@contextmanager
+def silent_simulation() -> Iterator[None]:
+    """
+    Disable every domain logger while the block runs. A disabled logger rejects a record
+    on its first check, before any level lookup or record creation, which keeps the
+    turn loop free of logging work.
+    """
+    loggers = [logger for logger in domain_loggers() if not logger.disabled]
+    for logger in loggers:
+        logger.disabled = True
+    try:
+        yield
+    finally:
+        for logger in loggers:
+            logger.disabled = False
@@ -0,0 +1,229 @@
+import functools
+import os
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterator
+
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.rent_manager import RentManager
+from monopoly.domain.entities.game.tax_manager import TaxManager
+from monopoly.domain.entities.player import Player
+from monopoly.domain.exceptions.base import DomainError
+
+# Upper bounds in seconds of the latency buckets, from 1us to 1s
+LATENCY_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 1e-2, 1e-1, 1.0,
+)
+
+# Latency is timed on one call in this many by default; calls and rejections are exact
+SAMPLE_EVERY = 16
+
+# Domain operations instrumented while metrics are installed: class, method, label
+OPERATIONS: tuple[tuple[type, str, str], ...] = (
+    (Player, "buy_estate", "buy"),
+    (Player, "mortgage", "mortgage"),
+    (Player, "buyback", "buyback"),
+    (Player, "trade_estates", "trade"),
+    (Game, "advance_turn", "advance_turn"),
+    (TaxManager, "update_tax_rate", "tax_update"),
+    (RentManager, "reduce_rent", "rent_update"),
+    (Game, "end_game", "game_end"),
+)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Histogram:
+    """
+    Observations counted into fixed buckets; ``counts[i]`` holds those up to
+    ``bounds[i]`` and above the previous bound, the last slot everything larger.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms by name and labels, exported in the Prometheus text format.
+    """
+
+    def __init__(self):
+        # name -> (type, help, metrics by labels)
+        self._families: dict[str, tuple[str, str, dict[Labels, Any]]] = {}
+
+    def counter(self, name: str, help: str, **labels: str) -> Counter:
+        return self._metric(name, "counter", help, labels, Counter)
+
+    def histogram(self, name: str, help: str, **labels: str) -> Histogram:
+        return self._metric(name, "histogram", help, labels, Histogram)
+
+    def _metric(self, name: str, kind: str, help: str, labels: dict[str, str], factory):
+        family = self._families.setdefault(name, (kind, help, {}))
+        if family[0] != kind:
+            raise ValueError(f"metric {name} is a {family[0]}, not a {kind}")
+        key = tuple(sorted(labels.items()))
+        metrics = family[2]
+        if key not in metrics:
+            metrics[key] = factory()
+        return metrics[key]
+
+    def snapshot(self) -> str:
+        lines: list[str] = []
+        for name, (kind, help, metrics) in sorted(self._families.items()):
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, metric in sorted(metrics.items()):
+                if kind == "counter":
+                    lines.append(f"{name}{_labels(labels)} {metric.value}")
+                    continue
+                cumulative = 0
+                for bound, count in zip((*metric.bounds, "+Inf"), metric.counts):
+                    cumulative += count
+                    le = bound if isinstance(bound, str) else format(bound, "g")
+                    lines.append(f"{name}_bucket{_labels((*labels, ('le', le)))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {metric.sum!r}")
+                lines.append(f"{name}_count{_labels(labels)} {metric.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write the snapshot to ``path`` atomically, for a node exporter's textfile collector.
+        """
+        path = Path(path)
+        partial = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        partial.write_text(self.snapshot(), encoding="utf-8")
+        os.replace(partial, path)
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Registry, sampling and wrapped methods of the installation, and the installs it answers
+_installed: (
+    tuple[MetricsRegistry, int, list[tuple[type, str, Callable[..., Any]]]] | None
+) = None
+_installs = 0
+
+
+def install(registry: MetricsRegistry, sample_every: int = SAMPLE_EVERY) -> None:
+    """
+    Count every call of the domain operations in OPERATIONS into ``registry``, with its
+    rejections by DomainError subclass, and time one call in ``sample_every`` (a power of
+    two; 1 times them all). Methods are wrapped on the classes while installed and
+    restored by ``uninstall``, so metrics that are not installed cost nothing.
+
+    The wrapping is process-wide. Installing the same registry again only counts, and the
+    methods are restored by the last matching ``uninstall``; installing another registry,
+    or other sampling, meanwhile raises RuntimeError.
+    """
+    global _installed, _installs
+    if sample_every < 1 or sample_every & (sample_every - 1):
+        raise ValueError(f"sample_every must be a power of two, not {sample_every}")
+    if _installed is not None:
+        if _installed[0] is not registry or _installed[1] != sample_every:
+            raise RuntimeError("metrics are already installed into another registry")
+        _installs += 1
+        return
+    originals = []
+    for cls, method, operation in OPERATIONS:
+        original = cls.__dict__[method]
+        originals.append((cls, method, original))
+        setattr(cls, method, _instrumented(original, operation, registry, sample_every - 1))
+    _installed = (registry, sample_every, originals)
+    _installs = 1
+
+
+def uninstall() -> None:
+    global _installed, _installs
+    if _installed is None:
+        return
+    _installs -= 1
+    if _installs:
+        return
+    for cls, method, original in _installed[2]:
+        setattr(cls, method, original)
+    _installed = None
+
+
+@contextmanager
+def instrumented(
+    registry: MetricsRegistry, sample_every: int = SAMPLE_EVERY
+) -> Iterator[MetricsRegistry]:
+    install(registry, sample_every)
+    try:
+        yield registry
+    finally:
+        uninstall()
+
+
+def _instrumented(
+    function: Callable[..., Any], operation: str, registry: MetricsRegistry, mask: int
+):
+    calls = registry.counter(
+        "monopoly_operations_total", "Domain operations called.", operation=operation
+    )
+    latency = registry.histogram(
+        "monopoly_operation_seconds", "Latency of sampled domain operations.",
+        operation=operation,
+    )
+    rejections: dict[type, Counter] = {}
+
+    def rejected(error: DomainError) -> None:
+        counter = rejections.get(type(error))
+        if counter is None:
+            counter = rejections[type(error)] = registry.counter(
+                "monopoly_rejections_total",
+                "Domain operations refused, by DomainError subclass.",
+                operation=operation, error=type(error).__name__,
+            )
+        counter.inc()
+
+    @functools.wraps(function)
+    def instrumented(*args, **kwargs):
+        calls.value += 1
+        if calls.value & mask:
+            try:
+                return function(*args, **kwargs)
+            except DomainError as error:
+                rejected(error)
+                raise
+        started = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except DomainError as error:
+            rejected(error)
+            raise
+        finally:
+            latency.observe(perf_counter() - started)
+
+    return instrumented
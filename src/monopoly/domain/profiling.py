@@ -0,0 +1,144 @@
+import inspect
+import os
+import sys
+import threading
+from collections import Counter
+from time import perf_counter
+from types import CodeType, FrameType
+
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.mortgage_expiry import MortgageExpiry
+from monopoly.domain.entities.game.player_manager import PlayerManager
+from monopoly.domain.entities.game.rent_manager import RentManager
+from monopoly.domain.entities.game.tax_manager import TaxManager
+
+# Phase of a sample taken outside every phase below, e.g. game setup or the driver loop
+OUTSIDE = "outside turns"
+
+_PHASES: tuple[tuple[type, str, str], ...] = (
+    (Game, "advance_turn", "turn bookkeeping"),
+    (TaxManager, "update_tax_rate", "tax update"),
+    (RentManager, "reduce_rent", "rent reduction"),
+    (MortgageExpiry, "advance", "mortgage expiry"),
+    (PlayerManager, "advance_turns", "player turns"),
+    (Game, "end_game", "game end"),
+)
+# The innermost of these functions on a sampled stack names its phase. Wrappers, such as
+# installed metrics, are looked through to the domain function itself.
+PHASES: dict[CodeType, str] = {
+    inspect.unwrap(cls.__dict__[method]).__code__: phase for cls, method, phase in _PHASES
+}
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread (the one calling ``start`` by default) every
+    ``interval`` seconds from a background thread. Each sample is counted under its
+    phase of the turn and as a stack for flamegraphs. Nothing in the domain is hooked,
+    so games run at full speed whenever no profiler is running.
+
+    While running, the interpreter's switch interval is lowered to ``interval`` so the
+    sampler gets the GIL on time; it is restored by ``stop``.
+
+        with SamplingProfiler() as profiler:
+            simulator.run(seeds)
+        profiler.write_collapsed("turns.collapsed")
+        print(profiler.breakdown())
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: int | None = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.phases: Counter[str] = Counter()
+        self.samples = 0
+        self.elapsed = 0.0
+        self._labels: dict[CodeType, str] = {}
+        self._stopping = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._started = 0.0
+        self._switch_interval = 0.0
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self._sampler is not None:
+            raise RuntimeError("the profiler is already running")
+        target = self.thread_id if self.thread_id is not None else threading.get_ident()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._stopping.clear()
+        self._sampler = threading.Thread(
+            target=self._sample, args=(target,), name="monopoly-profiler", daemon=True
+        )
+        self._started = perf_counter()
+        self._sampler.start()
+
+    def stop(self) -> None:
+        if self._sampler is None:
+            return
+        self._stopping.set()
+        self._sampler.join()
+        self._sampler = None
+        self.elapsed += perf_counter() - self._started
+        sys.setswitchinterval(self._switch_interval)
+
+    def _sample(self, target: int) -> None:
+        while not self._stopping.wait(self.interval):
+            frame = sys._current_frames().get(target)
+            if frame is None:
+                return
+            self.record(frame)
+
+    def record(self, frame: FrameType | None) -> None:
+        """
+        Count the stack ending in ``frame`` as one sample.
+        """
+        labels = self._labels
+        stack: list[str] = []
+        phase = None
+        while frame is not None:
+            code = frame.f_code
+            if phase is None:
+                phase = PHASES.get(code)
+            label = labels.get(code)
+            if label is None:
+                module = frame.f_globals.get("__name__", "?")
+                label = labels[code] = f"{module}:{code.co_qualname}".replace(";", ",")
+            stack.append(label)
+            frame = frame.f_back
+        phase = phase or OUTSIDE
+        stack.append(phase)
+        stack.reverse()
+        self.stacks[tuple(stack)] += 1
+        self.phases[phase] += 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        """
+        Samples as collapsed stacks, one ``phase;outermost;...;innermost count`` line per
+        distinct stack, as read by flamegraph.pl, speedscope and inferno.
+        """
+        return "".join(
+            f"{';'.join(stack)} {count}\n" for stack, count in sorted(self.stacks.items())
+        )
+
+    def write_collapsed(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "w", encoding="utf-8") as output:
+            output.write(self.collapsed())
+
+    def breakdown(self) -> str:
+        """
+        Share of the samples and estimated time in each phase, largest first.
+        """
+        lines = [f"{'phase':20} {'samples':>8} {'share':>7} {'time':>9}"]
+        for phase, count in self.phases.most_common():
+            share = count / self.samples
+            lines.append(f"{phase:20} {count:8} {share:7.1%} {share * self.elapsed:8.3f}s")
+        lines.append(f"{'total':20} {self.samples:8} {'':7} {self.elapsed:8.3f}s")
+        return "\n".join(lines)
@@ -0,0 +1,86 @@
+from array import array
+
+from monopoly.domain.entities.game.board import build_registry
+from monopoly.domain.entities.game.catalog import BoardCatalog
+from monopoly.domain.entities.game.estate_table import EstateTable
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import Clock
+from monopoly.domain.entities.player import Player
+from monopoly.domain.events import from_micros, to_micros
+from monopoly.domain.snapshot import pack_managers, restore_managers
+from monopoly.domain.value_objects.funds import Funds
+
+# Microseconds stored for a time that has not been set
+_NO_TIME = -1
+
+
+class ResidentGame:
+    """
+    Idle game kept in memory as compact per-game state over a shared BoardCatalog: an
+    EstateTable, seat columns and the managers' fixed-size record. ``resume`` builds the
+    full Game back when the game is played again.
+
+    Only parked games drop their Estate objects. A live Game still holds one Estate per
+    row, whose static fields point at the catalog's values, so idle games should be parked.
+    """
+
+    __slots__ = (
+        "estates", "seats", "funds", "active", "managers", "turn", "winner",
+        "start_time", "end_time", "fast_mode",
+    )
+
+    @classmethod
+    def park(cls, game: Game, catalog: BoardCatalog | None = None) -> "ResidentGame":
+        """
+        Capture ``game``, which must be played on ``catalog`` (the default board if None).
+        """
+        catalog = catalog if catalog is not None else BoardCatalog.default()
+        resident = cls.__new__(cls)
+        resident.estates = EstateTable.capture(
+            catalog, (estate for estates in game.estate_registry.values() for estate in estates)
+        )
+        seats = (*game.players, *game.player_manager.eliminated)
+        resident.seats = array("i", (player.identity for player in seats))
+        resident.funds = array("q", (player.funds.amount for player in seats))
+        resident.active = len(game.players)
+        resident.managers = pack_managers(game)
+        resident.turn = game.current_turn
+        resident.winner = game.winner.identity if game.winner else None
+        time_manager = game.time_manager
+        resident.start_time = to_micros(time_manager.start_time)
+        resident.end_time = to_micros(time_manager.end_time) if time_manager.end_time else _NO_TIME
+        resident.fast_mode = game.fast_mode
+        return resident
+
+    def resume(self, clock: Clock | None = None) -> Game:
+        estates = self.estates.create_estates()
+        by_owner: dict[int, dict] = {identity: {} for identity in self.seats}
+        for estate in estates:
+            if estate.owner is not None:
+                by_owner[estate.owner][estate.identity] = estate
+        seats = [
+            Player(identity=identity, funds=Funds.of(funds), estates=by_owner[identity])
+            for identity, funds in zip(self.seats, self.funds)
+        ]
+
+        game = Game(
+            players=seats[:self.active],
+            estate_registry=build_registry(estates),
+            fast_mode=self.fast_mode,
+            **({"clock": clock} if clock is not None else {}),
+        )
+        game.player_manager.eliminated.extend(seats[self.active:])
+        restore_managers(game, self.managers)
+        game.current_turn = self.turn
+        game.time_manager.start_time = from_micros(self.start_time)
+        if self.end_time != _NO_TIME:
+            game.time_manager.end_time = from_micros(self.end_time)
+        if self.winner is not None:
+            game.winner = next(player for player in seats if player.identity == self.winner)
+        return game
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self) + self.estates.__sizeof__() + self.seats.__sizeof__()
+            + self.funds.__sizeof__() + self.managers.__sizeof__()
+        )
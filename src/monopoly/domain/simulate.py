@@ -0,0 +1,92 @@
+import argparse
+import json
+import logging
+import os
+
+import betterlogging
+from monopoly.domain.profiling import SamplingProfiler
+from monopoly.domain.simulation.engine import SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import (
+    CautiousPolicy,
+    GreedyPolicy,
+    PlayerPolicy,
+    RandomPolicy,
+)
+from monopoly.domain.simulation.runner import run_parallel
+
+POLICIES: dict[str, PlayerPolicy] = {
+    "greedy": GreedyPolicy(),
+    "cautious": CautiousPolicy(),
+    "random": RandomPolicy(),
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run seeded Monopoly games across all cores.")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to run")
+    parser.add_argument("--seed", type=int, default=0, help="first seed of the range")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--chunk-size", type=int, default=None, help="games per shard")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--max-turns", type=int, default=500)
+    parser.add_argument(
+        "--policy",
+        action="append",
+        choices=sorted(POLICIES),
+        help="policy per seat, repeated for each seat (default: greedy)",
+    )
+    parser.add_argument("--output", help="write one JSON line per game to this file")
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="run the games in this process under the sampling profiler, write collapsed "
+        "stacks to PATH and print the time per turn phase",
+    )
+    parser.add_argument(
+        "--profile-interval", type=float, default=1.0, help="sampling interval in ms"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    betterlogging.basic_colorized_config(level=logging.WARNING)
+
+    config = SimulationConfig(players=args.players, max_turns=args.max_turns)
+    policies = [POLICIES[name] for name in args.policy or ["greedy"]]
+    profiler = None
+    if args.profile:
+        # Samples are taken in this process, so the games cannot run in worker processes
+        profiler = SamplingProfiler(interval=args.profile_interval / 1000)
+        with profiler:
+            report = Simulator(config=config, policies=policies).run(
+                range(args.seed, args.seed + args.games)
+            )
+        profiler.write_collapsed(args.profile)
+    else:
+        report = run_parallel(
+            args.seed,
+            args.seed + args.games,
+            config=config,
+            policies=policies,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+
+    if args.output:
+        with open(args.output, "w") as output:
+            for result in report.results:
+                output.write(json.dumps({
+                    "seed": result.seed,
+                    "winner": result.winner,
+                    "turns": result.turns,
+                    "funds": result.funds,
+                    "ownership": result.ownership,
+                }) + "\n")
+    print(report.summary())
+    if profiler is not None:
+        print(profiler.breakdown())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "BoardArrays needs NumPy, install it with `pip install monopoly[simulation]`"
+    ) from exc
+
+from monopoly.domain.entities.estate import Estate
+from monopoly.domain.entities.estate_state import MORTGAGED, NOT_OWNED, OWNED
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.rate import BASIS_POINTS, Rate
+
+STATE_NOT_OWNED = 0
+STATE_OWNED = 1
+STATE_MORTGAGED = 2
+
+NO_OWNER = 0
+
+STATES = {NOT_OWNED: STATE_NOT_OWNED, OWNED: STATE_OWNED, MORTGAGED: STATE_MORTGAGED}
+STATE_OBJECTS = (NOT_OWNED, OWNED, MORTGAGED)
+
+
+@dataclass
+class BoardArrays:
+    """
+    Struct-of-arrays view of the estates of one or more games sharing a board.
+
+    Static columns have shape (estates,), per-game columns have shape (games, estates).
+    Column j describes the estate with identity ``estate_ids[j]``. Rent reduction is kept
+    in basis points, like ``Estate.rent_reduction``, so round trips are exact.
+    """
+
+    estate_ids: np.ndarray
+    price: np.ndarray
+    mortgage_price: np.ndarray
+    buyback_price: np.ndarray
+    rent: np.ndarray
+    rent_reduction: np.ndarray
+    owner: np.ndarray
+    state: np.ndarray
+    turns_until_buyback: np.ndarray
+
+    @property
+    def games(self) -> int:
+        return self.owner.shape[0]
+
+    @classmethod
+    def from_estates(cls, estates: Sequence[Estate]) -> "BoardArrays":
+        return cls.from_games([estates])
+
+    @classmethod
+    def from_games(cls, boards: Sequence[Sequence[Estate]]) -> "BoardArrays":
+        ordered = [sorted(board, key=lambda estate: estate.identity) for board in boards]
+        template = ordered[0]
+        for board in ordered[1:]:
+            if [estate.identity for estate in board] != [estate.identity for estate in template]:
+                raise ValueError("All games in a batch must use the same board.")
+
+        def static(attribute: str) -> np.ndarray:
+            return np.array([getattr(estate, attribute) for estate in template], dtype=np.int64)
+
+        def per_game(values, dtype) -> np.ndarray:
+            return np.array(
+                [[values(estate) for estate in board] for board in ordered], dtype=dtype
+            )
+
+        return cls(
+            estate_ids=static("identity"),
+            price=static("price"),
+            mortgage_price=static("mortgage_price"),
+            buyback_price=static("buyback_price"),
+            rent=static("rent"),
+            rent_reduction=per_game(lambda estate: estate.rent_reduction.basis_points, np.int32),
+            owner=per_game(lambda estate: estate.owner or NO_OWNER, np.int32),
+            state=per_game(lambda estate: STATES[estate._state], np.int8),
+            turns_until_buyback=per_game(lambda estate: estate.turns_until_buyback, np.int32),
+        )
+
+    def reduce_rent(self, percentage: Decimal | float | np.ndarray) -> None:
+        """
+        Equivalent of ``Estate.reduce_rent`` on every estate. An array of shape (games,)
+        applies a different step to each game.
+        """
+        step = np.rint(np.asarray(percentage, dtype=np.float64) * (BASIS_POINTS // 100))
+        step = step.astype(np.int32).reshape(-1, 1) if np.ndim(step) else int(step)
+        np.minimum(self.rent_reduction + step, BASIS_POINTS, out=self.rent_reduction)
+
+    def current_rent(self) -> np.ndarray:
+        return self.rent * (BASIS_POINTS - self.rent_reduction) // BASIS_POINTS
+
+    def advance_turn(self) -> np.ndarray:
+        """
+        Count down every mortgage by one turn and release the estates whose buyback
+        window ran out, as ``MortgagedState.advance_turn`` does. Returns the released mask.
+        """
+        counting = (self.state == STATE_MORTGAGED) & (self.turns_until_buyback > 0)
+        self.turns_until_buyback -= counting
+        expired = counting & (self.turns_until_buyback == 0)
+        self.state[expired] = STATE_NOT_OWNED
+        self.owner[expired] = NO_OWNER
+        return expired
+
+    def owned_by(self, player_id: PlayerId, game: int = 0) -> np.ndarray:
+        return self.estate_ids[self.owner[game] == player_id]
+
+    def write_back(
+        self,
+        boards: Sequence[Sequence[Estate]],
+        players: Sequence[Sequence[Player]] | None = None,
+    ) -> None:
+        """
+        Copy the per-game columns back onto the ``Estate`` objects, and rebuild
+        ``Player.estates`` when the players of each game are given. Estates in a game
+        keep the reduction of its RentManager, the only writer of their shared level.
+        """
+        for game, board in enumerate(boards):
+            by_id = {estate.identity: estate for estate in board}
+            owners = self.owner[game].tolist()
+            states = self.state[game].tolist()
+            turns = self.turns_until_buyback[game].tolist()
+            reductions = self.rent_reduction[game].tolist()
+            for column, estate_id in enumerate(self.estate_ids.tolist()):
+                estate = by_id[estate_id]
+                estate.set_owner(PlayerId(owners[column]) if owners[column] else None)
+                if not estate._rent_level.shared:
+                    estate.rent_reduction = Rate.of(reductions[column])
+                estate.turns_until_buyback = turns[column]
+                estate._set_state(STATE_OBJECTS[states[column]])
+
+            if players is not None:
+                for player in players[game]:
+                    player.estates = {
+                        estate.identity: estate
+                        for estate in board
+                        if estate.owner == player.identity
+                    }
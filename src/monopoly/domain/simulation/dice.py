@@ -0,0 +1,14 @@
+import random
+from dataclasses import dataclass
+
+
+@dataclass
+class Dice:
+    rng: random.Random
+    sides: int = 6
+    count: int = 2
+
+    def roll(self) -> int:
+        rand = self.rng.random
+        sides = self.sides
+        return sum(int(rand() * sides) + 1 for _ in range(self.count))
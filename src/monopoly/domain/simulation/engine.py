@@ -0,0 +1,227 @@
+import random
+import statistics
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import timedelta
+from time import perf_counter
+from typing import Iterable, Sequence
+
+from monopoly.domain.entities.estate import Estate, EstateCategory
+from monopoly.domain.entities.game.board import DEFAULT_BOARD, build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.pool import GamePool
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.entities.player import Player, PlayerId, transfer
+from monopoly.domain.logging_mode import silent_simulation
+from monopoly.domain.simulation.dice import Dice
+from monopoly.domain.simulation.policies import GreedyPolicy, PlayerPolicy
+from monopoly.domain.value_objects.funds import Funds
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    players: int = 4
+    max_turns: int = 500
+    turn_duration: timedelta = timedelta(seconds=30)
+    fast_mode: bool = False
+    # Skip domain logging on the turn loop entirely
+    silent: bool = True
+    board: tuple[tuple[int, str, int, int, int, int, EstateCategory], ...] = DEFAULT_BOARD
+
+
+@dataclass(frozen=True, slots=True)
+class GameResult:
+    seed: int
+    winner: PlayerId | None
+    turns: int
+    # Final funds per seat, in seat order
+    funds: tuple[int, ...]
+    # Owner of every estate in board order, 0 when unowned
+    ownership: tuple[int, ...]
+
+
+class SimulatedGame:
+    """
+    One seeded game driven headless: virtual clock, dice movement and player policies.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        config: SimulationConfig,
+        policies: Sequence[PlayerPolicy],
+        game: Game | None = None,
+    ):
+        """
+        ``game``, if given, must come from ``new_game(config)`` and be freshly created or
+        reset, as games handed out by a GamePool are.
+        """
+        self.seed = seed
+        self.config = config
+        self.rng = random.Random(seed)
+        self.dice = Dice(self.rng)
+
+        if game is None:
+            game = self.new_game(config)
+        self.game = game
+        self.clock: VirtualClock = game.clock
+        self.clock.reset()
+
+        self.cells: list[Estate] = sorted(
+            (estate for estates in game.estate_registry.values() for estate in estates),
+            key=lambda estate: estate.identity,
+        )
+        self.seats = list(game.players)
+        self.players_by_id = {player.identity: player for player in self.seats}
+        self.policies = {
+            player.identity: policies[seat % len(policies)]
+            for seat, player in enumerate(self.seats)
+        }
+        self.positions = {player.identity: 0 for player in self.seats}
+        self.eliminated: set[PlayerId] = set()
+        self.turn_latencies: list[float] = []
+        self.game.start_game()
+
+    @staticmethod
+    def new_game(config: SimulationConfig) -> Game:
+        seats = [
+            Player(identity=PlayerId(seat + 1), funds=Funds.of(0))
+            for seat in range(config.players)
+        ]
+        return Game(
+            players=seats,
+            estate_registry=build_registry(create_estates(config.board)),
+            fast_mode=config.fast_mode,
+            clock=VirtualClock(),
+        )
+
+    def run(self) -> GameResult:
+        game = self.game
+        with silent_simulation() if self.config.silent else nullcontext():
+            while not game.is_game_over() and game.current_turn < self.config.max_turns:
+                started = perf_counter()
+                game.advance_turn(self.take_turn)
+                if len(game.players) <= 1 and not game.is_game_over():
+                    game.end_game()
+                self.turn_latencies.append(perf_counter() - started)
+                self.clock.advance(self.config.turn_duration)
+
+            if not game.is_game_over():
+                game.end_game()
+        return self.result()
+
+    def take_turn(self, player: Player) -> None:
+        if player.identity in self.eliminated:
+            return
+
+        policy = self.policies[player.identity]
+        ring = len(self.cells) + 1
+        position = self.positions[player.identity] + self.dice.roll()
+        if position >= ring:
+            position %= ring
+            self.game.bonus_manager.pass_start(player, self.game.time_manager)
+        self.positions[player.identity] = position
+
+        if position:
+            self._land(player, policy, self.cells[position - 1])
+        if player.identity not in self.eliminated:
+            policy.end_turn(self.game, player, self.rng)
+
+    def _land(self, player: Player, policy: PlayerPolicy, estate: Estate) -> None:
+        owner_id = estate.owner
+        if owner_id is None:
+            if player.funds.amount >= estate.price and policy.should_buy(
+                self.game, player, estate, self.rng
+            ):
+                player.buy_estate(estate)
+        elif owner_id != player.identity and not estate.is_mortgaged():
+            rent = estate.current_rent()
+            if rent:
+                self._charge(player, policy, self.players_by_id[owner_id], rent)
+
+    def _charge(self, payer: Player, policy: PlayerPolicy, payee: Player, amount: int) -> None:
+        if payer.funds.amount < amount:
+            policy.raise_funds(self.game, payer, amount)
+
+        paid = Funds.of(min(amount, payer.funds.amount))
+        tax = paid.apply_rate(self.game.tax_manager.current_tax_rate)
+        transfer(payer, payee, paid.subtract(tax))
+        payer.withdraw(tax)
+
+        if paid.amount < amount:
+            payer.forfeit_estates()
+            self.game.player_manager.eliminate(payer)
+            self.eliminated.add(payer.identity)
+
+    def result(self) -> GameResult:
+        winner = self.game.winner
+        return GameResult(
+            seed=self.seed,
+            winner=winner.identity if winner else None,
+            turns=self.game.current_turn,
+            funds=tuple(player.funds.amount for player in self.seats),
+            ownership=tuple(estate.owner or 0 for estate in self.cells),
+        )
+
+
+@dataclass
+class SimulationReport:
+    results: list[GameResult]
+    elapsed: float
+    turn_latencies: list[float] = field(default_factory=list)
+
+    @property
+    def games_per_second(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def total_turns(self) -> int:
+        return sum(result.turns for result in self.results)
+
+    def turn_latency(self, quantile: float) -> float:
+        if not self.turn_latencies:
+            return 0.0
+        ordered = sorted(self.turn_latencies)
+        return ordered[min(int(quantile * len(ordered)), len(ordered) - 1)]
+
+    def summary(self) -> str:
+        mean = statistics.fmean(self.turn_latencies) if self.turn_latencies else 0.0
+        return (
+            f"{len(self.results)} games, {self.total_turns} turns in {self.elapsed:.3f}s: "
+            f"{self.games_per_second:.1f} games/s, turn latency "
+            f"mean {mean * 1e6:.1f}us p50 {self.turn_latency(0.5) * 1e6:.1f}us "
+            f"p99 {self.turn_latency(0.99) * 1e6:.1f}us"
+        )
+
+
+@dataclass
+class Simulator:
+    config: SimulationConfig = field(default_factory=SimulationConfig)
+    policies: Sequence[PlayerPolicy] = (GreedyPolicy(),)
+    # Finished games kept for reuse by ``run``; 0 builds a new game for every seed
+    pool_size: int = 0
+    pool: GamePool | None = field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
+        if self.pool_size:
+            self.pool = GamePool(lambda: SimulatedGame.new_game(self.config), self.pool_size)
+
+    def run_game(self, seed: int) -> SimulatedGame:
+        game = self.pool.acquire() if self.pool is not None else None
+        simulated = SimulatedGame(seed, self.config, self.policies, game)
+        simulated.run()
+        return simulated
+
+    def run(self, seeds: Iterable[int]) -> SimulationReport:
+        results: list[GameResult] = []
+        latencies: list[float] = []
+        started = perf_counter()
+        for seed in seeds:
+            simulated = self.run_game(seed)
+            results.append(simulated.result())
+            latencies.extend(simulated.turn_latencies)
+            if self.pool is not None:
+                self.pool.release(simulated.game)
+        return SimulationReport(
+            results=results, elapsed=perf_counter() - started, turn_latencies=latencies
+        )
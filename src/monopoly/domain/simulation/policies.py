@@ -0,0 +1,76 @@
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from monopoly.domain.entities.estate import Estate
+    from monopoly.domain.entities.game.game import Game
+    from monopoly.domain.entities.player import Player
+
+
+class PlayerPolicy(ABC):
+    """
+    Decision maker for a simulated player. Policies hold no per-game state.
+    """
+
+    @abstractmethod
+    def should_buy(
+        self, game: "Game", player: "Player", estate: "Estate", rng: random.Random
+    ) -> bool:
+        pass
+
+    def raise_funds(self, game: "Game", player: "Player", amount: int) -> None:
+        # Mortgage the cheapest estates first until the debt can be paid
+        candidates = sorted(
+            (estate for estate in player.estates.values() if not estate.is_mortgaged()),
+            key=lambda estate: estate.mortgage_price,
+        )
+        for estate in candidates:
+            if player.funds.amount >= amount:
+                return
+            player.mortgage(estate)
+
+    def end_turn(self, game: "Game", player: "Player", rng: random.Random) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class GreedyPolicy(PlayerPolicy):
+    """
+    Buys everything it can afford and buys back mortgaged estates as soon as possible.
+    """
+
+    def should_buy(
+        self, game: "Game", player: "Player", estate: "Estate", rng: random.Random
+    ) -> bool:
+        return True
+
+    def end_turn(self, game: "Game", player: "Player", rng: random.Random) -> None:
+        for estate in list(player.estates.values()):
+            if estate.is_mortgaged() and player.funds.amount >= estate.buyback_price:
+                player.buyback(estate)
+
+
+@dataclass(frozen=True)
+class CautiousPolicy(PlayerPolicy):
+    """
+    Buys only while a cash reserve is kept for rent.
+    """
+
+    reserve: int = 500
+
+    def should_buy(
+        self, game: "Game", player: "Player", estate: "Estate", rng: random.Random
+    ) -> bool:
+        return player.funds.amount - estate.price >= self.reserve
+
+
+@dataclass(frozen=True)
+class RandomPolicy(PlayerPolicy):
+    buy_probability: float = 0.5
+
+    def should_buy(
+        self, game: "Game", player: "Player", estate: "Estate", rng: random.Random
+    ) -> bool:
+        return rng.random() < self.buy_probability
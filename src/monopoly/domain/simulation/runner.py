@@ -0,0 +1,141 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Sequence
+
+from monopoly.domain.entities.player import PlayerId
+from monopoly.domain.simulation.engine import GameResult, SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import GreedyPolicy, PlayerPolicy
+
+# seed, winner, turns, funds, ownership
+PackedResult = tuple[int, int, int, tuple[int, ...], tuple[int, ...]]
+
+
+@dataclass(frozen=True)
+class Shard:
+    start: int
+    stop: int
+    config: SimulationConfig
+    policies: tuple[PlayerPolicy, ...]
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    results: list[PackedResult]
+    turn_time: float
+
+
+@dataclass
+class ParallelReport:
+    results: list[GameResult]
+    elapsed: float
+    workers: int
+    turn_time: float
+
+    @property
+    def games_per_second(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def total_turns(self) -> int:
+        return sum(result.turns for result in self.results)
+
+    @property
+    def mean_turn_latency(self) -> float:
+        return self.turn_time / self.total_turns if self.total_turns else 0.0
+
+    def win_rates(self) -> dict[int, float]:
+        wins: dict[int, int] = {}
+        for result in self.results:
+            if result.winner is not None:
+                wins[result.winner] = wins.get(result.winner, 0) + 1
+        return {seat: count / len(self.results) for seat, count in sorted(wins.items())}
+
+    def summary(self) -> str:
+        rates = ", ".join(f"P{seat} {rate:.1%}" for seat, rate in self.win_rates().items())
+        return (
+            f"{len(self.results)} games, {self.total_turns} turns on {self.workers} workers "
+            f"in {self.elapsed:.3f}s: {self.games_per_second:.1f} games/s, "
+            f"mean turn latency {self.mean_turn_latency * 1e6:.1f}us; win rates: {rates}"
+        )
+
+
+def _pack(result: GameResult) -> PackedResult:
+    return result.seed, result.winner or 0, result.turns, result.funds, result.ownership
+
+
+def _unpack(packed: PackedResult) -> GameResult:
+    seed, winner, turns, funds, ownership = packed
+    return GameResult(
+        seed=seed,
+        winner=PlayerId(winner) if winner else None,
+        turns=turns,
+        funds=funds,
+        ownership=ownership,
+    )
+
+
+def _init_worker(log_level: int) -> None:
+    logging.disable(max(log_level - 1, logging.NOTSET))
+
+
+def run_shard(shard: Shard) -> ShardResult:
+    # A shard plays its games one after another, so a single pooled game serves them all
+    simulator = Simulator(config=shard.config, policies=shard.policies, pool_size=1)
+    results: list[PackedResult] = []
+    turn_time = 0.0
+    for seed in range(shard.start, shard.stop):
+        simulated = simulator.run_game(seed)
+        results.append(_pack(simulated.result()))
+        turn_time += sum(simulated.turn_latencies)
+        simulator.pool.release(simulated.game)
+    return ShardResult(results=results, turn_time=turn_time)
+
+
+def split_seeds(start: int, stop: int, chunk_size: int) -> list[tuple[int, int]]:
+    return [(low, min(low + chunk_size, stop)) for low in range(start, stop, chunk_size)]
+
+
+def run_parallel(
+    start: int,
+    stop: int,
+    config: SimulationConfig = SimulationConfig(),
+    policies: Sequence[PlayerPolicy] = (GreedyPolicy(),),
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    log_level: int = logging.WARNING,
+) -> ParallelReport:
+    """
+    Run the games for seeds [start, stop) across worker processes.
+
+    Every game depends only on its seed, and shards are merged back in seed order,
+    so the results are identical for any number of workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    games = max(stop - start, 0)
+    # A few shards per worker keeps the pool busy when some games run longer than others
+    chunk_size = chunk_size or max(1, -(-games // (workers * 4)))
+    shards = [
+        Shard(start=low, stop=high, config=config, policies=tuple(policies))
+        for low, high in split_seeds(start, stop, chunk_size)
+    ]
+
+    started = perf_counter()
+    results: list[GameResult] = []
+    turn_time = 0.0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(log_level,),
+    ) as executor:
+        for shard_result in executor.map(run_shard, shards):
+            results.extend(_unpack(packed) for packed in shard_result.results)
+            turn_time += shard_result.turn_time
+
+    return ParallelReport(
+        results=results, elapsed=perf_counter() - started, workers=workers, turn_time=turn_time
+    )
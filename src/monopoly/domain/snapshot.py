@@ -0,0 +1,408 @@
+import copy
+import struct
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from monopoly.domain.entities.estate import (
+    STANDALONE_TURNS,
+    BuildableEstate,
+    Estate,
+    EstateCategory,
+    RentLevel,
+    UnbuildableEstate,
+)
+from monopoly.domain.entities.estate_state import MORTGAGED, NOT_OWNED, OWNED
+from monopoly.domain.entities.game.board import build_registry
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import Clock
+from monopoly.domain.entities.player import Player
+from monopoly.domain.events import from_micros, to_micros
+from monopoly.domain.exceptions.base import DomainError
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+if TYPE_CHECKING:
+    from monopoly.domain.entities.estate import EstateId
+
+MAGIC = b"MNPS"
+# 2: rates are stored as basis points instead of Decimal strings
+# 3: the time manager's limits are stored with the other managers
+VERSION = 3
+
+# magic, version, flags, current turn, winner (0: none), start time, end time (-1: none)
+_HEADER = struct.Struct("<4sHBqqqq")
+_FAST_MODE = 1
+
+# Rates in basis points
+# tax: rate, step, max, updated; rent: step, max, current, interval, next turn; bonus: pass, start
+# time, in microseconds: game duration, bonus disabled, rent reduction and tax increase start
+_MANAGERS = struct.Struct("<IIIBIIIqqqqqqqq")
+_TIME_LIMITS = (
+    "game_duration", "bonus_disable_after", "rent_reduction_start_after",
+    "tax_increase_start_after",
+)
+_MICROSECOND = timedelta(microseconds=1)
+# identity, buildable, category, price, mortgage, buyback, rent, owner, state, turns until
+# buyback, rent reduction (basis points), name (string table index), stars, max stars
+_ESTATE = struct.Struct("<qBBqqqqqBqIHBB")
+# identity, funds, eliminated, number of estates
+_PLAYER = struct.Struct("<qqBI")
+_COUNT = struct.Struct("<I")
+_LENGTH = struct.Struct("<H")
+
+_CATEGORIES = tuple(EstateCategory)
+_CATEGORY_CODES = {category: code for code, category in enumerate(_CATEGORIES)}
+_STATES = (NOT_OWNED, OWNED, MORTGAGED)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+
+
+class SnapshotError(DomainError):
+    pass
+
+
+class _Strings:
+    def __init__(self):
+        self.codes: dict[str, int] = {}
+
+    def __call__(self, value: object) -> int:
+        text = str(value)
+        code = self.codes.get(text)
+        if code is None:
+            code = self.codes[text] = len(self.codes)
+        return code
+
+    def pack(self) -> bytes:
+        parts = [_LENGTH.pack(len(self.codes))]
+        for text in self.codes:
+            encoded = text.encode("utf-8")
+            parts.append(_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+
+
+def _estates(game: Game) -> list[Estate]:
+    estates = [estate for estates in game.estate_registry.values() for estate in estates]
+    estates.sort(key=lambda estate: estate.identity)
+    return estates
+
+
+def dump(game: Game, turn: int | None = None) -> bytes:
+    """
+    Serialize the whole game: board, seats, manager state and every estate's position in
+    its state machine. Equal games give equal bytes, so snapshots can be compared directly.
+    ``turn`` overrides the recorded turn counter.
+    """
+    strings = _Strings()
+    time_manager = game.time_manager
+    managers = pack_managers(game)
+
+    if turn is None:
+        turn = game.current_turn
+    estates = _estates(game)
+    parts = [managers, _COUNT.pack(len(estates))]
+    pack_estate = _ESTATE.pack
+    for estate in estates:
+        buildable = isinstance(estate, BuildableEstate)
+        parts.append(pack_estate(
+            estate.identity, buildable, _CATEGORY_CODES[estate.category],
+            estate.price, estate.mortgage_price, estate.buyback_price, estate.rent,
+            estate.owner or 0, _STATE_CODES[estate._state], max(0, estate.buyback_deadline - turn),
+            estate.rent_reduction.basis_points, strings(estate.name),
+            estate.stars if buildable else 0, estate.max_stars if buildable else 0,
+        ))
+
+    seats = [(player, False) for player in game.players]
+    seats += [(player, True) for player in game.player_manager.eliminated]
+    parts.append(_COUNT.pack(len(seats)))
+    for player, eliminated in seats:
+        parts.append(_PLAYER.pack(
+            player.identity, player.funds.amount, eliminated, len(player.estates)
+        ))
+        parts.append(struct.pack(f"<{len(player.estates)}q", *player.estates))
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, _FAST_MODE if game.fast_mode else 0,
+        turn,
+        game.winner.identity if game.winner else 0,
+        to_micros(time_manager.start_time),
+        to_micros(time_manager.end_time) if time_manager.end_time else -1,
+    )
+    return b"".join((header, strings.pack(), *parts))
+
+
+def pack_managers(game: Game) -> bytes:
+    """
+    Settings and progress of the tax, rent and bonus managers, and the time manager's
+    limits, as one fixed-size record.
+    """
+    tax = game.tax_manager
+    rent = game.rent_manager
+    bonus = game.bonus_manager
+    time = game.time_manager
+    return _MANAGERS.pack(
+        tax.current_tax_rate.basis_points, tax.tax_step.basis_points,
+        tax.max_tax_rate.basis_points, tax.tax_rate_updated,
+        rent.rent_reduction_step.basis_points, rent.max_rent_reduction.basis_points,
+        rent.current_rent_reduction.basis_points,
+        rent.rent_reduction_interval_turns, rent.next_rent_reduction_turn,
+        bonus.pass_start_bonus.amount, bonus.player_starting_funds.amount,
+        *(getattr(time, name) // _MICROSECOND for name in _TIME_LIMITS),
+    )
+
+
+def restore_managers(game: Game, data: bytes, offset: int = 0) -> None:
+    """
+    Apply a ``pack_managers`` record found at ``offset`` of ``data`` to ``game``.
+    """
+    try:
+        (
+            tax_rate, tax_step, max_tax_rate, tax_updated,
+            rent_step, max_rent, rent_current, interval, next_turn,
+            pass_bonus, starting_funds, *limits,
+        ) = _MANAGERS.unpack_from(data, offset)
+    except struct.error as e:
+        raise SnapshotError("Snapshot is truncated.") from e
+    tax = game.tax_manager
+    tax.current_tax_rate = Rate.of(tax_rate)
+    tax.tax_step = Rate.of(tax_step)
+    tax.max_tax_rate = Rate.of(max_tax_rate)
+    tax.tax_rate_updated = bool(tax_updated)
+    rent = game.rent_manager
+    rent.rent_reduction_step = Rate.of(rent_step)
+    rent.max_rent_reduction = Rate.of(max_rent)
+    rent.current_rent_reduction = Rate.of(rent_current)
+    rent.rent_reduction_interval_turns = interval
+    rent.next_rent_reduction_turn = next_turn
+    game.bonus_manager.pass_start_bonus = Funds.of(pass_bonus)
+    game.bonus_manager.player_starting_funds = Funds.of(starting_funds)
+    for name, micros in zip(_TIME_LIMITS, limits):
+        setattr(game.time_manager, name, micros * _MICROSECOND)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        if len(data) < _HEADER.size:
+            raise SnapshotError("Snapshot is truncated.")
+        magic, version, *header = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise SnapshotError("Not a game snapshot.")
+        if version != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}.")
+        self.flags, self.turn, self.winner, self.start_time, self.end_time = header
+        self.data = data
+        self.offset = _HEADER.size
+
+        (count,) = self.read(_LENGTH)
+        self.strings: list[str] = []
+        for _ in range(count):
+            (length,) = self.read(_LENGTH)
+            self.strings.append(data[self.offset:self.offset + length].decode("utf-8"))
+            self.offset += length
+
+    def read(self, layout: struct.Struct) -> tuple:
+        try:
+            values = layout.unpack_from(self.data, self.offset)
+        except struct.error as e:
+            raise SnapshotError("Snapshot is truncated.") from e
+        self.offset += layout.size
+        return values
+
+    def read_ids(self, count: int) -> tuple[int, ...]:
+        layout = struct.Struct(f"<{count}q")
+        return self.read(layout)
+
+    def restore_managers(self, game: Game) -> None:
+        restore_managers(game, self.data, self.offset)
+        self.offset += _MANAGERS.size
+
+        game.current_turn = self.turn
+        game.time_manager.start_time = from_micros(self.start_time)
+        game.time_manager.end_time = from_micros(self.end_time) if self.end_time >= 0 else None
+
+    def read_players(self) -> list[tuple[int, int, bool, tuple[int, ...]]]:
+        (count,) = self.read(_COUNT)
+        players = []
+        for _ in range(count):
+            identity, funds, eliminated, owned = self.read(_PLAYER)
+            players.append((identity, funds, bool(eliminated), self.read_ids(owned)))
+        return players
+
+
+def restore(data: bytes, clock: Clock | None = None) -> Game:
+    """
+    Build a new game, board and seats included, from ``dump`` output.
+    """
+    reader = _Reader(data)
+    # Managers come first in the stream but are applied once the game exists
+    managers_offset = reader.offset
+    reader.offset += _MANAGERS.size
+
+    estates: list[Estate] = []
+    strings = reader.strings
+    # Turns until buyback become absolute deadlines on the restored game's turn clock
+    turn = reader.turn
+    (count,) = reader.read(_COUNT)
+    start = reader.offset
+    reader.offset += count * _ESTATE.size
+    if reader.offset > len(data):
+        raise SnapshotError("Snapshot is truncated.")
+    for (
+        identity, buildable, category, price, mortgage_price, buyback_price, rent,
+        owner, state, turns, reduction, name, stars, max_stars,
+    ) in _ESTATE.iter_unpack(data[start:reader.offset]):
+        estate = _estate(
+            BuildableEstate if buildable else UnbuildableEstate,
+            identity, strings[name], price, mortgage_price, buyback_price, _CATEGORIES[category],
+            rent, Rate.of(reduction), state, owner, turn + turns,
+        )
+        if buildable:
+            estate.stars = stars
+            estate.max_stars = max_stars
+        estates.append(estate)
+
+    by_id = {estate.identity: estate for estate in estates}
+    active: list[Player] = []
+    eliminated: list[Player] = []
+    for identity, funds, is_eliminated, owned in reader.read_players():
+        player = Player(
+            identity=identity,
+            funds=Funds.of(funds),
+            estates={estate_id: by_id[estate_id] for estate_id in owned},
+        )
+        (eliminated if is_eliminated else active).append(player)
+
+    game = Game(
+        players=active,
+        estate_registry=build_registry(estates),
+        fast_mode=bool(reader.flags & _FAST_MODE),
+        **({"clock": clock} if clock is not None else {}),
+    )
+    game.player_manager.eliminated.extend(eliminated)
+    end = reader.offset
+    reader.offset = managers_offset
+    reader.restore_managers(game)
+    reader.offset = end
+    if reader.winner:
+        game.winner = next(
+            player for player in (*active, *eliminated) if player.identity == reader.winner
+        )
+    return game
+
+
+def restore_into(game: Game, data: bytes) -> None:
+    """
+    Overwrite ``game`` with ``dump`` output taken from a game over the same board and seats.
+    Only the mutable state is applied; the estates' observers, the board index and move
+    generator among them, are kept in sync.
+    """
+    reader = _Reader(data)
+    reader.restore_managers(game)
+
+    estates = {estate.identity: estate for estate in _estates(game)}
+    (count,) = reader.read(_COUNT)
+    for _ in range(count):
+        identity, _, _, _, _, _, _, owner, state, turns, _, _, stars, _ = reader.read(_ESTATE)
+        estate = estates[identity]
+        # The rent reduction is shared by the board and came with the managers
+        estate.turns_until_buyback = turns
+        if isinstance(estate, BuildableEstate) and estate.stars != stars:
+            estate.stars = stars
+            # Observers, such as a built move generator, see the stars as build_star shows them
+            for observer in estate._observers:
+                observer.estate_changed(estate, estate.owner, estate._state)
+        if estate.owner != (owner or None):
+            estate.set_owner(owner or None)
+        if estate._state is not _STATES[state]:
+            estate._set_state(_STATES[state])
+
+    seats = {
+        player.identity: player
+        for player in (*game.players, *game.player_manager.eliminated)
+    }
+    players = reader.read_players()
+    # players and player_manager.players are the same list
+    game.players[:] = [seats[identity] for identity, _, eliminated, _ in players if not eliminated]
+    game.player_manager.eliminated[:] = [
+        seats[identity] for identity, _, eliminated, _ in players if eliminated
+    ]
+    for identity, funds, _, owned in players:
+        player = seats[identity]
+        player.funds = Funds.of(funds)
+        player.estates = {estate_id: estates[estate_id] for estate_id in owned}
+    game.winner = seats[reader.winner] if reader.winner else None
+
+
+def fork(game: Game, clock: Clock | None = None) -> Game:
+    """
+    Independent in-memory copy of ``game`` for exploring branches. The copy shares only
+    immutable values with the original and has no event sink attached. Pass ``clock`` to
+    give the branch its own clock; by default it shares the original's.
+    """
+    estates: dict["EstateId", Estate] = {}
+    for estate in _estates(game):
+        estates[estate.identity] = estate.clone()
+
+    seats = {}
+    for player in (*game.players, *game.player_manager.eliminated):
+        seats[player.identity] = Player(
+            identity=player.identity,
+            funds=player.funds,
+            estates={estate_id: estates[estate_id] for estate_id in player.estates},
+        )
+
+    forked = Game(
+        players=[seats[player.identity] for player in game.players],
+        estate_registry={
+            category: {estates[estate.identity] for estate in members}
+            for category, members in game.estate_registry.items()
+        },
+        fast_mode=game.fast_mode,
+        clock=clock if clock is not None else game.clock,
+    )
+    forked_level = forked.rent_manager.level
+    forked.player_manager.eliminated.extend(
+        seats[player.identity] for player in game.player_manager.eliminated
+    )
+    for name in ("tax_manager", "rent_manager", "bonus_manager"):
+        manager = copy.copy(getattr(game, name))
+        manager.events = None
+        setattr(forked, name, manager)
+    # The copied rent manager must drive the level the forked estates already share
+    forked.rent_manager.level = forked_level
+    forked.rent_manager.current_rent_reduction = game.rent_manager.current_rent_reduction
+    forked.time_manager.start_time = game.time_manager.start_time
+    forked.time_manager.end_time = game.time_manager.end_time
+    for name in _TIME_LIMITS:
+        setattr(forked.time_manager, name, getattr(game.time_manager, name))
+    forked.current_turn = game.current_turn
+    forked.winner = seats[game.winner.identity] if game.winner else None
+    return forked
+
+
+def _estate(
+    cls: type[Estate], identity: int, name: str, price: int, mortgage_price: int,
+    buyback_price: int, category: EstateCategory, rent: int, rent_reduction: Rate,
+    state: int, owner: int, deadline: int,
+) -> Estate:
+    # Direct slot assignment: dataclass __init__ with keywords costs several times more
+    estate = _new(cls)
+    estate.identity = identity
+    estate.name = name
+    estate.price = price
+    estate.mortgage_price = mortgage_price
+    estate.buyback_price = buyback_price
+    estate.category = category
+    estate.rent = rent
+    estate._rent_level = RentLevel(rent_reduction)
+    estate._rent_epoch = -1
+    estate._rent_cache = 0
+    estate._state = _STATES[state]
+    estate.owner = owner or None
+    estate.buyback_deadline = deadline
+    estate._turns = STANDALONE_TURNS
+    estate._observers = ()
+    estate._events = None
+    return estate
+
+
+_new = object.__new__
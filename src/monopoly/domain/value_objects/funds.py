@@ -1,8 +1,33 @@
 from dataclasses import dataclass
+from decimal import ROUND_FLOOR, Decimal
+from typing import Iterable, Union
 
 from monopoly.domain.exceptions.estate_exc import InvalidFundsException
+from monopoly.domain.value_objects.rate import BASIS_POINTS, Rate
 
-@dataclass(frozen=True, order=True)
+# Amounts below this are interned: prices, rents and bonuses reuse shared instances
+INTERNED_AMOUNTS = 4096
+
+Amount = Union["Funds", int, Decimal]
+
+
+def to_amount(value: Amount) -> int:
+    """
+    Whole-dollar value of a Funds, int or Decimal. Decimals are rounded down, the same
+    way a rate applied to Funds is, so Decimal and Funds math agree.
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, Funds):
+        return value.amount
+    if isinstance(value, Decimal):
+        return int(value.to_integral_value(rounding=ROUND_FLOOR))
+    if isinstance(value, int):
+        return int(value)
+    raise TypeError(f"Unsupported funds operand: {value!r}")
+
+
+@dataclass(frozen=True, order=True, slots=True)
 class Funds:
     amount: int = 15000
 
@@ -10,14 +35,54 @@ class Funds:
         if self.amount < 0:
             raise InvalidFundsException(amount=self.amount)
 
-    def add(self, other: 'Funds') -> 'Funds':
-        return Funds(amount=self.amount + other.amount)
+    @classmethod
+    def of(cls, amount: int) -> "Funds":
+        if 0 <= amount < INTERNED_AMOUNTS:
+            return _INTERNED[amount]
+        return cls(amount=amount)
+
+    @classmethod
+    def _trusted(cls, amount: int) -> "Funds":
+        # The caller guarantees amount >= 0, so validation is skipped
+        if amount < INTERNED_AMOUNTS:
+            return _INTERNED[amount]
+        funds = _new(cls)
+        _set_amount(funds, amount)
+        return funds
 
-    def subtract(self, other: 'Funds') -> 'Funds':
-        if self.amount < other.amount:
-            raise InvalidFundsException(amount=other.amount, action="subtract")
-        return Funds(amount=self.amount - other.amount)
+    def add(self, other: Amount) -> "Funds":
+        amount = self.amount + to_amount(other)
+        if amount < 0:
+            raise InvalidFundsException(amount=amount, action="add")
+        return Funds._trusted(amount)
+
+    def subtract(self, other: Amount) -> "Funds":
+        other_amount = to_amount(other)
+        if other_amount < 0 or self.amount < other_amount:
+            raise InvalidFundsException(amount=other_amount, action="subtract")
+        return Funds._trusted(self.amount - other_amount)
+
+    def add_many(self, others: Iterable[Amount]) -> "Funds":
+        return self.add(sum(to_amount(other) for other in others))
+
+    def apply_rate(self, rate: Rate | Decimal) -> "Funds":
+        """
+        Share of these funds at the given rate (Rate(1500) or Decimal 0.15 is 15%), rounded
+        down to a whole dollar. Rates are applied in integer math.
+        """
+        if type(rate) is Rate:
+            return Funds._trusted(self.amount * rate.basis_points // BASIS_POINTS)
+        return Funds.of(to_amount(self.amount * rate))
+
+    __add__ = add
+    __radd__ = add
+    __sub__ = subtract
 
     def __str__(self):
         return f"${self.amount}"
 
+
+_INTERNED = [Funds(amount=amount) for amount in range(INTERNED_AMOUNTS)]
+_new = object.__new__
+# Slot descriptor setter, bypasses the frozen __setattr__ for trusted results
+_set_amount = Funds.__dict__["amount"].__set__
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+from monopoly.domain.exceptions.estate_exc import InvalidRateException
+
+# One basis point is a hundredth of a percent
+BASIS_POINTS = 10_000
+# Rates from 0% to 100% reuse shared instances
+_INTERNED_RATES = BASIS_POINTS + 1
+
+
+@dataclass(frozen=True, order=True, slots=True)
+class Rate:
+    """
+    Fraction held as whole basis points: Rate(1500) is 15%.
+
+    Applying a rate to an amount is pure integer math and rounds down (toward negative
+    infinity), the same rounding Funds.apply_rate has always used.
+    """
+
+    basis_points: int = 0
+
+    def __post_init__(self):
+        if self.basis_points < 0:
+            raise InvalidRateException(self.basis_points)
+
+    @classmethod
+    def of(cls, basis_points: int) -> "Rate":
+        if 0 <= basis_points < _INTERNED_RATES:
+            return _INTERNED[basis_points]
+        return cls(basis_points=basis_points)
+
+    @classmethod
+    def from_decimal(cls, fraction: Decimal | str) -> "Rate":
+        """
+        Rate of a fraction such as Decimal("0.15"). Fractions finer than a basis point are
+        rejected rather than rounded.
+        """
+        points = Decimal(fraction) * BASIS_POINTS
+        if points != points.to_integral_value():
+            raise InvalidRateException(fraction, "rates are whole basis points")
+        return cls.of(int(points))
+
+    @classmethod
+    def from_percent(cls, percent: int | Decimal | str) -> "Rate":
+        return cls.from_decimal(Decimal(percent) / 100)
+
+    def apply(self, amount: int) -> int:
+        return amount * self.basis_points // BASIS_POINTS
+
+    def complement(self) -> "Rate":
+        """
+        What is left after this rate is taken: 100% minus the rate.
+        """
+        return Rate.of(BASIS_POINTS - self.basis_points)
+
+    def add(self, other: "Rate") -> "Rate":
+        return Rate.of(self.basis_points + other.basis_points)
+
+    def subtract(self, other: "Rate") -> "Rate":
+        return Rate.of(self.basis_points - other.basis_points)
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.basis_points) / BASIS_POINTS
+
+    __add__ = add
+    __sub__ = subtract
+
+    def __bool__(self):
+        return self.basis_points != 0
+
+    def __str__(self):
+        return f"{Decimal(self.basis_points) / 100}%"
+
+
+_INTERNED = [Rate(basis_points=points) for points in range(_INTERNED_RATES)]
+ZERO = _INTERNED[0]
+FULL = _INTERNED[BASIS_POINTS]
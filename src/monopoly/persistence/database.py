@@ -0,0 +1,164 @@
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import AbstractContextManager, contextmanager
+from queue import Empty, LifoQueue
+from typing import Iterator
+
+from monopoly.persistence.exceptions import NoReaderAvailableError, PersistenceError
+
+log = logging.getLogger(__name__)
+
+# Static estate columns are written once, when the game is added; the rest change in play
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    fast_mode INTEGER NOT NULL,
+    turn INTEGER NOT NULL,
+    winner_id INTEGER,
+    start_time INTEGER NOT NULL,
+    end_time INTEGER,
+    managers BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    game_id INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+    player_id INTEGER NOT NULL,
+    seat INTEGER NOT NULL,
+    funds INTEGER NOT NULL,
+    eliminated INTEGER NOT NULL,
+    PRIMARY KEY (game_id, player_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS estates (
+    game_id INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+    estate_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    buildable INTEGER NOT NULL,
+    price INTEGER NOT NULL,
+    mortgage_price INTEGER NOT NULL,
+    buyback_price INTEGER NOT NULL,
+    rent INTEGER NOT NULL,
+    max_stars INTEGER NOT NULL,
+    owner_id INTEGER,
+    state INTEGER NOT NULL,
+    buyback_deadline INTEGER NOT NULL,
+    stars INTEGER NOT NULL,
+    PRIMARY KEY (game_id, estate_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS estates_by_owner ON estates (game_id, owner_id);
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL
+);
+"""
+
+
+class Database:
+    """
+    A SQLite database file in WAL mode, so lookups never wait for a write in progress.
+
+    Writes go through one connection, serialized by a lock, inside ``transaction``.
+    Lookups lease a read-only connection from ``readers``. Commits use synchronous=NORMAL:
+    in WAL mode a crash can lose the last transactions but never corrupts the file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], readers: int = 4, timeout: float = 5.0):
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._writer = self.connect()
+        self._writer.executescript(SCHEMA)
+        self.readers = ReaderPool(self, readers)
+
+    def connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        New connection in autocommit mode; transactions are begun explicitly.
+        """
+        # Pooled connections are handed from thread to thread, one user at a time
+        connection = sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+        )
+        (mode,) = connection.execute("PRAGMA journal_mode=WAL").fetchone()
+        if mode != "wal":
+            connection.close()
+            raise PersistenceError(f"{self.path} cannot be opened in WAL mode (got {mode}).")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        if read_only:
+            connection.execute("PRAGMA query_only=ON")
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        The writer connection inside one transaction, committed when the block exits and
+        rolled back if it raises.
+        """
+        with self._lock:
+            writer = self._writer
+            writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield writer
+            except BaseException:
+                writer.execute("ROLLBACK")
+                raise
+            writer.execute("COMMIT")
+
+    def reader(self) -> AbstractContextManager[sqlite3.Connection]:
+        return self.readers.connection()
+
+    def close(self) -> None:
+        self.readers.close()
+        with self._lock:
+            self._writer.close()
+
+    def __enter__(self) -> "Database":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ReaderPool:
+    """
+    Up to ``size`` read-only connections, opened on demand and reused. Each lease is one
+    read transaction, so every query made through it sees the same committed state.
+    """
+
+    def __init__(self, database: Database, size: int = 4):
+        if size < 1:
+            raise ValueError(f"A reader pool needs at least one connection, not {size}.")
+        self.database = database
+        self.size = size
+        self._idle: LifoQueue[sqlite3.Connection] = LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self.opened = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        if not self._slots.acquire(timeout=self.database.timeout):
+            raise NoReaderAvailableError(self.database.timeout)
+        try:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                connection = self.database.connect(read_only=True)
+                self.opened += 1
+                log.debug("Opened reader connection %s to %s.", self.opened, self.database.path)
+            connection.execute("BEGIN")
+            try:
+                yield connection
+            finally:
+                connection.execute("ROLLBACK")
+                self._idle.put(connection)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                return
@@ -0,0 +1,16 @@
+from monopoly.domain.exceptions.base import DomainError
+
+
+class PersistenceError(DomainError):
+    pass
+
+
+class GameNotFoundError(PersistenceError):
+    def __init__(self, game_id: int):
+        self.game_id = game_id
+        super().__init__(f"Game {game_id} is not in the database.")
+
+
+class NoReaderAvailableError(PersistenceError):
+    def __init__(self, timeout: float):
+        super().__init__(f"No reader connection became free within {timeout}s.")
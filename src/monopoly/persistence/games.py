@@ -0,0 +1,400 @@
+import sqlite3
+from typing import TYPE_CHECKING, Iterable
+
+from monopoly.domain.entities.estate import (
+    BuildableEstate,
+    Estate,
+    EstateCategory,
+    EstateId,
+    UnbuildableEstate,
+)
+from monopoly.domain.entities.estate_state import MORTGAGED, NOT_OWNED, OWNED, EstateState
+from monopoly.domain.entities.game.board import build_registry
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import Clock
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.events import (
+    BuybackCountdown,
+    DomainEvent,
+    EstateBought,
+    EstateBoughtBack,
+    EstateMortgaged,
+    EstatesTraded,
+    EventBus,
+    FundsTransferred,
+    FundsWithdrawn,
+    GameEnded,
+    GameStarted,
+    PlayerEliminated,
+    RentReduced,
+    StartPassed,
+    TaxRateChanged,
+    TurnStarted,
+    from_micros,
+    to_micros,
+)
+from monopoly.domain.snapshot import pack_managers, restore_managers
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.persistence.exceptions import GameNotFoundError
+
+if TYPE_CHECKING:
+    from monopoly.persistence.database import Database
+
+_STATES = (NOT_OWNED, OWNED, MORTGAGED)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+
+INSERT_GAME = (
+    "INSERT INTO games (fast_mode, turn, winner_id, start_time, end_time, managers)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+INSERT_PLAYER = (
+    "INSERT INTO players (game_id, player_id, seat, funds, eliminated) VALUES (?, ?, ?, ?, ?)"
+)
+INSERT_ESTATE = (
+    "INSERT INTO estates (game_id, estate_id, name, category, buildable, price, mortgage_price,"
+    " buyback_price, rent, max_stars, owner_id, state, buyback_deadline, stars)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+UPDATE_GAME = (
+    "UPDATE games SET turn = ?, winner_id = ?, start_time = ?, end_time = ?, managers = ?"
+    " WHERE id = ?"
+)
+UPDATE_PLAYER = "UPDATE players SET funds = ?, eliminated = ? WHERE game_id = ? AND player_id = ?"
+UPDATE_ESTATE = (
+    "UPDATE estates SET owner_id = ?, state = ?, buyback_deadline = ?, stars = ?"
+    " WHERE game_id = ? AND estate_id = ?"
+)
+
+# Rows of one commit: the game's, then its players' and estates', each ending in its key
+Rows = tuple[list[tuple], list[tuple], list[tuple]]
+
+# Fields of the events that change the funds or seat of the players they name
+_PLAYERS_CHANGED: dict[type[DomainEvent], tuple[str, ...]] = {
+    EstateBought: ("player_id",),
+    EstateMortgaged: ("player_id",),
+    EstateBoughtBack: ("player_id",),
+    EstatesTraded: ("player_id", "other_player_id"),
+    FundsTransferred: ("payer_id", "payee_id"),
+    FundsWithdrawn: ("player_id",),
+    StartPassed: ("player_id",),
+    PlayerEliminated: ("player_id",),
+}
+# Events that change the turn, the times, the winner or the managers
+_GAME_CHANGED = frozenset({GameStarted, TurnStarted, TaxRateChanged, RentReduced, GameEnded})
+
+
+def _game_state(game: Game) -> tuple:
+    time_manager = game.time_manager
+    return (
+        game.current_turn,
+        game.winner.identity if game.winner else None,
+        to_micros(time_manager.start_time),
+        to_micros(time_manager.end_time) if time_manager.end_time else None,
+        pack_managers(game),
+    )
+
+
+def _estate_state(estate: Estate) -> tuple:
+    return (
+        estate.owner,
+        _STATE_CODES[estate._state],
+        estate.buyback_deadline,
+        estate.stars if isinstance(estate, BuildableEstate) else 0,
+    )
+
+
+def _player_row(player: Player, eliminated: bool, game_id: int) -> tuple:
+    return player.funds.amount, eliminated, game_id, player.identity
+
+
+def _estate_row(estate: Estate, game_id: int) -> tuple:
+    return *_estate_state(estate), game_id, estate.identity
+
+
+def _estates(game: Game) -> list[Estate]:
+    estates = [estate for estates in game.estate_registry.values() for estate in estates]
+    estates.sort(key=lambda estate: estate.identity)
+    return estates
+
+
+class GameRepository:
+    """
+    Games stored as rows: one per game, with its turn, times, winner and packed manager
+    state, one per player and one per estate. ``add`` stores a new game and ``save``
+    rewrites one in full; in play, a UnitOfWork writes only what each turn changed.
+    Lookups and ``get`` read through the database's reader pool.
+    """
+
+    def __init__(self, database: "Database"):
+        self.database = database
+
+    def add(self, game: Game) -> int:
+        """
+        Store ``game`` and return its id.
+        """
+        with self.database.transaction() as connection:
+            cursor = connection.execute(INSERT_GAME, (game.fast_mode, *_game_state(game)))
+            game_id = cursor.lastrowid
+            seats = [(player, False) for player in game.players]
+            seats += [(player, True) for player in game.player_manager.eliminated]
+            connection.executemany(INSERT_PLAYER, [
+                (game_id, player.identity, seat, player.funds.amount, eliminated)
+                for seat, (player, eliminated) in enumerate(seats)
+            ])
+            connection.executemany(INSERT_ESTATE, [
+                (
+                    game_id, estate.identity, estate.name, estate.category.name,
+                    isinstance(estate, BuildableEstate), estate.price, estate.mortgage_price,
+                    estate.buyback_price, estate.rent,
+                    estate.max_stars if isinstance(estate, BuildableEstate) else 0,
+                    *_estate_state(estate),
+                )
+                for estate in _estates(game)
+            ])
+        return game_id
+
+    def save(self, game_id: int, game: Game) -> None:
+        """
+        Rewrite every changing column of a stored game, as after ``Game.reset`` or any
+        change made while no unit of work was attached.
+        """
+        eliminated = game.player_manager.eliminated
+        rows: Rows = (
+            [(*_game_state(game), game_id)],
+            [_player_row(player, False, game_id) for player in game.players]
+            + [_player_row(player, True, game_id) for player in eliminated],
+            [_estate_row(estate, game_id) for estate in _estates(game)],
+        )
+        with self.database.transaction() as connection:
+            self._write(connection, rows)
+
+    def unit_of_work(self, game_id: int, game: Game) -> "UnitOfWork":
+        return UnitOfWork(self, game_id, game)
+
+    def commit(self, units: Iterable["UnitOfWork"]) -> int:
+        """
+        Write the pending changes of several units in one transaction, as one batch per
+        table. Returns the number of rows written.
+        """
+        units = [unit for unit in units if unit.pending]
+        if not units:
+            return 0
+        rows: Rows = ([], [], [])
+        for unit in units:
+            games, players, estates = unit.rows()
+            rows[0].extend(games)
+            rows[1].extend(players)
+            rows[2].extend(estates)
+        with self.database.transaction() as connection:
+            self._write(connection, rows)
+        # Only cleared once written, so a failed commit keeps every change pending
+        for unit in units:
+            unit.clear()
+        return sum(map(len, rows))
+
+    @staticmethod
+    def _write(connection: sqlite3.Connection, rows: Rows) -> None:
+        games, players, estates = rows
+        if games:
+            connection.executemany(UPDATE_GAME, games)
+        if players:
+            connection.executemany(UPDATE_PLAYER, players)
+        if estates:
+            connection.executemany(UPDATE_ESTATE, estates)
+
+    def get(self, game_id: int, clock: Clock | None = None) -> Game:
+        """
+        Load a stored game as a new Game. Pass ``clock`` to drive it by another clock than
+        the wall clock, such as a VirtualClock.
+        """
+        with self.database.reader() as connection:
+            game_row = connection.execute(
+                "SELECT fast_mode, turn, winner_id, start_time, end_time, managers"
+                " FROM games WHERE id = ?",
+                (game_id,),
+            ).fetchone()
+            if game_row is None:
+                raise GameNotFoundError(game_id)
+            player_rows = connection.execute(
+                "SELECT player_id, funds, eliminated FROM players WHERE game_id = ? ORDER BY seat",
+                (game_id,),
+            ).fetchall()
+            estate_rows = connection.execute(
+                "SELECT estate_id, name, category, buildable, price, mortgage_price,"
+                " buyback_price, rent, max_stars, owner_id, state, buyback_deadline, stars"
+                " FROM estates WHERE game_id = ? ORDER BY estate_id",
+                (game_id,),
+            ).fetchall()
+
+        estates: list[Estate] = []
+        owned: dict[int, dict[EstateId, Estate]] = {}
+        for (
+            identity, name, category, buildable, price, mortgage_price, buyback_price, rent,
+            max_stars, owner, state, deadline, stars,
+        ) in estate_rows:
+            fields = dict(
+                identity=EstateId(identity), name=name, price=price,
+                mortgage_price=mortgage_price, buyback_price=buyback_price, rent=rent,
+                category=EstateCategory[category], _state=_STATES[state],
+                owner=PlayerId(owner) if owner is not None else None,
+                buyback_deadline=deadline,
+            )
+            estate: Estate = (
+                BuildableEstate(**fields, stars=stars, max_stars=max_stars)
+                if buildable else UnbuildableEstate(**fields)
+            )
+            estates.append(estate)
+            if owner is not None:
+                owned.setdefault(owner, {})[estate.identity] = estate
+
+        active: list[Player] = []
+        eliminated: list[Player] = []
+        for identity, funds, is_eliminated in player_rows:
+            player = Player(
+                identity=PlayerId(identity), funds=Funds.of(funds),
+                estates=owned.get(identity, {}),
+            )
+            (eliminated if is_eliminated else active).append(player)
+
+        fast_mode, turn, winner_id, start_time, end_time, managers = game_row
+        game = Game(
+            players=active,
+            estate_registry=build_registry(estates),
+            fast_mode=bool(fast_mode),
+            **({"clock": clock} if clock is not None else {}),
+        )
+        game.player_manager.eliminated.extend(eliminated)
+        restore_managers(game, managers)
+        game.current_turn = turn
+        game.time_manager.start_time = from_micros(start_time)
+        game.time_manager.end_time = from_micros(end_time) if end_time is not None else None
+        if winner_id is not None:
+            game.winner = next(
+                player for player in (*active, *eliminated) if player.identity == winner_id
+            )
+        return game
+
+    def funds(self, game_id: int) -> dict[PlayerId, int]:
+        with self.database.reader() as connection:
+            return {
+                PlayerId(player_id): funds
+                for player_id, funds in connection.execute(
+                    "SELECT player_id, funds FROM players WHERE game_id = ? ORDER BY seat",
+                    (game_id,),
+                )
+            }
+
+    def owned_by(self, game_id: int, player_id: PlayerId) -> list[EstateId]:
+        with self.database.reader() as connection:
+            return [
+                EstateId(estate_id)
+                for (estate_id,) in connection.execute(
+                    "SELECT estate_id FROM estates WHERE game_id = ? AND owner_id = ?"
+                    " ORDER BY estate_id",
+                    (game_id, player_id),
+                )
+            ]
+
+
+class UnitOfWork:
+    """
+    Changes made to one stored game since its last commit, written in one transaction.
+
+    The unit is the game's event sink, for the funds and seats of players and for the turn,
+    times and managers, and an observer of its estates, for ownership, state transitions
+    and stars. It only remembers what changed: rows are read from the live objects when
+    committed, so an entity changed many times in a turn is written once. A sink already
+    attached to the game keeps receiving events while the unit is open.
+
+        with repository.unit_of_work(game_id, game) as unit:
+            while not game.is_game_over():
+                game.advance_turn(take_turn)
+                unit.commit()
+
+    Leaving the block commits what is left unless it raises; pending changes are then
+    dropped and the stored game stays at the last commit.
+    """
+
+    def __init__(self, repository: GameRepository, game_id: int, game: Game):
+        self.repository = repository
+        self.game_id = game_id
+        self.game = game
+        self._players = {
+            player.identity: player for player in (*game.players, *game.player_manager.eliminated)
+        }
+        self._estates = {estate.identity: estate for estate in _estates(game)}
+        self._changed_players: set[int] = set()
+        self._changed_estates: set[Estate] = set()
+        self._game_changed = False
+
+        self._previous = game.events
+        self._sink = self if self._previous is None else EventBus(self._previous, self)
+        game.attach_events(self._sink)
+        for estate in self._estates.values():
+            estate.attach(self)
+
+    def emit(self, event: DomainEvent) -> None:
+        event_type = type(event)
+        fields = _PLAYERS_CHANGED.get(event_type)
+        if fields is not None:
+            for name in fields:
+                self._changed_players.add(getattr(event, name))
+        elif event_type in _GAME_CHANGED:
+            self._game_changed = True
+            if event_type is GameStarted:
+                self._changed_players.update(self._players)
+        elif event_type is BuybackCountdown:
+            self._changed_estates.add(self._estates[event.estate_id])
+
+    def estate_changed(
+        self, estate: Estate, previous_owner: PlayerId | None, previous_state: EstateState
+    ) -> None:
+        self._changed_estates.add(estate)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._game_changed or self._changed_players or self._changed_estates)
+
+    def rows(self) -> Rows:
+        """
+        Current rows of everything changed since the last commit.
+        """
+        game_id = self.game_id
+        eliminated = {player.identity for player in self.game.player_manager.eliminated}
+        players = self._players
+        return (
+            [(*_game_state(self.game), game_id)] if self._game_changed else [],
+            [
+                _player_row(players[identity], identity in eliminated, game_id)
+                for identity in self._changed_players
+            ],
+            [_estate_row(estate, game_id) for estate in self._changed_estates],
+        )
+
+    def clear(self) -> None:
+        self._changed_players.clear()
+        self._changed_estates.clear()
+        self._game_changed = False
+
+    def commit(self) -> int:
+        return self.repository.commit((self,))
+
+    def close(self) -> None:
+        """
+        Stop tracking the game and give its event sink back; pending changes are dropped.
+        """
+        for estate in self._estates.values():
+            estate.detach(self)
+        if self.game.events is self._sink:
+            self.game.attach_events(self._previous)
+        self.clear()
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self.close()
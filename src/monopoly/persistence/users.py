@@ -0,0 +1,36 @@
+import sqlite3
+from typing import TYPE_CHECKING
+
+from monopoly.subdomain.auth import User, UserId, Username, UsernameTakenError
+
+if TYPE_CHECKING:
+    from monopoly.persistence.database import Database
+
+
+class SqliteUserRepository:
+    """
+    Users in the ``users`` table, whose UNIQUE constraint keeps usernames unique.
+    """
+
+    def __init__(self, database: "Database"):
+        self.database = database
+
+    def get_by_username(self, username: Username) -> User | None:
+        with self.database.reader() as connection:
+            row = connection.execute(
+                "SELECT id, email FROM users WHERE username = ?", (username.value,)
+            ).fetchone()
+        if row is None:
+            return None
+        identity, email = row
+        return User(identity=UserId(identity), username=username, email=email)
+
+    def add(self, username: Username, email: str) -> User:
+        try:
+            with self.database.transaction() as connection:
+                cursor = connection.execute(
+                    "INSERT INTO users (username, email) VALUES (?, ?)", (username.value, email)
+                )
+        except sqlite3.IntegrityError as e:
+            raise UsernameTakenError(username) from e
+        return User(identity=UserId(cursor.lastrowid), username=username, email=email)
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any
+
+from monopoly.domain.entities.estate import EstateId
+from monopoly.domain.entities.player import PlayerId
+from monopoly.server.commands import Buy, Buyback, Command, EndTurn, Mortgage, Trade
+from monopoly.server.exceptions import StaleCommandError
+from monopoly.server.host import GameHost
+
+
+class LocalClient:
+    """
+    In-process client for one seat. Tracks the table version it last saw, stamps it on
+    every command and catches up when a command is rejected as stale. With a ``timeout``,
+    waiting on a stuck table fails with TimeoutError instead of hanging.
+    """
+
+    def __init__(
+        self, host: GameHost, table_id: int, player_id: PlayerId, timeout: float | None = None
+    ):
+        self.host = host
+        self.table_id = table_id
+        self.player_id = player_id
+        self.timeout = timeout
+        self.version = 0
+
+    async def send(self, command_type: type[Command], **fields: Any) -> int:
+        command = command_type(player_id=self.player_id, version=self.version, **fields)
+        reply = self.host.submit(self.table_id, command)
+        try:
+            if self.timeout is None:
+                self.version = await reply
+            else:
+                self.version = await asyncio.wait_for(reply, self.timeout)
+        except StaleCommandError as e:
+            self.version = e.current_version
+            raise
+        return self.version
+
+    async def buy(self, estate_id: EstateId) -> int:
+        return await self.send(Buy, estate_id=estate_id)
+
+    async def mortgage(self, estate_id: EstateId) -> int:
+        return await self.send(Mortgage, estate_id=estate_id)
+
+    async def buyback(self, estate_id: EstateId) -> int:
+        return await self.send(Buyback, estate_id=estate_id)
+
+    async def trade(
+        self,
+        other_player_id: PlayerId,
+        give: tuple[EstateId, ...] = (),
+        receive: tuple[EstateId, ...] = (),
+        funds_to_give: int = 0,
+        funds_to_receive: int = 0,
+    ) -> int:
+        return await self.send(
+            Trade,
+            other_player_id=other_player_id,
+            give=give,
+            receive=receive,
+            funds_to_give=funds_to_give,
+            funds_to_receive=funds_to_receive,
+        )
+
+    async def end_turn(self) -> int:
+        return await self.send(EndTurn)
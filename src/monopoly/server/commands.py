@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from monopoly.domain.entities.estate import EstateId
+from monopoly.domain.entities.player import PlayerId
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Command:
+    """
+    A player's request to a table. ``version`` is the table version the player last saw;
+    commands issued against an older version are rejected as stale.
+    """
+
+    player_id: PlayerId
+    version: int
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Buy(Command):
+    estate_id: EstateId
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Mortgage(Command):
+    estate_id: EstateId
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Buyback(Command):
+    estate_id: EstateId
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Trade(Command):
+    other_player_id: PlayerId
+    give: tuple[EstateId, ...] = ()
+    receive: tuple[EstateId, ...] = ()
+    funds_to_give: int = 0
+    funds_to_receive: int = 0
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class EndTurn(Command):
+    pass
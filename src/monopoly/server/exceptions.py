@@ -0,0 +1,40 @@
+from monopoly.domain.exceptions.base import DomainError
+
+
+class CommandRejected(DomainError):
+    pass
+
+
+class StaleCommandError(CommandRejected):
+    def __init__(self, version: int, current_version: int):
+        self.version = version
+        self.current_version = current_version
+        super().__init__(
+            f"Command was issued at version {version}; the table is at {current_version}."
+        )
+
+
+class NotYourTurnError(CommandRejected):
+    def __init__(self, player_id: int):
+        self.player_id = player_id
+        super().__init__(f"It is not Player {player_id}'s turn.")
+
+
+class UnknownPlayerError(CommandRejected):
+    def __init__(self, player_id: int):
+        super().__init__(f"Player {player_id} is not seated at this table.")
+
+
+class UnknownEstateError(CommandRejected):
+    def __init__(self, estate_id: int):
+        super().__init__(f"Estate {estate_id} is not on this board.")
+
+
+class TableBusyError(CommandRejected):
+    def __init__(self, table_id: int):
+        super().__init__(f"Table {table_id} has too many pending commands.")
+
+
+class TableClosedError(CommandRejected):
+    def __init__(self, table_id: int):
+        super().__init__(f"Table {table_id} is closed.")
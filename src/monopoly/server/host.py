@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from typing import Sequence
+
+from monopoly.domain.entities.estate import EstateCategory
+from monopoly.domain.entities.game.board import DEFAULT_BOARD, build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.metrics import MetricsRegistry, install, uninstall
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.server.commands import Command
+from monopoly.server.exceptions import TableClosedError
+from monopoly.server.table import Table
+from monopoly.server.timer_wheel import Timer, TimerWheel
+
+log = logging.getLogger(__name__)
+
+
+class GameHost:
+    """
+    Hosts many tables on one event loop. Each table runs its own actor task; a shared
+    timer wheel drives every game's clock and time-based transitions.
+
+        async with GameHost() as host:
+            table = host.open_table(players=4)
+            version = await host.submit(table.table_id, Buy(...))
+    """
+
+    def __init__(
+        self,
+        wheel: TimerWheel | None = None,
+        max_pending: int = 256,
+        metrics: MetricsRegistry | None = None,
+    ):
+        self.wheel = wheel if wheel is not None else TimerWheel()
+        self.max_pending = max_pending
+        # Domain operations are timed into this registry while the host runs. The timing
+        # is process-wide, so hosts running at the same time must share one registry.
+        self.metrics = metrics
+        self._instrumented = False
+        self.tables: dict[int, Table] = {}
+        self._tasks: dict[int, asyncio.Task[None]] = {}
+        self._timers: dict[int, list[Timer]] = {}
+        self._wheel_task: asyncio.Task[None] | None = None
+        self._next_id = 1
+
+    async def __aenter__(self) -> "GameHost":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        if self.metrics is not None and not self._instrumented:
+            # Raises RuntimeError while another host's registry is installed
+            install(self.metrics)
+            self._instrumented = True
+        self._wheel_task = asyncio.get_running_loop().create_task(self.wheel.run())
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+        if self._wheel_task is not None:
+            tasks.append(self._wheel_task)
+        for table in self.tables.values():
+            if not table.closed:
+                table.close()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._wheel_task = None
+        if self._instrumented:
+            uninstall()
+            self._instrumented = False
+
+    def metrics_snapshot(self) -> str:
+        """
+        Prometheus text exposition of the host's metrics, empty without a registry.
+        """
+        return self.metrics.snapshot() if self.metrics is not None else ""
+
+    def open_table(
+        self,
+        players: int = 4,
+        board: Sequence[tuple[int, str, int, int, int, int, EstateCategory]] = DEFAULT_BOARD,
+        fast_mode: bool = False,
+    ) -> Table:
+        estates = create_estates(tuple(board))
+        game = Game(
+            players=[
+                Player(identity=PlayerId(seat + 1), funds=Funds.of(0)) for seat in range(players)
+            ],
+            estate_registry=build_registry(estates),
+            fast_mode=fast_mode,
+            clock=self.wheel,
+        )
+        game.start_game()
+
+        table = Table(self._next_id, game, max_pending=self.max_pending)
+        self._next_id += 1
+        self.tables[table.table_id] = table
+        self._tasks[table.table_id] = asyncio.get_running_loop().create_task(self._run(table))
+        self._schedule_transitions(table)
+        return table
+
+    def _schedule_transitions(self, table: Table) -> None:
+        game = table.game
+        time_manager = game.time_manager
+        # Rent reduction is turn-based and the start bonus checks the cached clock, so only
+        # the tax increase and the end of the game are timed
+        self._timers[table.table_id] = [
+            self.wheel.schedule(
+                time_manager.tax_increase_start_after,
+                lambda: table.schedule(lambda: game.tax_manager.update_tax_rate(time_manager)),
+            ),
+            self.wheel.schedule(
+                time_manager.game_duration,
+                lambda: table.schedule(game.end_game),
+            ),
+        ]
+
+    async def _run(self, table: Table) -> None:
+        try:
+            await table.run()
+        finally:
+            for timer in self._timers.pop(table.table_id, ()):
+                timer.cancel()
+            self._tasks.pop(table.table_id, None)
+
+    def submit(self, table_id: int, command: Command) -> "asyncio.Future[int]":
+        table = self.tables.get(table_id)
+        if table is None:
+            future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+            future.set_exception(TableClosedError(table_id))
+            return future
+        return table.submit(command)
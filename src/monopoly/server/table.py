@@ -0,0 +1,175 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Callable
+
+from monopoly.domain.entities.estate import Estate, EstateId
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.player import Player
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.server.commands import Buy, Buyback, Command, EndTurn, Mortgage, Trade
+from monopoly.server.exceptions import (
+    NotYourTurnError,
+    StaleCommandError,
+    TableBusyError,
+    TableClosedError,
+    UnknownEstateError,
+    UnknownPlayerError,
+)
+
+log = logging.getLogger(__name__)
+
+Transition = Callable[[], None]
+
+
+class Table:
+    """
+    Actor owning one game. Commands and timer transitions are queued and applied one at
+    a time by the table's own task, so the game is never mutated concurrently.
+
+    Every applied command or transition bumps ``version``. A command carrying any other
+    version was decided on out-of-date state and is rejected with StaleCommandError.
+    """
+
+    def __init__(self, table_id: int, game: Game, max_pending: int = 256, batch: int = 32):
+        self.table_id = table_id
+        self.game = game
+        self.version = 0
+        self.seat = 0
+        self.closed = False
+        self.max_pending = max_pending
+        # Commands applied before the actor yields to other tables
+        self.batch = batch
+
+        self._pending: deque[tuple[Command, asyncio.Future[int]]] = deque()
+        self._transitions: deque[Transition] = deque()
+        self._wakeup = asyncio.Event()
+        self._players = {player.identity: player for player in game.players}
+        self._estates: dict[EstateId, Estate] = {
+            estate.identity: estate
+            for estates in game.estate_registry.values() for estate in estates
+        }
+        self._handlers: dict[type[Command], Callable[[Command, Player], None]] = {
+            Buy: self._buy,
+            Mortgage: self._mortgage,
+            Buyback: self._buyback,
+            Trade: self._trade,
+            EndTurn: self._end_turn,
+        }
+
+    @property
+    def current_player(self) -> Player:
+        return self.game.players[self.seat]
+
+    def submit(self, command: Command) -> "asyncio.Future[int]":
+        """
+        Queue a command. The future resolves to the table version after the command, or
+        fails with the reason it was rejected.
+        """
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        if self.closed:
+            future.set_exception(TableClosedError(self.table_id))
+        elif len(self._pending) >= self.max_pending:
+            future.set_exception(TableBusyError(self.table_id))
+        else:
+            self._pending.append((command, future))
+            self._wakeup.set()
+        return future
+
+    def schedule(self, transition: Transition) -> None:
+        """
+        Queue a time-driven transition. Transitions are never dropped and run before the
+        commands that are waiting.
+        """
+        if not self.closed:
+            self._transitions.append(transition)
+            self._wakeup.set()
+
+    async def run(self) -> None:
+        pending = self._pending
+        transitions = self._transitions
+        while not self.closed:
+            if not pending and not transitions:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            for _ in range(self.batch):
+                if transitions:
+                    try:
+                        transitions.popleft()()
+                    except Exception:
+                        log.exception("Transition failed on table %s.", self.table_id)
+                    self.version += 1
+                elif pending:
+                    command, future = pending.popleft()
+                    if not future.done():
+                        try:
+                            future.set_result(self._apply(command))
+                        except Exception as error:
+                            future.set_exception(error)
+                else:
+                    break
+                if self.game.is_game_over():
+                    self.close()
+                    return
+            # Let the other tables run before working through the rest of the backlog
+            await asyncio.sleep(0)
+
+    def close(self) -> None:
+        self.closed = True
+        while self._pending:
+            _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(TableClosedError(self.table_id))
+        self._transitions.clear()
+        self._wakeup.set()
+        log.info("Table %s closed at version %s.", self.table_id, self.version)
+
+    def _apply(self, command: Command) -> int:
+        if command.version != self.version:
+            raise StaleCommandError(command.version, self.version)
+        player = self._players.get(command.player_id)
+        if player is None:
+            raise UnknownPlayerError(command.player_id)
+        if player is not self.current_player:
+            raise NotYourTurnError(command.player_id)
+
+        self._handlers[type(command)](command, player)
+        self.version += 1
+        return self.version
+
+    def _estate(self, estate_id: EstateId) -> Estate:
+        estate = self._estates.get(estate_id)
+        if estate is None:
+            raise UnknownEstateError(estate_id)
+        return estate
+
+    def _buy(self, command: Buy, player: Player) -> None:
+        player.buy_estate(self._estate(command.estate_id))
+
+    def _mortgage(self, command: Mortgage, player: Player) -> None:
+        player.mortgage(self._estate(command.estate_id))
+
+    def _buyback(self, command: Buyback, player: Player) -> None:
+        player.buyback(self._estate(command.estate_id))
+
+    def _trade(self, command: Trade, player: Player) -> None:
+        other = self._players.get(command.other_player_id)
+        if other is None:
+            raise UnknownPlayerError(command.other_player_id)
+        player.trade_estates(
+            other,
+            [self._estate(estate_id) for estate_id in command.give],
+            [self._estate(estate_id) for estate_id in command.receive],
+            funds_to_give=Funds.of(command.funds_to_give),
+            funds_to_receive=Funds.of(command.funds_to_receive),
+        )
+
+    def _end_turn(self, command: EndTurn, player: Player) -> None:
+        self.seat += 1
+        if self.seat >= len(self.game.players):
+            # Every seat has played: the game moves on to its next turn
+            self.seat = 0
+            self.game.advance_turn()
+
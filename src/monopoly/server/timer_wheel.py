@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from math import ceil
+from typing import Callable
+
+from monopoly.domain.entities.game.time_manager import Clock
+
+log = logging.getLogger(__name__)
+
+
+class Timer:
+    __slots__ = ("callback", "rounds", "cancelled")
+
+    def __init__(self, callback: Callable[[], None], rounds: int):
+        self.callback = callback
+        self.rounds = rounds
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    Hashed timing wheel shared by every table on a host.
+
+    One task ticks the wheel; each tick reads the real clock once and fires the timers
+    that are due. The wheel is also a ``Clock``: games read the time cached at the last
+    tick instead of calling ``datetime.now()`` themselves.
+    """
+
+    def __init__(
+        self, tick: timedelta = timedelta(seconds=1), slots: int = 512, clock: Clock = datetime.now
+    ):
+        self.tick_length = tick
+        self._slots: list[list[Timer]] = [[] for _ in range(slots)]
+        self._cursor = 0
+        self._clock = clock
+        self.now = clock()
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def schedule(self, delay: timedelta, callback: Callable[[], None]) -> Timer:
+        """
+        Run ``callback`` on the first tick at least ``delay`` from now.
+        """
+        ticks = max(1, ceil(delay / self.tick_length))
+        rounds, offset = divmod(ticks - 1, len(self._slots))
+        timer = Timer(callback, rounds)
+        self._slots[(self._cursor + offset) % len(self._slots)].append(timer)
+        return timer
+
+    def tick(self) -> None:
+        self.now = self._clock()
+        slot = self._slots[self._cursor]
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        if not slot:
+            return
+
+        due: list[Timer] = []
+        waiting: list[Timer] = []
+        for timer in slot:
+            if timer.cancelled:
+                continue
+            if timer.rounds:
+                timer.rounds -= 1
+                waiting.append(timer)
+            else:
+                due.append(timer)
+        slot[:] = waiting
+        for timer in due:
+            try:
+                timer.callback()
+            except Exception:
+                log.exception("Timer callback failed.")
+
+    async def run(self) -> None:
+        seconds = self.tick_length.total_seconds()
+        while True:
+            await asyncio.sleep(seconds)
+            self.tick()
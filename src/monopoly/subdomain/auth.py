@@ -1,20 +1,44 @@
 from dataclasses import dataclass
-from typing import NewType
+from typing import NewType, Protocol
+
+from monopoly.domain.exceptions.base import DomainError
 
 UserId = NewType("UserId", int)
 
 
-@dataclass
-class Username(kw_only=True, slots=True, frozen=True):
+@dataclass(kw_only=True, slots=True, frozen=True)
+class Username:
     value: str
 
 
-### Create auth subdomain
-
-
-### Add to user check if username is unique before creating, move it to subdomain
-@dataclass
-class User(kw_only=True, slots=True):
+@dataclass(kw_only=True, slots=True)
+class User:
     identity: UserId
     username: Username
     email: str
+
+
+class UsernameTakenError(DomainError):
+    def __init__(self, username: Username):
+        self.username = username
+        super().__init__(f"The username '{username.value}' is already taken.")
+
+
+class UserRepository(Protocol):
+    def get_by_username(self, username: Username) -> User | None: ...
+
+    def add(self, username: Username, email: str) -> User:
+        """
+        Store a new user, raising UsernameTakenError if the username is held already.
+        """
+        ...
+
+
+def register_user(users: UserRepository, username: Username, email: str) -> User:
+    """
+    Create a user under a username nobody holds yet. The repository refuses duplicates as
+    well, for two registrations of the same name racing past this check.
+    """
+    if users.get_by_username(username) is not None:
+        raise UsernameTakenError(username)
+    return users.add(username, email)
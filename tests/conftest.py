@@ -3,6 +3,11 @@ import logging
 import betterlogging
 import pytest
 
+from monopoly.domain.entities.estate import BuildableEstate
+from monopoly.domain.entities.game.board import DEFAULT_BOARD
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_logging():
@@ -16,4 +21,45 @@ def setup_logging():
     logger = logging.getLogger()
     logger.setLevel(log_level)
 
-    yield
\ No newline at end of file
+    yield
+
+
+@pytest.fixture(scope="session")
+def high_rent_board():
+    # Rents raised so players go bankrupt and games end with eliminations and a winner
+    return tuple(
+        (identity, name, price, mortgage, buyback, price * 20, category)
+        for identity, name, price, mortgage, buyback, _, category in DEFAULT_BOARD
+    )
+
+
+@pytest.fixture
+def simulated_game(high_rent_board):
+    """
+    Builds an unplayed three player game on ``high_rent_board``.
+    """
+    def simulated_game(seed: int = 11, turns: int = 200) -> SimulatedGame:
+        config = SimulationConfig(players=3, board=high_rent_board, max_turns=turns)
+        return SimulatedGame(seed=seed, config=config, policies=[GreedyPolicy(), CautiousPolicy()])
+
+    return simulated_game
+
+
+@pytest.fixture
+def played_game(simulated_game):
+    """
+    Plays a game for ``turns`` turns, then builds a star on an estate and mortgages it.
+    """
+    def played_game(turns: int = 40):
+        simulated = simulated_game(turns=turns)
+        simulated.run()
+        game = simulated.game
+        player = next(player for player in game.players if player.estates)
+        estate = next(
+            estate for estate in player.estates.values() if isinstance(estate, BuildableEstate)
+        )
+        estate.build_star()
+        player.mortgage(estate)
+        return game
+
+    return played_game
@@ -0,0 +1,58 @@
+# tests/domain/game/conftest.py
+
+import pytest
+
+from monopoly.domain.entities.estate import Estate, EstateId
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+
+
+# Override seats, funds or started in a test module to change the game below
+
+
+@pytest.fixture
+def seats():
+    return 2
+
+
+@pytest.fixture
+def funds():
+    return 5000
+
+
+@pytest.fixture
+def started():
+    return False
+
+
+@pytest.fixture
+def game(seats, funds, started):
+    game = Game(
+        players=[
+            Player(identity=PlayerId(seat), funds=Funds(amount=funds))
+            for seat in range(1, seats + 1)
+        ],
+        estate_registry=build_registry(create_estates()),
+        clock=VirtualClock(),
+    )
+    if started:
+        game.initialize_game()
+        # Starting funds are replaced by the module's own
+        for player in game.players:
+            player.funds = Funds(amount=funds)
+    return game
+
+
+@pytest.fixture
+def estates_of():
+    """
+    Every estate of a game, by identity in ascending order.
+    """
+    def estates_of(game: Game) -> dict[EstateId, Estate]:
+        estates = (estate for members in game.estate_registry.values() for estate in members)
+        return {estate.identity: estate for estate in sorted(estates, key=lambda e: e.identity)}
+
+    return estates_of
@@ -0,0 +1,194 @@
+# tests/domain/game/test_board_file.py
+
+from datetime import timedelta
+
+import pytest
+
+from monopoly.domain.entities.estate import BuildableEstate, EstateCategory, EstateId
+from monopoly.domain.entities.game import board_file
+from monopoly.domain.entities.game.board import build_registry
+from monopoly.domain.entities.game.board_file import (
+    compile_board,
+    format_board,
+    load_board,
+    parse_board,
+    read_compiled,
+)
+from monopoly.domain.entities.game.catalog import BoardCatalog
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.exceptions.board_exc import InvalidBoardException
+from monopoly.domain.resident import ResidentGame
+from monopoly.domain.snapshot import dump, fork, restore
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+from monopoly.persistence.database import Database
+from monopoly.persistence.games import GameRepository
+
+BOARD = """
+[rules]
+rent_reduction_interval_turns = 10
+tax_step = 500
+starting_funds = 3000
+game_duration_minutes = 90
+
+[categories.Airlines]
+buildable = false
+
+[categories.Hotels]
+max_stars = 3
+
+[[estates]]
+id = 3
+name = "Sky Gateway"
+price = 190
+mortgage = 95
+buyback = 105
+rent = 19
+category = "Airlines"
+
+[[estates]]
+id = 1
+name = "Grand Lodge"
+price = 320
+mortgage = 160
+buyback = 176
+rent = 32
+category = "Hotels"
+
+[[estates]]
+id = 2
+name = "Кафе \\"Ранок\\""
+price = 250
+mortgage = 125
+buyback = 137
+rent = 25
+category = "Restaurants"
+max_stars = 2
+"""
+
+ESTATE = """
+[[estates]]
+id = 1
+name = "Tech Town"
+price = 160
+mortgage = 80
+buyback = 88
+rent = 16
+category = "Electronics"
+"""
+
+
+def _same(first: BoardCatalog, second: BoardCatalog) -> bool:
+    return list(first.specs) == list(second.specs) and first.rules == second.rules
+
+
+def test_parse_board_applies_category_overrides_and_rules():
+    catalog = parse_board(BOARD)
+
+    assert list(catalog.identities) == [1, 2, 3]
+    assert catalog.spec(EstateId(3)).buildable is False
+    assert catalog.spec(EstateId(1)).max_stars == 3
+    assert catalog.spec(EstateId(2)).name == 'Кафе "Ранок"'
+    assert catalog.spec(EstateId(2)).max_stars == 2
+    assert catalog.categories[EstateCategory.HOTELS] == (EstateId(1),)
+    assert catalog.rules.rent_reduction_interval_turns == 10
+    assert catalog.rules.tax_step == Rate(500)
+    assert catalog.rules.game_duration == timedelta(minutes=90)
+
+
+def test_format_and_compile_round_trip():
+    for catalog in (BoardCatalog.default(), parse_board(BOARD)):
+        assert _same(parse_board(format_board(catalog)), catalog)
+        assert _same(read_compiled(compile_board(catalog)), catalog)
+
+
+def test_load_board_compiles_once(tmp_path, monkeypatch):
+    path = tmp_path / "board.toml"
+    path.write_text(BOARD, encoding="utf-8")
+    first = load_board(path)
+    cached = list((tmp_path / board_file.CACHE_DIR_NAME).iterdir())
+    assert [file.suffix for file in cached] == [".board"]
+
+    def refuse(text):
+        raise AssertionError("parsed a cached board")
+
+    monkeypatch.setattr(board_file, "parse_board", refuse)
+    assert _same(load_board(path), first)
+
+
+def test_load_board_rebuilds_a_corrupt_cache(tmp_path):
+    path = tmp_path / "board.toml"
+    path.write_text(BOARD, encoding="utf-8")
+    load_board(path, cache_dir=tmp_path / "cache")
+    (cached,) = (tmp_path / "cache").iterdir()
+    cached.write_bytes(cached.read_bytes()[:-3])
+
+    assert _same(load_board(path, cache_dir=tmp_path / "cache"), parse_board(BOARD))
+    assert _same(read_compiled(cached.read_bytes()), parse_board(BOARD))
+
+
+@pytest.mark.parametrize("text, reason", [
+    ("", "has no"),
+    (ESTATE + ESTATE, "defined more than once"),
+    (ESTATE.replace("mortgage = 80", "mortgage = 200"), "mortgage must be"),
+    (ESTATE.replace("buyback = 88", "buyback = 10"), "buyback must be"),
+    (ESTATE.replace("Electronics", "Casinos"), "unknown category"),
+    (ESTATE.replace("rent = 16", "rent = -1"), "rent must be"),
+    (ESTATE.replace("rent = 16", "rent = 16\ncolour = 3"), "unknown keys colour"),
+    (ESTATE.replace("rent = 16", 'rent = 16\nbuildable = false\nmax_stars = 2'), "not buildable"),
+    (ESTATE.replace("rent = 16", "rent = 16\nmax_stars = 8"), "max_stars must be an integer"),
+    ("[categories.Hotels]\nmax_stars = 6\n" + ESTATE, "max_stars must be an integer"),
+    ("[rules]\nrent_reduction_interval_turns = 0\n" + ESTATE, "rent_reduction_interval_turns"),
+    ("[rules]\nmax_tax_rate = 10001\n" + ESTATE, "max_tax_rate must be an integer from 0"),
+    ("[rules]\nrent_reduction_step = 6000\n" + ESTATE, "rent_reduction_step must not exceed"),
+    ("[rules]\ntax_step = 500\nmax_tax_rate = 400\n" + ESTATE, "tax_step must not exceed"),
+    ("[[estates]\n", "Expected"),
+])
+def test_invalid_boards_are_rejected(text, reason):
+    with pytest.raises(InvalidBoardException, match=reason):
+        parse_board(text)
+
+
+def test_rules_apply_to_a_game_and_survive_reset():
+    catalog = parse_board(BOARD)
+    players = [Player(identity=PlayerId(seat), funds=Funds.of(0)) for seat in (1, 2)]
+    game = Game(players=players, estate_registry=build_registry(catalog.create_estates()))
+    catalog.rules.apply(game)
+    game.start_game()
+    assert players[0].funds == Funds.of(3000)
+    airlines = game.estate_registry[EstateCategory.AIRLINES]
+    assert airlines and not any(isinstance(estate, BuildableEstate) for estate in airlines)
+
+    game.reset()
+    assert game.rent_manager.next_rent_reduction_turn == 10
+    assert game.tax_manager.tax_step == Rate(500)
+    assert game.time_manager.game_duration == timedelta(minutes=90)
+
+
+def test_time_rules_survive_fork_restore_resume_and_storage(tmp_path):
+    catalog = parse_board(BOARD.replace("game_duration_minutes = 90", (
+        "game_duration_minutes = 5\nbonus_disable_after_minutes = 2\n"
+        "rent_reduction_start_after_minutes = 3\ntax_increase_start_after_minutes = 4"
+    )))
+    players = [Player(identity=PlayerId(seat), funds=Funds.of(0)) for seat in (1, 2)]
+    game = Game(
+        players=players,
+        estate_registry=build_registry(catalog.create_estates()),
+        clock=VirtualClock(),
+    )
+    catalog.rules.apply(game)
+    game.start_game()
+
+    copies = [fork(game), restore(dump(game)), ResidentGame.park(game, catalog).resume()]
+    with Database(tmp_path / "monopoly.db") as database:
+        repository = GameRepository(database)
+        copies.append(repository.get(repository.add(game)))
+
+    limits = [
+        (time.game_duration, time.bonus_disable_after,
+         time.rent_reduction_start_after, time.tax_increase_start_after)
+        for time in (copy.time_manager for copy in copies)
+    ]
+    assert limits == [tuple(timedelta(minutes=minutes) for minutes in (5, 2, 3, 4))] * 4
@@ -0,0 +1,100 @@
+# tests/domain/game/test_board_index.py
+
+import pytest
+
+from monopoly.domain.entities.estate import EstateCategory, EstateId
+from monopoly.domain.entities.game.board import create_estates
+from monopoly.domain.entities.game.board_index import BoardIndex
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig
+from monopoly.domain.simulation.policies import GreedyPolicy
+from monopoly.domain.value_objects.funds import Funds
+
+
+@pytest.fixture
+def estates():
+    return {estate.identity: estate for estate in create_estates()}
+
+
+@pytest.fixture
+def index(estates):
+    return BoardIndex(estates.values())
+
+
+@pytest.fixture
+def player1():
+    return Player(identity=PlayerId(1), funds=Funds(amount=5000))
+
+
+@pytest.fixture
+def player2():
+    return Player(identity=PlayerId(2), funds=Funds(amount=5000))
+
+
+def test_buy_completes_category(index, estates, player1):
+    player1.buy_estate(estates[EstateId(1)])
+    assert index.owned_count(player1.identity, EstateCategory.PERFUMERY) == 1
+    assert not index.owns_category(player1.identity, EstateCategory.PERFUMERY)
+
+    player1.buy_estate(estates[EstateId(2)])
+    assert index.owns_category(player1.identity, EstateCategory.PERFUMERY)
+    assert index.complete_categories(player1.identity) == {EstateCategory.PERFUMERY}
+    assert not index.is_unowned(EstateId(1))
+    assert len(index.unowned) == 16
+    assert index.check_consistency() == []
+
+
+def test_mortgage_and_buyback(index, estates, player1):
+    player1.buy_estate(estates[EstateId(3)])
+    player1.mortgage(estates[EstateId(3)])
+    assert index.mortgaged == {EstateId(3)}
+
+    player1.buyback(estates[EstateId(3)])
+    assert not index.is_mortgaged(EstateId(3))
+    assert index.check_consistency() == []
+
+
+def test_trade_moves_category_ownership(index, estates, player1, player2):
+    player1.buy_estate(estates[EstateId(5)])
+    player1.buy_estate(estates[EstateId(6)])
+    player2.buy_estate(estates[EstateId(7)])
+    assert index.owns_category(player1.identity, EstateCategory.AUTOMOBILES)
+
+    player1.trade_estates(player2, [estates[EstateId(6)]], [estates[EstateId(7)]])
+    assert not index.owns_category(player1.identity, EstateCategory.AUTOMOBILES)
+    assert index.owned_count(player2.identity, EstateCategory.AUTOMOBILES) == 1
+    assert index.owned_count(player1.identity, EstateCategory.HOTELS) == 1
+    assert index.check_consistency() == []
+
+
+def test_auto_release(index, estates, player1):
+    estate = estates[EstateId(9)]
+    player1.buy_estate(estate)
+    player1.mortgage(estate)
+    estate.turns_until_buyback = 1
+    player1.advance_turn()
+
+    assert index.is_unowned(EstateId(9))
+    assert not index.is_mortgaged(EstateId(9))
+    assert index.owned_count(player1.identity, EstateCategory.RESTAURANTS) == 0
+    assert index.check_consistency() == []
+
+
+def test_consistency_checker_detects_untracked_changes(index, estates):
+    estates[EstateId(1)].owner = PlayerId(3)
+    assert index.check_consistency()
+
+
+def test_index_stays_consistent_through_simulated_games():
+    for seed in range(5):
+        board = tuple(
+            (identity, name, price, mortgage, buyback, price * 20, category)
+            for identity, name, price, mortgage, buyback, _, category in SimulationConfig().board
+        )
+        simulated = SimulatedGame(
+            seed=seed,
+            config=SimulationConfig(board=board, max_turns=60),
+            policies=[GreedyPolicy()],
+        )
+        simulated.run()
+        assert simulated.game.board_index.check_consistency() == []
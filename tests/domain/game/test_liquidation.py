@@ -0,0 +1,107 @@
+# tests/domain/game/test_liquidation.py
+
+import random
+from itertools import combinations
+
+import pytest
+
+from monopoly.domain.entities.estate import EstateCategory, EstateId
+from monopoly.domain.entities.game.liquidation import plan_liquidation
+from monopoly.domain.exceptions.estate_exc import EstatePermissionException
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+
+@pytest.fixture
+def funds():
+    return 10_000
+
+
+def brute_force(game, player, amount, rate):
+    shortfall = amount - player.funds.amount
+    complete = game.board_index.complete_categories(player.identity)
+    owned = list(player.estates.values())
+    best = None
+    for size in range(len(owned) + 1):
+        for chosen in combinations(owned, size):
+            if sum(estate.mortgage_price for estate in chosen) < shortfall:
+                continue
+            broken = {estate.category for estate in chosen if estate.category in complete}
+            cost = sum(estate.buyback_price for estate in chosen) + sum(
+                rate.apply(sum(estate.price for estate in game.estate_registry[category]))
+                for category in broken
+            )
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_plans_cost_no_more_than_brute_force(game, seed, estates_of):
+    rng = random.Random(seed)
+    player = game.players[0]
+    estates = estates_of(game)
+    for identity in rng.sample(sorted(estates), 11):
+        player.buy_estate(estates[identity])
+    player.funds = Funds(amount=rng.randrange(0, 100))
+    amount = player.funds.amount + rng.randrange(50, 600)
+    rate = Rate(rng.choice((0, 2500, 10_000)))
+
+    plan = plan_liquidation(game, player, amount, broken_set_rate=rate)
+    assert plan.cost == brute_force(game, player, amount, rate)
+    assert plan.raised >= amount - player.funds.amount
+
+    plan.apply(player)
+    assert player.funds.amount >= amount
+    assert all(estate.is_mortgaged() for estate in plan.estates)
+    assert game.board_index.mortgaged == {estate.identity for estate in plan.estates}
+
+
+def test_keeps_complete_categories_when_it_can(game, estates_of):
+    player = game.players[0]
+    estates = estates_of(game)
+    for identity in (1, 2, 13):
+        player.buy_estate(estates[EstateId(identity)])
+    player.funds = Funds(amount=0)
+
+    plan = plan_liquidation(game, player, 55)
+    assert plan.estates == (estates[EstateId(13)],)
+    assert plan.broken_sets == frozenset()
+
+    plan = plan_liquidation(game, player, 100)
+    assert EstateCategory.PERFUMERY in plan.broken_sets
+
+
+def test_coarse_units_still_cover_the_shortfall(game, estates_of):
+    player = game.players[0]
+    for estate in estates_of(game).values():
+        player.buy_estate(estate)
+    player.funds = Funds(amount=0)
+    amount = 1234
+
+    coarse = plan_liquidation(game, player, amount, resolution=8)
+    exact = plan_liquidation(game, player, amount, resolution=amount)
+    assert coarse.raised >= amount
+    assert exact.raised >= amount and exact.cost <= coarse.cost
+
+
+def test_nothing_to_do_or_not_enough(game, estates_of):
+    player = game.players[0]
+    player.buy_estate(estates_of(game)[EstateId(1)])
+    assert plan_liquidation(game, player, player.funds.amount).estates == ()
+    assert plan_liquidation(game, player, player.funds.amount + 51) is None
+
+
+def test_mortgage_all_is_all_or_nothing(game, estates_of):
+    player, other = game.players
+    estates = estates_of(game)
+    player.buy_estate(estates[EstateId(1)])
+    other.buy_estate(estates[EstateId(2)])
+    funds = player.funds
+
+    with pytest.raises(EstatePermissionException):
+        player.mortgage_all([estates[EstateId(1)], estates[EstateId(2)]])
+    assert not estates[EstateId(1)].is_mortgaged()
+    assert player.funds == funds
+
+    player.mortgage_all([estates[EstateId(1)], estates[EstateId(1)]])
+    assert player.funds.amount == funds.amount + estates[EstateId(1)].mortgage_price
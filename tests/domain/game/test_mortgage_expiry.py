@@ -0,0 +1,101 @@
+# tests/domain/game/test_mortgage_expiry.py
+
+import pytest
+
+from monopoly.domain.constants import TURNS_UNTIL_SALE
+from monopoly.domain.entities.estate_state import NotOwnedState, OwnedState
+from monopoly.domain.snapshot import dump, fork, restore
+
+
+@pytest.fixture
+def started():
+    return True
+
+
+def test_mortgaged_estate_is_released_on_its_deadline(game, estates_of):
+    first = game.players[0]
+    estate = estates_of(game)[1]
+    first.buy_estate(estate)
+    game.advance_turn()
+    first.mortgage(estate)
+    assert game.mortgage_expiry.deadline(estate.identity) == 1 + TURNS_UNTIL_SALE
+
+    for turn in range(TURNS_UNTIL_SALE - 1):
+        game.advance_turn()
+        assert estate.turns_until_buyback == TURNS_UNTIL_SALE - 1 - turn
+    assert estate.owner == first.identity
+
+    game.advance_turn()
+    assert isinstance(estate._state, NotOwnedState)
+    assert estate.identity not in first.estates
+    assert len(game.mortgage_expiry) == 0
+    assert game.board_index.is_unowned(estate.identity)
+
+
+def test_buyback_cancels_and_trade_keeps_the_deadline(game, estates_of):
+    first, second = game.players
+    kept, traded = estates_of(game)[1], estates_of(game)[2]
+    first.buy_estate(kept)
+    first.buy_estate(traded)
+    first.mortgage(kept)
+    first.mortgage(traded)
+    second.buy_estate(estates_of(game)[3])
+
+    game.advance_turn()
+    first.buyback(kept)
+    first.trade_estates(second, [traded], [estates_of(game)[3]])
+    assert game.mortgage_expiry.deadline(kept.identity) is None
+
+    for _ in range(TURNS_UNTIL_SALE - 1):
+        game.advance_turn()
+    assert isinstance(kept._state, OwnedState)
+    assert kept.identity in first.estates
+    assert traded.owner is None
+    assert traded.identity not in second.estates
+
+
+def test_mortgage_after_buyback_is_scheduled_again(game, estates_of):
+    first = game.players[0]
+    estate = estates_of(game)[1]
+    first.buy_estate(estate)
+    first.mortgage(estate)
+    first.buyback(estate)
+    for _ in range(5):
+        game.advance_turn()
+    first.mortgage(estate)
+
+    for _ in range(TURNS_UNTIL_SALE - 1):
+        game.advance_turn()
+    assert estate.is_mortgaged()
+    game.advance_turn()
+    assert estate.owner is None
+
+
+def test_deadlines_survive_snapshot_and_fork(game, estates_of):
+    first = game.players[0]
+    estate = estates_of(game)[1]
+    first.buy_estate(estate)
+    first.mortgage(estate)
+    for _ in range(4):
+        game.advance_turn()
+
+    for copy in (restore(dump(game), clock=game.clock), fork(game)):
+        assert estates_of(copy)[1].turns_until_buyback == TURNS_UNTIL_SALE - 4
+        for _ in range(TURNS_UNTIL_SALE - 4):
+            copy.advance_turn()
+        assert estates_of(copy)[1].owner is None
+    assert estate.turns_until_buyback == TURNS_UNTIL_SALE - 4
+
+
+def test_a_shortened_countdown_is_rescheduled(game, estates_of):
+    first = game.players[0]
+    estate = estates_of(game)[1]
+    first.buy_estate(estate)
+    first.mortgage(estate)
+    estate.turns_until_buyback = 1
+    assert game.mortgage_expiry.deadline(estate.identity) == 1
+
+    game.advance_turn()
+    assert estate.owner is None
+    assert estate.identity not in first.estates
+    assert game.mortgage_expiry.deadline(estate.identity) is None
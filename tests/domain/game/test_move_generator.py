@@ -0,0 +1,109 @@
+# tests/domain/game/test_move_generator.py
+
+import random
+
+import pytest
+
+from monopoly.domain.entities.estate import BuildableEstate, EstateCategory, EstateId
+from monopoly.domain.entities.game.move_generator import Move, MoveKind, estate_ids
+from monopoly.domain.entities.verdict import Verdict
+from monopoly.domain.value_objects.funds import Funds
+
+
+@pytest.fixture
+def seats():
+    return 3
+
+
+@pytest.fixture
+def funds():
+    return 400
+
+
+def mask(estates) -> int:
+    result = 0
+    for estate in estates:
+        result |= 1 << estate.identity
+    return result
+
+
+def expected_moves(game, player):
+    estates = [estate for members in game.estate_registry.values() for estate in members]
+    complete = game.board_index.complete_categories(player.identity)
+    trades = {}
+    for partner in game.players:
+        if partner is player:
+            continue
+        for given in player.estates.values():
+            received = mask(
+                estate for estate in partner.estates.values()
+                if player.can_trade(partner, [given], [estate]) is Verdict.OK
+            )
+            if received:
+                trades[partner.identity, given.identity] = received
+    return (
+        mask(estate for estate in estates if player.can_buy(estate) is Verdict.OK),
+        mask(estate for estate in estates if player.can_mortgage(estate) is Verdict.OK),
+        mask(estate for estate in estates if player.can_buyback(estate) is Verdict.OK),
+        mask(
+            estate for estate in player.estates.values()
+            if isinstance(estate, BuildableEstate) and not estate.is_mortgaged()
+            and estate.category in complete and estate.stars < estate.max_stars
+        ),
+        trades,
+    )
+
+
+def test_matches_the_legality_checks_through_random_play(game, estates_of):
+    generator = game.move_generator
+    by_id = estates_of(game)
+    rng = random.Random(7)
+    for _ in range(300):
+        player = rng.choice(game.players)
+        moves = generator.legal_moves(player)
+        buy, mortgage, buyback, build, trades = expected_moves(game, player)
+        assert (moves.buy, moves.mortgage, moves.buyback, moves.build) == (
+            buy, mortgage, buyback, build
+        )
+        assert moves.trades == trades
+        assert len(moves) == len(list(moves))
+
+        legal = list(moves)
+        if not legal:
+            player.funds = player.funds.add(300)
+            continue
+        move = rng.choice(legal)
+        estate = by_id[move.estate]
+        if move.kind is MoveKind.BUY:
+            player.buy_estate(estate)
+        elif move.kind is MoveKind.MORTGAGE:
+            player.mortgage(estate)
+        elif move.kind is MoveKind.BUYBACK:
+            player.buyback(estate)
+        elif move.kind is MoveKind.BUILD:
+            estate.build_star()
+        else:
+            partner = next(other for other in game.players if other.identity == move.partner)
+            player.trade_estates(partner, [estate], [partner.estates[move.received]])
+        if rng.random() < 0.2:
+            game.advance_turn()
+
+
+def test_fully_built_estates_cannot_be_built_on(game):
+    player = game.players[0]
+    player.funds = Funds(amount=10_000)
+    perfumery = list(game.estate_registry[EstateCategory.PERFUMERY])
+    for estate in perfumery:
+        player.buy_estate(estate)
+    target = next(estate for estate in perfumery if isinstance(estate, BuildableEstate))
+    generator = game.move_generator
+    assert generator.legal_moves(player).build >> target.identity & 1
+    while target.stars < target.max_stars:
+        target.build_star()
+    assert not generator.legal_moves(player).build >> target.identity & 1
+    assert Move(MoveKind.BUILD, target.identity) not in list(generator.legal_moves(player))
+
+
+def test_estate_ids_walks_set_bits():
+    assert list(estate_ids(0b101001)) == [EstateId(0), EstateId(3), EstateId(5)]
+    assert list(estate_ids(0)) == []
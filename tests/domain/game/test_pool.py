@@ -0,0 +1,79 @@
+# tests/domain/game/test_pool.py
+
+from monopoly.domain.entities.estate import BuildableEstate
+from monopoly.domain.entities.game.board import DEFAULT_BOARD
+from monopoly.domain.entities.game.pool import GamePool
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+from monopoly.domain.snapshot import pack_managers
+
+
+# High rents, so players mortgage and go bankrupt within the game
+BOARD = tuple(
+    (identity, name, price, mortgage, buyback, price * 20, category)
+    for identity, name, price, mortgage, buyback, _, category in DEFAULT_BOARD
+)
+CONFIG = SimulationConfig(players=3, board=BOARD, max_turns=60)
+POLICIES = (GreedyPolicy(), CautiousPolicy())
+
+
+def _state(game):
+    estates = sorted(
+        (estate for estates in game.estate_registry.values() for estate in estates),
+        key=lambda estate: estate.identity,
+    )
+    return (
+        [(estate.identity, estate.owner, estate._state, estate.buyback_deadline,
+          getattr(estate, "stars", 0), estate.current_rent()) for estate in estates],
+        [(player.identity, player.funds, dict(player.estates)) for player in game.players],
+        list(game.player_manager.eliminated), pack_managers(game), game.current_turn,
+        game.winner, game.time_manager.start_time, game.time_manager.end_time,
+        game.board_index.mortgaged, len(game.mortgage_expiry),
+    )
+
+
+def test_reset_matches_a_new_game():
+    played = SimulatedGame(seed=11, config=CONFIG, policies=POLICIES)
+    played.run()
+    game = played.game
+    game.move_generator
+    owner = next(player for player in game.players if player.estates)
+    estate = next(
+        estate for estate in owner.estates.values() if isinstance(estate, BuildableEstate)
+    )
+    estate.build_star()
+    owner.mortgage(estate)
+    game.tax_manager.update_tax_rate(game.time_manager)
+    assert game.player_manager.eliminated and game.winner and game.board_index.mortgaged
+
+    game.clock.reset()
+    game.reset()
+    fresh = SimulatedGame.new_game(CONFIG)
+    assert _state(game) == _state(fresh)
+    assert game.board_index.check_consistency() == []
+    for player, new_player in zip(game.players, fresh.players):
+        moves = game.move_generator.legal_moves(player)
+        expected = fresh.move_generator.legal_moves(new_player)
+        assert (moves.buy, moves.mortgage, moves.build) == (
+            expected.buy, expected.mortgage, expected.build
+        )
+
+
+def test_pooled_simulation_gives_same_results():
+    seeds = range(20, 30)
+    fresh = Simulator(config=CONFIG, policies=POLICIES).run(seeds).results
+    simulator = Simulator(config=CONFIG, policies=POLICIES, pool_size=2)
+    assert simulator.run(seeds).results == fresh
+    assert simulator.pool.created == 1 and simulator.pool.reused == len(seeds) - 1
+
+
+def test_pool_is_bounded():
+    pool = GamePool(lambda: SimulatedGame.new_game(CONFIG), max_size=2)
+    games = [pool.acquire() for _ in range(3)]
+    for game in games:
+        pool.release(game)
+    assert len(pool) == 2 and pool.created == 3
+
+    with pool.lease() as game:
+        assert game is games[1] and len(pool) == 1
+    assert len(pool) == 2
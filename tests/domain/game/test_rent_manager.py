@@ -0,0 +1,68 @@
+# tests/domain/game/test_rent_manager.py
+
+from decimal import Decimal
+
+import pytest
+
+from monopoly.domain.entities.game.board import create_estates
+from monopoly.domain.exceptions.estate_exc import SharedRentLevelException
+from monopoly.domain.snapshot import dump, fork, restore
+from monopoly.domain.value_objects.rate import Rate
+
+
+@pytest.fixture
+def seats():
+    return 1
+
+
+def test_one_reduction_step_applies_to_every_estate(game, estates_of):
+    estates = list(estates_of(game).values())
+    rents = [estate.current_rent() for estate in estates]
+
+    game.rent_manager.reduce_rent(game.rent_manager.next_rent_reduction_turn)
+    assert game.rent_manager.current_rent_reduction == Rate(1000)
+    assert [estate.rent_reduction for estate in estates] == [Rate(1000)] * len(estates)
+    assert [estate.current_rent() for estate in estates] == [
+        int(rent * Decimal("0.9")) for rent in rents
+    ]
+
+
+def test_reductions_stop_at_the_maximum(game, estates_of):
+    manager = game.rent_manager
+    for _ in range(10):
+        manager.reduce_rent(manager.next_rent_reduction_turn)
+    estate = list(estates_of(game).values())[-1]
+    assert manager.current_rent_reduction == manager.max_rent_reduction
+    assert estate.current_rent() == manager.max_rent_reduction.complement().apply(estate.rent)
+
+
+def test_standalone_estates_keep_their_own_reduction():
+    first, second = create_estates()[:2]
+    first.reduce_rent(Decimal("20"))
+    assert first.current_rent() == int(first.rent * Decimal("0.8"))
+    assert second.current_rent() == second.rent
+
+
+def test_estates_in_a_game_leave_reductions_to_the_manager(game, estates_of):
+    first, second = list(estates_of(game).values())[:2]
+    with pytest.raises(SharedRentLevelException):
+        first.reduce_rent(Decimal("10"))
+    with pytest.raises(SharedRentLevelException):
+        first.rent_reduction = Rate(9000)
+    assert game.rent_manager.current_rent_reduction == Rate(0)
+    assert second.current_rent() == second.rent
+
+
+def test_forks_and_restores_reduce_independently(game, estates_of):
+    manager = game.rent_manager
+    manager.reduce_rent(manager.next_rent_reduction_turn)
+    original = list(estates_of(game).values())[-1]
+    original.current_rent()
+
+    for copy in (fork(game), restore(dump(game))):
+        copied = list(estates_of(copy).values())[-1]
+        assert copied.current_rent() == original.current_rent()
+        copy.rent_manager.reduce_rent(copy.rent_manager.next_rent_reduction_turn)
+        assert copied.rent_reduction == Rate(2000)
+    assert original.rent_reduction == Rate(1000)
+    assert original.current_rent() == int(original.rent * Decimal("0.9"))
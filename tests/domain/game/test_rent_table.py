@@ -0,0 +1,68 @@
+# tests/domain/game/test_rent_table.py
+
+from decimal import Decimal
+
+import pytest
+
+from monopoly.domain.entities.estate import EstateCategory
+from monopoly.domain.entities.game.board import DEFAULT_BOARD, build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.rent_table import STAR_RENT_MULTIPLIERS, RentTable
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+
+@pytest.fixture
+def funds():
+    return 50_000
+
+
+def test_table_covers_stars_completion_and_mortgage():
+    table = RentTable.shared(create_estates())
+    # Fragrance Hub: rent 10, buildable up to 5 stars
+    assert table.rent(1) == 10
+    assert table.rent(1, complete=True) == 20
+    assert table.rent(1, stars=3, complete=True) == 10 * STAR_RENT_MULTIPLIERS[3]
+    assert table.rent(1, stars=5) == 10 * STAR_RENT_MULTIPLIERS[5]
+    assert table.rent(1, stars=2, mortgaged=True) == 0
+    with pytest.raises(IndexError):
+        RentTable.shared(create_estates()[-1:]).rent(DEFAULT_BOARD[-1][0], stars=6)
+
+
+def test_table_is_shared_by_games_on_the_same_board(game):
+    other = Game(players=[], estate_registry=build_registry(create_estates()))
+    assert other.rent_engine.table is game.rent_engine.table
+    assert RentTable.shared(create_estates()[:5]) is not game.rent_engine.table
+
+
+def test_owed_follows_ownership_stars_reduction_and_tax(game, estates_of):
+    first, second = game.players
+    perfumery = [
+        estate for estate in estates_of(game).values()
+        if estate.category is EstateCategory.PERFUMERY
+    ]
+    engine = game.rent_engine
+    estate = perfumery[0]
+    assert engine.owed(estate) == 0
+
+    first.buy_estate(estate)
+    assert engine.owed(estate) == estate.current_rent() == estate.rent
+    for other in perfumery[1:]:
+        first.buy_estate(other)
+    assert engine.owed(estate) == 2 * estate.rent
+    estate.build_star()
+    estate.build_star()
+    assert engine.owed(estate) == estate.rent * STAR_RENT_MULTIPLIERS[2]
+
+    game.rent_manager.reduce_rent(game.rent_manager.next_rent_reduction_turn)
+    owed = int(estate.rent * STAR_RENT_MULTIPLIERS[2] * Decimal("0.9"))
+    assert engine.owed(estate) == owed
+    game.tax_manager.current_tax_rate = Rate(3000)
+    assert engine.owner_share(estate) == owed - Funds.of(owed).apply_rate(Decimal("0.30")).amount
+
+    first.mortgage(perfumery[1])
+    assert engine.owed(perfumery[1]) == 0
+    estate.stars = 0
+    assert engine.owed(estate) == 2 * estate.current_rent()
+    first.trade_estates(second, [perfumery[1]], [], funds_to_receive=Funds(amount=100))
+    assert engine.owed(estate) == estate.current_rent()
@@ -0,0 +1,109 @@
+# tests/domain/game/test_trade_search.py
+
+import random
+from itertools import combinations
+
+import pytest
+
+from monopoly.domain.entities.estate import EstateCategory, EstateId, UnbuildableEstate
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.trade_search import find_trades, trades_completing
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.entities.verdict import Verdict
+from monopoly.domain.value_objects.funds import Funds
+
+
+def holding(player: Player, prices: list[int], first_id: int) -> list[UnbuildableEstate]:
+    estates = []
+    for offset, price in enumerate(prices):
+        estate = UnbuildableEstate(
+            identity=EstateId(first_id + offset), name=f"Estate {first_id + offset}", price=price,
+            mortgage_price=price // 2, buyback_price=price // 2 + 5,
+            category=EstateCategory.AIRLINES,
+        )
+        player.funds = player.funds.add(price)
+        player.buy_estate(estate)
+        estates.append(estate)
+    return estates
+
+
+def brute_force(player, partner, wanted):
+    """
+    Rank key of every legal trade with the least cash for each subset given.
+    """
+    value = sum(estate.price for estate in wanted)
+    own = list(player.estates.values())
+    keys = []
+    for size in range(len(own) + 1):
+        for give in combinations(own, size):
+            total = sum(estate.price for estate in give)
+            for funds_to_give in range(0, player.funds.amount + 1):
+                funds_to_receive = max(0, (total + funds_to_give + 1) // 2 - value)
+                verdict = player.can_trade(
+                    partner, list(give), wanted,
+                    Funds.of(funds_to_give), Funds.of(funds_to_receive),
+                )
+                if verdict is Verdict.OK:
+                    keys.append((total + funds_to_give - funds_to_receive, funds_to_give))
+                    break
+    return sorted(keys)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_offers_are_legal_and_ranked_like_brute_force(seed):
+    rng = random.Random(seed)
+    player = Player(identity=PlayerId(1), funds=Funds(amount=0))
+    partner = Player(identity=PlayerId(2), funds=Funds(amount=0))
+    holding(player, [rng.randrange(20, 200, 10) for _ in range(8)], first_id=1)
+    wanted = holding(partner, [rng.randrange(50, 300, 10) for _ in range(2)], first_id=100)
+    player.funds = Funds(amount=rng.randrange(0, 60))
+    partner.funds = Funds(amount=rng.randrange(0, 60))
+
+    offers = find_trades(player, partner, wanted, limit=25)
+    expected = brute_force(player, partner, wanted)[:25]
+    assert expected
+    assert [(offer.net_value, offer.funds_to_give) for offer in offers] == expected
+    for offer in offers:
+        assert player.can_trade(
+            partner, list(offer.give), list(offer.receive),
+            Funds.of(offer.funds_to_give), Funds.of(offer.funds_to_receive),
+        ) is Verdict.OK
+    gives = {tuple(estate.identity for estate in offer.give) for offer in offers}
+    assert len(gives) == len(offers)
+
+
+def test_completing_a_category():
+    estates = {estate.identity: estate for estate in create_estates()}
+    player = Player(identity=PlayerId(1), funds=Funds(amount=5000))
+    partner = Player(identity=PlayerId(2), funds=Funds(amount=5000))
+    game = Game(players=[player, partner], estate_registry=build_registry(list(estates.values())))
+    for identity in (1, 5, 7, 13):
+        player.buy_estate(estates[EstateId(identity)])
+    partner.buy_estate(estates[EstateId(2)])
+    player.funds = Funds(amount=0)
+
+    offers = trades_completing(game, player, partner, EstateCategory.PERFUMERY)
+    assert offers
+    assert all(estates[EstateId(1)] not in offer.give for offer in offers)
+    best = offers[0]
+    assert best.give == (estates[EstateId(13)],) and best.funds_to_give == 0
+    player.trade_estates(partner, list(best.give), list(best.receive))
+    assert game.board_index.owns_category(player.identity, EstateCategory.PERFUMERY)
+
+    assert trades_completing(game, player, partner, EstateCategory.PERFUMERY) == []
+    assert trades_completing(game, player, partner, EstateCategory.HOTELS) == []
+
+
+def test_stops_at_the_time_budget():
+    player = Player(identity=PlayerId(1), funds=Funds(amount=0))
+    partner = Player(identity=PlayerId(2), funds=Funds(amount=0))
+    holding(player, [100] * 30, first_id=1)
+    wanted = holding(partner, [300], first_id=100)
+    ticks = iter(range(1000))
+
+    offers = find_trades(
+        player, partner, wanted, limit=1000, budget=2.5, timer=lambda: next(ticks)
+    )
+    assert 1 <= len(offers) < 5
+    assert all(offer.net_value == 200 for offer in offers)
@@ -0,0 +1,103 @@
+# tests/domain/player/test_can_act.py
+
+import logging
+
+import pytest
+
+from monopoly.domain.entities.verdict import Verdict
+from monopoly.domain.exceptions.base import DomainError, InsufficientFundsError
+from monopoly.domain.exceptions.estate_exc import (
+    EstateAlreadyOwnedException,
+    EstateMortgagedException,
+    EstateNotOwnedException,
+    EstatePermissionException,
+    TradeDifferenceExceededException,
+    TradeMustIncludeAtLeastOneEstateException,
+)
+from monopoly.domain.value_objects.funds import Funds
+
+
+def test_checks_follow_the_estate_life_cycle(player1, player2, estate_clothing_not_owned):
+    estate = estate_clothing_not_owned
+    assert player1.can_buy(estate) is Verdict.OK
+    assert player1.can_mortgage(estate) is Verdict.NOT_OWNED
+    assert player1.can_buyback(estate) is Verdict.NOT_OWNED
+
+    player1.buy_estate(estate)
+    assert player2.can_buy(estate) is Verdict.ALREADY_OWNED
+    assert player2.can_mortgage(estate) is Verdict.NOT_OWNER
+    assert player1.can_buyback(estate) is Verdict.NOT_MORTGAGED
+    assert player1.can_mortgage(estate) is Verdict.OK
+
+    player1.mortgage(estate)
+    assert player2.can_buy(estate) is Verdict.MORTGAGED
+    assert player1.can_mortgage(estate) is Verdict.MORTGAGED
+    assert player2.can_buyback(estate) is Verdict.NOT_OWNER
+    assert player1.can_buyback(estate) is Verdict.OK
+    player1.funds = Funds(amount=0)
+    assert player1.can_buyback(estate) is Verdict.INSUFFICIENT_FUNDS
+    assert estate.can_buyback(player1.identity) is Verdict.OK
+
+
+def test_checks_do_not_log(caplog, player1, player2, estate_clothing_not_owned):
+    player2.buy_estate(estate_clothing_not_owned)
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG):
+        assert player1.can_buy(estate_clothing_not_owned) is Verdict.ALREADY_OWNED
+        assert player1.can_trade(player2, [], []) is Verdict.EMPTY_TRADE
+    assert caplog.records == []
+
+
+@pytest.mark.parametrize(
+    ("setup", "action", "error"),
+    [
+        (lambda p1, p2, e: p2.buy_estate(e), lambda p1, p2, e: p1.buy_estate(e),
+         EstateAlreadyOwnedException),
+        (lambda p1, p2, e: p2.buy_estate(e), lambda p1, p2, e: p1.mortgage(e),
+         EstatePermissionException),
+        (lambda p1, p2, e: None, lambda p1, p2, e: p1.mortgage(e), EstateNotOwnedException),
+        (lambda p1, p2, e: p1.buy_estate(e), lambda p1, p2, e: p1.buyback(e),
+         EstateMortgagedException),
+        (lambda p1, p2, e: (p1.buy_estate(e), p1.mortgage(e)), lambda p1, p2, e: p2.buy_estate(e),
+         EstateMortgagedException),
+    ],
+)
+def test_raising_methods_agree_with_the_checks(
+    player1, player2, estate_clothing_not_owned, setup, action, error
+):
+    setup(player1, player2, estate_clothing_not_owned)
+    with pytest.raises(error):
+        action(player1, player2, estate_clothing_not_owned)
+
+
+def test_trade_checks(player1, player2, estate_clothing_not_owned, estate_clothing_owned):
+    player1.buy_estate(estate_clothing_not_owned)
+    player2.buy_estate(estate_clothing_owned)
+    mine, theirs = [estate_clothing_not_owned], [estate_clothing_owned]
+
+    cases = [
+        ((player2, [], []), Verdict.EMPTY_TRADE, TradeMustIncludeAtLeastOneEstateException),
+        ((player2, theirs, []), Verdict.NOT_YOURS_TO_GIVE, EstateNotOwnedException),
+        ((player2, [], mine), Verdict.NOT_THEIRS_TO_GIVE, EstateNotOwnedException),
+        ((player2, mine, [], Funds(amount=0), Funds(amount=500)), Verdict.TRADE_IMBALANCED,
+         TradeDifferenceExceededException),
+        ((player2, mine, theirs, Funds(amount=5000)), Verdict.TRADE_IMBALANCED,
+         TradeDifferenceExceededException),
+    ]
+    for arguments, verdict, error in cases:
+        assert player1.can_trade(*arguments) is verdict
+        with pytest.raises(error):
+            player1.trade_estates(*arguments)
+
+    player1.funds = Funds(amount=10)
+    assert player1.can_trade(player2, mine, theirs, Funds(amount=20)) is Verdict.INSUFFICIENT_FUNDS
+    player2.funds = Funds(amount=10)
+    assert player1.can_trade(player2, mine, theirs, Funds(amount=0), Funds(amount=20)) is \
+        Verdict.OTHER_INSUFFICIENT_FUNDS
+    with pytest.raises(InsufficientFundsError):
+        player1.trade_estates(player2, mine, theirs, Funds(amount=0), Funds(amount=20))
+
+    assert player1.can_trade(player2, mine, theirs) is Verdict.OK
+    player1.trade_estates(player2, mine, theirs)
+    assert list(player1.estates) == [estate_clothing_owned.identity]
+    assert issubclass(TradeDifferenceExceededException, DomainError)
@@ -0,0 +1,108 @@
+# tests/domain/simulation/test_board_arrays.py
+
+from decimal import Decimal
+
+import pytest
+
+from monopoly.domain.entities.estate_state import MortgagedState, NotOwnedState, OwnedState
+from monopoly.domain.entities.game.board import create_estates
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+np = pytest.importorskip("numpy")
+
+from monopoly.domain.simulation.board_arrays import (  # noqa: E402
+    STATE_MORTGAGED,
+    STATE_NOT_OWNED,
+    STATE_OWNED,
+    BoardArrays,
+)
+
+
+@pytest.fixture
+def board():
+    estates = create_estates()
+    player1 = Player(identity=PlayerId(1), funds=Funds(amount=5000))
+    player2 = Player(identity=PlayerId(2), funds=Funds(amount=5000))
+    for estate in estates[:4]:
+        player1.buy_estate(estate)
+    for estate in estates[4:7]:
+        player2.buy_estate(estate)
+    player1.mortgage(estates[0])
+    player2.mortgage(estates[5])
+    estates[5].turns_until_buyback = 3
+    return estates, [player1, player2]
+
+
+def test_columns_mirror_estates(board):
+    estates, _ = board
+    arrays = BoardArrays.from_estates(estates)
+
+    assert arrays.estate_ids.tolist() == list(range(1, 19))
+    assert arrays.price.tolist() == [estate.price for estate in estates]
+    assert arrays.owner[0].tolist() == [1, 1, 1, 1, 2, 2, 2] + [0] * 11
+    assert arrays.state[0, :7].tolist() == [
+        STATE_MORTGAGED, STATE_OWNED, STATE_OWNED, STATE_OWNED,
+        STATE_OWNED, STATE_MORTGAGED, STATE_OWNED,
+    ]
+    assert arrays.turns_until_buyback[0, 5] == 3
+    assert arrays.owned_by(PlayerId(2)).tolist() == [5, 6, 7]
+
+
+def test_advance_turn_matches_object_model(board):
+    estates, players = board
+    arrays = BoardArrays.from_estates(estates)
+
+    for _ in range(4):
+        for player in players:
+            player.advance_turn()
+        arrays.advance_turn()
+
+    expected = BoardArrays.from_estates(estates)
+    assert np.array_equal(arrays.owner, expected.owner)
+    assert np.array_equal(arrays.state, expected.state)
+    assert np.array_equal(arrays.turns_until_buyback, expected.turns_until_buyback)
+    assert arrays.state[0, 5] == STATE_NOT_OWNED
+
+
+def test_reduce_rent_matches_object_model(board):
+    estates, _ = board
+    arrays = BoardArrays.from_estates(estates)
+
+    for _ in range(3):
+        arrays.reduce_rent(Decimal("10"))
+        for estate in estates:
+            estate.reduce_rent(percentage=Decimal("10"))
+
+    assert arrays.current_rent()[0].tolist() == [estate.current_rent() for estate in estates]
+
+
+def test_batch_applies_per_game_steps():
+    arrays = BoardArrays.from_games([create_estates(), create_estates()])
+    arrays.reduce_rent(np.array([10, 50]))
+
+    assert arrays.rent_reduction[:, 0].tolist() == [1000, 5000]
+
+
+def test_batch_rejects_different_boards():
+    with pytest.raises(ValueError):
+        BoardArrays.from_games([create_estates(), create_estates()[:5]])
+
+
+def test_write_back_round_trips(board):
+    estates, players = board
+    arrays = BoardArrays.from_estates(estates)
+    arrays.reduce_rent(Decimal("20"))
+    for _ in range(3):
+        arrays.advance_turn()
+    arrays.write_back([estates], [players])
+
+    assert isinstance(estates[0]._state, MortgagedState)
+    assert estates[0].turns_until_buyback == 12
+    assert isinstance(estates[5]._state, NotOwnedState)
+    assert estates[5].owner is None
+    assert isinstance(estates[6]._state, OwnedState)
+    assert estates[6].rent_reduction == Rate(2000)
+    assert sorted(players[1].estates) == [5, 7]
+    assert np.array_equal(BoardArrays.from_estates(estates).owner, arrays.owner)
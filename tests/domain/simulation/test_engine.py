@@ -0,0 +1,69 @@
+# tests/domain/simulation/test_engine.py
+
+from datetime import timedelta
+
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+from monopoly.domain.value_objects.funds import Funds
+
+
+def test_virtual_clock_drives_game_time():
+    clock = VirtualClock()
+    game = Game(players=[Player(identity=PlayerId(1), funds=Funds(amount=0))], estate_registry={},
+                clock=clock)
+    game.start_game()
+
+    clock.advance(timedelta(minutes=10))
+    assert game.time_manager.elapsed_time() == timedelta(minutes=10)
+    assert not game.time_manager.is_time_up()
+
+    clock.advance(timedelta(minutes=40))
+    game.advance_turn()
+    assert game.is_game_over()
+    assert game.time_manager.end_time == clock()
+
+
+def test_game_runs_to_completion():
+    simulated = SimulatedGame(seed=7, config=SimulationConfig(), policies=[GreedyPolicy()])
+    result = simulated.run()
+
+    assert simulated.game.is_game_over()
+    assert result.winner is not None
+    assert 0 < result.turns <= SimulationConfig().max_turns
+    assert len(simulated.turn_latencies) == result.turns
+    assert max(result.funds) == result.funds[result.winner - 1]
+
+
+def test_same_seed_gives_same_result():
+    simulator = Simulator(policies=(GreedyPolicy(), CautiousPolicy()))
+    assert simulator.run([3, 4]).results == simulator.run([3, 4]).results
+
+
+def test_different_seeds_diverge():
+    results = Simulator().run(range(5)).results
+    assert len({result.ownership for result in results}) > 1
+
+
+def test_bankrupt_players_are_eliminated():
+    board = tuple(
+        (identity, name, price, mortgage, buyback, price * 20, category)
+        for identity, name, price, mortgage, buyback, _, category in SimulationConfig().board
+    )
+    config = SimulationConfig(players=3, board=board, max_turns=200)
+    simulated = SimulatedGame(seed=11, config=config, policies=[GreedyPolicy()])
+    result = simulated.run()
+
+    assert simulated.eliminated
+    for player_id in simulated.eliminated:
+        assert player_id not in result.ownership
+        assert player_id != result.winner
+
+
+def test_report_measures_throughput():
+    report = Simulator(config=SimulationConfig(max_turns=10)).run(range(3))
+    assert len(report.results) == 3
+    assert report.games_per_second > 0
+    assert report.turn_latency(0.99) >= report.turn_latency(0.5) > 0
@@ -0,0 +1,32 @@
+# tests/domain/simulation/test_runner.py
+
+from monopoly.domain.simulation.engine import SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+from monopoly.domain.simulation.runner import run_parallel, split_seeds
+
+CONFIG = SimulationConfig(players=3, max_turns=40)
+POLICIES = (GreedyPolicy(), CautiousPolicy())
+
+
+def test_split_seeds_covers_range_without_overlap():
+    chunks = split_seeds(5, 27, chunk_size=4)
+    assert chunks[0] == (5, 9)
+    assert chunks[-1] == (25, 27)
+    assert [seed for low, high in chunks for seed in range(low, high)] == list(range(5, 27))
+
+
+def test_results_do_not_depend_on_worker_count():
+    single = run_parallel(0, 12, config=CONFIG, policies=POLICIES, workers=1)
+    sharded = run_parallel(0, 12, config=CONFIG, policies=POLICIES, workers=2, chunk_size=5)
+
+    assert single.results == sharded.results
+    assert [result.seed for result in sharded.results] == list(range(12))
+
+
+def test_results_match_sequential_simulator():
+    sequential = Simulator(config=CONFIG, policies=POLICIES).run(range(100, 106))
+    parallel = run_parallel(100, 106, config=CONFIG, policies=POLICIES, workers=2)
+
+    assert parallel.results == sequential.results
+    assert parallel.total_turns == sequential.total_turns
+    assert sum(parallel.win_rates().values()) == 1
@@ -0,0 +1,123 @@
+# tests/domain/test_journal.py
+
+import io
+
+import pytest
+
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.entities.player import Player, PlayerId, transfer_many
+from monopoly.domain.events import EstatesTraded, RentReduced, TurnStarted
+from monopoly.domain.journal import Journal, JournalError, JournalWriter, replay
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig
+from monopoly.domain.simulation.policies import CautiousPolicy, GreedyPolicy
+from monopoly.domain.snapshot import dump
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import Rate
+
+
+def _bankrupting_config() -> SimulationConfig:
+    board = tuple(
+        (identity, name, price, mortgage, buyback, price * 20, category)
+        for identity, name, price, mortgage, buyback, _, category in SimulationConfig().board
+    )
+    return SimulationConfig(players=3, board=board, max_turns=200)
+
+
+def _new_game() -> Game:
+    estates = create_estates()
+    game = Game(
+        players=[Player(identity=PlayerId(1), funds=Funds(amount=0)),
+                 Player(identity=PlayerId(2), funds=Funds(amount=0))],
+        estate_registry=build_registry(estates),
+        clock=VirtualClock(),
+    )
+    game.start_game()
+    return game
+
+
+def _estate(game: Game, identity: int):
+    return next(
+        estate for estates in game.estate_registry.values() for estate in estates
+        if estate.identity == identity
+    )
+
+
+def test_replay_matches_live_game_at_every_turn():
+    config = _bankrupting_config()
+    policies = [GreedyPolicy(), CautiousPolicy()]
+    live = SimulatedGame(seed=11, config=config, policies=policies)
+    buffer = io.BytesIO()
+    writer = JournalWriter(buffer, live.game, snapshot_every=7)
+
+    states = {0: dump(live.game)}
+    while not live.game.is_game_over() and live.game.current_turn < config.max_turns:
+        live.game.advance_turn(live.take_turn)
+        if len(live.game.players) <= 1 and not live.game.is_game_over():
+            live.game.end_game()
+        states[live.game.current_turn] = dump(live.game)
+        live.clock.advance(config.turn_duration)
+    writer.close()
+
+    assert live.eliminated
+    journal = Journal(buffer.getvalue())
+    for turn, state in states.items():
+        fresh = SimulatedGame(seed=11, config=config, policies=policies)
+        assert dump(replay(journal, fresh.game, turn=turn)) == state
+        assert not fresh.game.board_index.check_consistency()
+
+
+def test_replay_covers_mortgage_buyback_and_trade():
+    game = _new_game()
+    buffer = io.BytesIO()
+    writer = JournalWriter(buffer, game, snapshot_every=2)
+    first, second = game.players
+
+    first.buy_estate(_estate(game, 1))
+    first.buy_estate(_estate(game, 2))
+    second.buy_estate(_estate(game, 3))
+    first.mortgage(_estate(game, 1))
+    game.advance_turn()
+    game.advance_turn()
+    first.buyback(_estate(game, 1))
+    first.mortgage(_estate(game, 2))
+    first.trade_estates(
+        second, [_estate(game, 1)], [_estate(game, 3)], funds_to_give=Funds(amount=10)
+    )
+    transfer_many([(first, second, 5), (second, first, 7)])
+    for _ in range(3):
+        game.advance_turn()
+    writer.close()
+
+    assert _estate(game, 2).turns_until_buyback == 12
+    assert dump(replay(Journal(buffer.getvalue()), _new_game())) == dump(game)
+
+
+def test_events_round_trip_through_the_log():
+    game = _new_game()
+    buffer = io.BytesIO()
+    with JournalWriter(buffer, game) as writer:
+        events = [
+            TurnStarted(3),
+            RentReduced(Rate(1000), Rate(3000), 80),
+            EstatesTraded(1, 2, (4, 5), (), 0, 120),
+        ]
+        for event in events:
+            writer.emit(event)
+
+    records = list(Journal(buffer.getvalue()))
+    assert records[0] == (0, dump(game))
+    assert records[1:] == events
+
+
+def test_rejects_foreign_and_truncated_files():
+    with pytest.raises(JournalError):
+        Journal(b"PK\x03\x04 not a journal")
+
+    game = _new_game()
+    buffer = io.BytesIO()
+    with JournalWriter(buffer, game):
+        game.advance_turn()
+    with pytest.raises(JournalError):
+        Journal(buffer.getvalue()[:-3])
@@ -0,0 +1,46 @@
+# tests/domain/test_logging_mode.py
+
+import logging
+
+from monopoly.domain.entities.estate import Estate, EstateCategory, EstateId
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.logging_mode import DOMAIN_LOGGER, set_domain_log_level, silent_simulation
+from monopoly.domain.value_objects.funds import Funds
+
+
+class CountingName(str):
+    formatted = 0
+
+    def __str__(self):
+        CountingName.formatted += 1
+        return str.__str__(self)
+
+
+def make_estate():
+    return Estate(identity=EstateId(1), name=CountingName("Honey Street"), price=60,
+                  mortgage_price=30, buyback_price=33, category=EstateCategory.CLOTHING)
+
+
+def test_nothing_is_formatted_below_the_level():
+    CountingName.formatted = 0
+    player = Player(identity=PlayerId(1), funds=Funds(amount=1500))
+    set_domain_log_level(logging.WARNING)
+    try:
+        player.buy_estate(make_estate())
+        player.advance_turn()
+    finally:
+        set_domain_log_level(logging.NOTSET)
+    assert CountingName.formatted == 0
+
+
+def test_silent_simulation_suppresses_and_restores(caplog):
+    player = Player(identity=PlayerId(1), funds=Funds(amount=1500))
+    with caplog.at_level(logging.INFO, logger=DOMAIN_LOGGER):
+        with silent_simulation():
+            player.buy_estate(make_estate())
+            assert logging.getLogger("monopoly.domain.entities.player").disabled
+        assert not caplog.records
+
+        player.advance_turn()
+    assert not logging.getLogger("monopoly.domain.entities.player").disabled
+    assert caplog.records
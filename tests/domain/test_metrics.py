@@ -0,0 +1,110 @@
+# tests/domain/test_metrics.py
+
+import pytest
+
+from monopoly.domain import metrics
+from monopoly.domain.entities.game.board import create_estates
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.exceptions.base import InsufficientFundsError
+from monopoly.domain.exceptions.estate_exc import EstateAlreadyOwnedException
+from monopoly.domain.metrics import Histogram, MetricsRegistry, instrumented
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig
+from monopoly.domain.simulation.policies import GreedyPolicy
+from monopoly.domain.value_objects.funds import Funds
+
+
+def _samples(text: str) -> dict[str, float]:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines() if not line.startswith("#")
+    }
+
+
+def test_operations_are_timed_and_rejections_counted():
+    original = Player.buy_estate
+    registry = MetricsRegistry()
+    with instrumented(registry, sample_every=1):
+        assert Player.buy_estate is not original
+        rich = Player(identity=PlayerId(1), funds=Funds.of(1000))
+        poor = Player(identity=PlayerId(2), funds=Funds.of(0))
+        estate = create_estates()[0]
+        rich.buy_estate(estate)
+        with pytest.raises(InsufficientFundsError):
+            poor.buy_estate(create_estates()[1])
+        with pytest.raises(EstateAlreadyOwnedException):
+            Player(identity=PlayerId(3), funds=Funds.of(1000)).buy_estate(estate)
+        rich.mortgage(estate)
+    assert Player.buy_estate is original
+
+    samples = _samples(registry.snapshot())
+    assert samples['monopoly_operations_total{operation="buy"}'] == 3
+    assert samples['monopoly_operation_seconds_count{operation="buy"}'] == 3
+    assert samples['monopoly_operation_seconds_bucket{operation="buy",le="+Inf"}'] == 3
+    assert samples['monopoly_operations_total{operation="mortgage"}'] == 1
+    assert samples[
+        'monopoly_rejections_total{error="InsufficientFundsError",operation="buy"}'
+    ] == 1
+    assert samples[
+        'monopoly_rejections_total{error="EstateAlreadyOwnedException",operation="buy"}'
+    ] == 1
+
+
+def test_turn_loop_is_counted():
+    registry = MetricsRegistry()
+    simulated = SimulatedGame(
+        seed=3, config=SimulationConfig(players=2, max_turns=30), policies=[GreedyPolicy()]
+    )
+    with instrumented(registry):
+        result = simulated.run()
+
+    samples = _samples(registry.snapshot())
+    assert samples['monopoly_operations_total{operation="advance_turn"}'] == result.turns
+    assert samples['monopoly_operations_total{operation="rent_update"}'] == result.turns
+    assert samples['monopoly_operations_total{operation="game_end"}'] >= 1
+    assert samples['monopoly_operations_total{operation="buy"}'] == sum(
+        1 for owner in result.ownership if owner
+    )
+    # One call in SAMPLE_EVERY is timed
+    assert samples['monopoly_operation_seconds_count{operation="advance_turn"}'] == (
+        result.turns // metrics.SAMPLE_EVERY
+    )
+
+
+def test_histogram_buckets_are_cumulative_in_the_snapshot(tmp_path):
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", path='a"b\\c')
+    for value in (1e-6, 3e-6, 2.0):
+        histogram.observe(value)
+    registry.counter("calls_total", "Calls.").inc(2)
+
+    registry.write(tmp_path / "metrics.prom")
+    text = (tmp_path / "metrics.prom").read_text()
+    assert "# TYPE latency_seconds histogram" in text
+    samples = _samples(text)
+    assert samples['latency_seconds_bucket{path="a\\"b\\\\c",le="1e-06"}'] == 1
+    assert samples['latency_seconds_bucket{path="a\\"b\\\\c",le="5e-06"}'] == 2
+    assert samples['latency_seconds_bucket{path="a\\"b\\\\c",le="1"}'] == 2
+    assert samples['latency_seconds_bucket{path="a\\"b\\\\c",le="+Inf"}'] == 3
+    assert samples["calls_total"] == 2
+    assert Histogram().counts == [0] * (len(metrics.LATENCY_BUCKETS) + 1)
+
+
+def test_metrics_install_once():
+    with instrumented(MetricsRegistry()):
+        with pytest.raises(RuntimeError):
+            metrics.install(MetricsRegistry())
+    registry = MetricsRegistry()
+    with instrumented(registry):
+        with pytest.raises(RuntimeError):
+            metrics.install(registry, sample_every=1)
+        # Installing the same registry again is counted, not refused
+        with instrumented(registry):
+            pass
+        assert hasattr(Player.buy_estate, "__wrapped__")
+    assert not hasattr(Player.buy_estate, "__wrapped__")
+    with pytest.raises(ValueError):
+        metrics.install(MetricsRegistry(), sample_every=3)
+    with pytest.raises(ValueError):
+        registry = MetricsRegistry()
+        registry.counter("calls", "Calls.")
+        registry.histogram("calls", "Calls.")
@@ -0,0 +1,91 @@
+# tests/domain/test_profiling.py
+
+import sys
+
+from monopoly.domain import metrics
+from monopoly.domain.metrics import MetricsRegistry
+from monopoly.domain.profiling import OUTSIDE, SamplingProfiler
+from monopoly.domain.simulation.engine import SimulatedGame, SimulationConfig, Simulator
+from monopoly.domain.simulation.policies import GreedyPolicy
+
+
+def _started_game():
+    return SimulatedGame(1, SimulationConfig(players=2), [GreedyPolicy()]).game
+
+
+def test_samples_are_attributed_to_the_innermost_phase():
+    profiler = SamplingProfiler()
+    game = _started_game()
+
+    def take_turn(player) -> None:
+        profiler.record(sys._getframe())
+
+    game.advance_turn(take_turn)
+    profiler.record(sys._getframe())
+
+    assert profiler.samples == 3
+    assert profiler.phases == {"player turns": 2, OUTSIDE: 1}
+    turn_stack = next(stack for stack in profiler.stacks if stack[0] == "player turns")
+    assert turn_stack[-1].endswith(":test_samples_are_attributed_to_the_innermost_phase"
+                                   ".<locals>.take_turn")
+    assert any(label.endswith(":PlayerManager.advance_turns") for label in turn_stack)
+    assert any(label.endswith(":Game.advance_turn") for label in turn_stack)
+
+
+def test_phases_are_found_through_installed_metrics():
+    profiler = SamplingProfiler()
+    game = _started_game()
+
+    def take_turn(player) -> None:
+        profiler.record(sys._getframe())
+
+    with metrics.instrumented(MetricsRegistry()):
+        game.advance_turn(take_turn)
+
+    assert profiler.phases == {"player turns": 2}
+
+
+def test_collapsed_stacks_and_breakdown():
+    profiler = SamplingProfiler()
+    profiler.record(sys._getframe())
+    profiler.record(sys._getframe())
+    profiler.elapsed = 0.5
+
+    (line,) = profiler.collapsed().splitlines()
+    stack, count = line.rsplit(" ", 1)
+    assert count == "2"
+    assert stack.startswith(f"{OUTSIDE};")
+    assert stack.endswith(":test_collapsed_stacks_and_breakdown")
+
+    breakdown = profiler.breakdown().splitlines()
+    assert breakdown[1].split() == ["outside", "turns", "2", "100.0%", "0.500s"]
+    assert breakdown[-1].split() == ["total", "2", "0.500s"]
+
+
+def test_profiling_a_simulation_writes_collapsed_stacks(tmp_path):
+    switch_interval = sys.getswitchinterval()
+    simulator = Simulator(config=SimulationConfig(max_turns=200), policies=[GreedyPolicy()])
+    with SamplingProfiler(interval=0.0005) as profiler:
+        assert sys.getswitchinterval() <= 0.0005
+        simulator.run(range(20))
+    assert sys.getswitchinterval() == switch_interval
+
+    assert profiler.samples > 0
+    assert profiler.samples == sum(profiler.phases.values()) == sum(profiler.stacks.values())
+    assert profiler.elapsed > 0
+
+    path = tmp_path / "run.collapsed"
+    profiler.write_collapsed(path)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == profiler.samples
+    assert all(line.split(";", 1)[0] in {*profiler.phases} for line in lines)
+
+
+def test_stopped_profiler_takes_no_samples():
+    profiler = SamplingProfiler(interval=0.0005)
+    profiler.stop()
+    with profiler:
+        pass
+    samples = profiler.samples
+    _started_game()
+    assert profiler.samples == samples
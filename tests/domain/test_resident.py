@@ -0,0 +1,115 @@
+# tests/domain/test_resident.py
+
+import gc
+import logging
+import sys
+import tracemalloc
+
+from monopoly.domain.entities.estate import EstateCategory, EstateId
+from monopoly.domain.entities.game.board import DEFAULT_BOARD, build_registry, create_estates
+from monopoly.domain.entities.game.catalog import BoardCatalog
+from monopoly.domain.entities.game.estate_table import EstateTable
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.resident import ResidentGame
+from monopoly.domain.snapshot import pack_managers
+from monopoly.domain.value_objects.funds import Funds
+
+
+def _state(game):
+    estates = sorted(
+        (estate for estates in game.estate_registry.values() for estate in estates),
+        key=lambda estate: estate.identity,
+    )
+    return (
+        [(estate.identity, estate.owner, estate._state, estate.turns_until_buyback,
+          getattr(estate, "stars", 0), estate.current_rent()) for estate in estates],
+        [(player.identity, player.funds, sorted(player.estates)) for player in game.players],
+        [player.identity for player in game.player_manager.eliminated],
+        pack_managers(game), game.current_turn, game.winner and game.winner.identity,
+        game.time_manager.start_time, game.time_manager.end_time,
+    )
+
+
+def test_catalog_is_shared_and_immutable():
+    catalog = BoardCatalog.default()
+    assert BoardCatalog.of(DEFAULT_BOARD) is catalog
+    assert catalog.categories[EstateCategory.PERFUMERY] == (EstateId(1), EstateId(2))
+    assert catalog.spec(EstateId(3)).price == 150
+    first, second = create_estates(), create_estates()
+    assert first[0] is not second[0] and first[0].name is second[0].name
+
+
+def test_park_and_resume_round_trip(played_game, high_rent_board):
+    game = played_game()
+    assert game.player_manager.eliminated and game.board_index.mortgaged
+
+    resident = ResidentGame.park(game, BoardCatalog.of(high_rent_board))
+    resumed = resident.resume(clock=game.clock)
+    assert _state(resumed) == _state(game)
+    assert resumed.board_index.check_consistency() == []
+    assert resumed.mortgage_expiry.deadline(next(iter(game.board_index.mortgaged))) is not None
+
+
+def test_resident_game_is_a_fraction_of_a_game(played_game, high_rent_board):
+    game = played_game()
+    resident = ResidentGame.park(game, BoardCatalog.of(high_rent_board))
+    assert sys.getsizeof(resident) < 1500
+    table = resident.estates
+    owned = next(player for player in game.players if player.estates)
+    assert sorted(table.owned_by(owned.identity)) == sorted(owned.estates)
+    mortgaged = next(iter(game.board_index.mortgaged))
+    assert table.is_mortgaged(mortgaged) and table.owner_of(mortgaged) is not None
+
+
+def _owned_game() -> Game:
+    players = [Player(identity=PlayerId(seat), funds=Funds(amount=50_000)) for seat in (1, 2)]
+    game = Game(players=players, estate_registry=build_registry(create_estates()))
+    for estates in game.estate_registry.values():
+        for estate in estates:
+            players[estate.identity % 2].buy_estate(estate)
+    return game
+
+
+def _retained_bytes(build, count: int = 50) -> float:
+    # Captured log records would be counted as retained memory
+    logging.disable(logging.CRITICAL)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [build() for _ in range(count)]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+        logging.disable(logging.NOTSET)
+    assert len(kept) == count
+    return retained / count
+
+
+def test_parked_games_retain_a_fraction_of_live_games_memory():
+    catalog = BoardCatalog.default()
+    live = _retained_bytes(_owned_game)
+    parked = _retained_bytes(lambda: ResidentGame.park(_owned_game(), catalog))
+    assert parked < live / 5
+
+    # Live games keep their own Estate objects, but not their own copies of static values
+    first, second = _owned_game(), _owned_game()
+    for game in (first, second):
+        for estates in game.estate_registry.values():
+            for estate in estates:
+                row = catalog.position(estate.identity)
+                assert estate.name is catalog.names[row]
+                assert estate.rent is catalog.rents[row]
+
+
+def test_table_round_trips_estates():
+    estates = create_estates()
+    estates[0].owner = 7
+    estates[0].stars = 2
+    table = EstateTable.capture(BoardCatalog.default(), estates)
+    copy = table.create_estates()
+    assert [(estate.identity, estate.owner, getattr(estate, "stars", 0)) for estate in copy] == [
+        (estate.identity, estate.owner, getattr(estate, "stars", 0)) for estate in estates
+    ]
@@ -0,0 +1,80 @@
+# tests/domain/test_snapshot.py
+
+import pytest
+
+from monopoly.domain.entities.estate import EstateCategory
+from monopoly.domain.entities.game.board import build_registry, create_estates
+from monopoly.domain.entities.game.game import Game
+from monopoly.domain.entities.game.move_generator import MoveGenerator
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.entities.player import Player, PlayerId
+from monopoly.domain.snapshot import SnapshotError, dump, fork, restore, restore_into
+from monopoly.domain.value_objects.funds import Funds
+
+
+def _estate_map(game):
+    return {
+        estate.identity: estate
+        for estates in game.estate_registry.values() for estate in estates
+    }
+
+
+def test_restore_rebuilds_an_equal_game(played_game):
+    game = played_game()
+    assert game.player_manager.eliminated and game.board_index.mortgaged
+
+    data = dump(game)
+    restored = restore(data)
+
+    assert dump(restored) == data
+    assert restored.winner.identity == game.winner.identity
+    assert restored.board_index.mortgaged == game.board_index.mortgaged
+    assert not restored.board_index.check_consistency()
+    for player in restored.players:
+        assert all(estate.owner == player.identity for estate in player.estates.values())
+
+
+def test_fork_is_equal_and_independent(played_game):
+    game = played_game()
+    original = dump(game)
+    forked = fork(game, clock=VirtualClock())
+
+    assert dump(forked) == original
+    player = next(player for player in forked.players if player.estates)
+    estate = next(estate for estate in player.estates.values() if estate.is_mortgaged())
+    player.buyback(estate)
+    forked.advance_turn()
+
+    assert dump(game) == original
+    assert _estate_map(game)[estate.identity].is_mortgaged()
+    assert not forked.board_index.check_consistency()
+
+
+def test_rejects_foreign_and_truncated_data(played_game):
+    data = dump(played_game(turns=5))
+    with pytest.raises(SnapshotError):
+        restore(b"MNPJ" + data[4:])
+    with pytest.raises(SnapshotError):
+        restore(data[:-4])
+
+
+def test_restore_into_keeps_a_built_move_generator_in_step():
+    players = [Player(identity=PlayerId(seat), funds=Funds.of(50_000)) for seat in (1, 2)]
+    game = Game(players=players, estate_registry=build_registry(create_estates()))
+    perfumery = sorted(
+        game.estate_registry[EstateCategory.PERFUMERY], key=lambda estate: estate.identity
+    )
+    for estate in perfumery:
+        players[0].buy_estate(estate)
+    generator = game.move_generator
+    data = dump(game)
+    estate = perfumery[0]
+    while estate.stars < estate.max_stars:
+        estate.build_star()
+    assert not generator.legal_moves(players[0]).build & 1 << estate.identity
+
+    restore_into(game, data)
+    assert estate.stars == 0
+    fresh = MoveGenerator(_estate_map(game).values(), game.players)
+    for player in players:
+        assert generator.legal_moves(player) == fresh.legal_moves(player)
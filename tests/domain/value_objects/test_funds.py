@@ -0,0 +1,84 @@
+# tests/domain/value_objects/test_funds.py
+
+from decimal import Decimal
+
+import pytest
+
+from monopoly.domain.entities.player import Player, PlayerId, transfer, transfer_many
+from monopoly.domain.exceptions.base import InsufficientFundsError
+from monopoly.domain.exceptions.estate_exc import InvalidFundsException
+from monopoly.domain.value_objects.funds import Funds
+
+
+@pytest.fixture
+def player1():
+    return Player(identity=PlayerId(1), funds=Funds(amount=1500))
+
+
+@pytest.fixture
+def player2():
+    return Player(identity=PlayerId(2), funds=Funds(amount=1500))
+
+
+def test_small_amounts_are_interned():
+    assert Funds.of(60) is Funds.of(60)
+    assert Funds(amount=100).add(Funds(amount=20)) is Funds.of(120)
+    assert Funds.of(10**6) == Funds(amount=10**6)
+
+
+def test_funds_int_and_decimal_operands_agree():
+    funds = Funds(amount=1000)
+    assert funds.add(Funds(amount=250)) == funds.add(250) == funds.add(Decimal("250"))
+    assert funds + Decimal("2000") == Funds(amount=3000)
+    assert Decimal("5") + funds == Funds(amount=1005)
+    assert funds - 400 == Funds(amount=600)
+    # Fractional Decimals round down, like rates applied to Funds
+    assert funds.add(Decimal("0.99")) == funds
+
+
+def test_results_are_still_validated():
+    with pytest.raises(InvalidFundsException):
+        Funds(amount=10).subtract(11)
+    with pytest.raises(InvalidFundsException):
+        Funds(amount=10).add(-11)
+    with pytest.raises(InvalidFundsException):
+        Funds(amount=-1)
+
+
+def test_apply_rate_rounds_down():
+    assert Funds(amount=199).apply_rate(Decimal("0.10")) == Funds(amount=19)
+    assert Funds(amount=1000).apply_rate(Decimal("0.99")) == Funds(amount=990)
+    assert Funds(amount=1000).add_many([Funds(amount=1), 2, Decimal("3")]) == Funds(amount=1006)
+
+
+def test_transfer(player1, player2):
+    transfer(player1, player2, Funds(amount=500))
+    assert player1.funds.amount == 1000
+    assert player2.funds.amount == 2000
+
+    with pytest.raises(InsufficientFundsError):
+        transfer(player1, player2, 1001)
+
+
+def test_transfer_many_applies_net_changes(player1, player2):
+    transfer_many([(player1, player2, 1400), (player2, player1, 300), (player1, player2, 400)])
+    assert player1.funds.amount == 0
+    assert player2.funds.amount == 3000
+
+
+def test_transfer_many_is_all_or_nothing(player1, player2):
+    with pytest.raises(InsufficientFundsError):
+        transfer_many([(player1, player2, 1000), (player1, player2, 501)])
+    assert player1.funds.amount == 1500
+    assert player2.funds.amount == 1500
+
+
+def test_negative_amounts_are_refused_without_changing_anyone(player1, player2):
+    with pytest.raises(InvalidFundsException):
+        Funds(amount=100).subtract(-50)
+    with pytest.raises(InvalidFundsException):
+        transfer(player1, player2, -50)
+    with pytest.raises(InvalidFundsException):
+        transfer_many([(player1, player2, 100), (player2, player1, -50)])
+    assert player1.funds.amount == 1500
+    assert player2.funds.amount == 1500
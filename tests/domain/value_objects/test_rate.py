@@ -0,0 +1,41 @@
+# tests/domain/value_objects/test_rate.py
+
+from decimal import Decimal
+
+import pytest
+
+from monopoly.domain.exceptions.estate_exc import InvalidRateException
+from monopoly.domain.value_objects.funds import Funds
+from monopoly.domain.value_objects.rate import FULL, ZERO, Rate
+
+
+def test_conversions_are_exact():
+    assert Rate.from_decimal("0.15") == Rate.from_percent(15) == Rate(1500)
+    assert Rate.from_percent("0.01") == Rate(1)
+    assert Rate(1050).to_decimal() == Decimal("0.105")
+    assert str(Rate(1050)) == "10.5%"
+    with pytest.raises(InvalidRateException):
+        Rate.from_decimal("0.00001")
+    with pytest.raises(InvalidRateException):
+        Rate(-1)
+
+
+def test_apply_rounds_down_like_decimal_rates():
+    for amount in (0, 1, 9, 199, 1000, 12_345, 10**12 + 7):
+        for rate in ("0.01", "0.10", "0.15", "0.3333", "0.99"):
+            expected = Funds.of(amount).apply_rate(Decimal(rate))
+            assert Funds.of(amount).apply_rate(Rate.from_decimal(rate)) == expected
+            assert Rate.from_decimal(rate).apply(amount) == expected.amount
+
+
+def test_arithmetic_and_ordering():
+    step = Rate(1000)
+    assert step + step == Rate(2000)
+    assert min(Rate(4500) + step, Rate(5000)) == Rate(5000)
+    assert Rate(5000) - step == Rate(4000)
+    assert Rate(3000).complement() == Rate(7000)
+    assert ZERO < step < FULL
+    assert not ZERO and step
+    assert Rate.of(1500) is Rate.of(1500)
+    with pytest.raises(InvalidRateException):
+        step - Rate(2000)
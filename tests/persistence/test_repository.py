@@ -0,0 +1,185 @@
+# tests/persistence/test_repository.py
+
+import pytest
+
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.events import TurnStarted
+from monopoly.domain.simulation.engine import SimulatedGame
+from monopoly.domain.snapshot import dump
+from monopoly.persistence.database import Database
+from monopoly.persistence.exceptions import GameNotFoundError, NoReaderAvailableError
+from monopoly.persistence.games import GameRepository
+from monopoly.persistence.users import SqliteUserRepository
+from monopoly.subdomain.auth import Username, UsernameTakenError, register_user
+
+
+@pytest.fixture
+def database(tmp_path):
+    with Database(tmp_path / "monopoly.db") as database:
+        yield database
+
+
+def _play_turn(simulated: SimulatedGame) -> None:
+    game = simulated.game
+    game.advance_turn(simulated.take_turn)
+    if len(game.players) <= 1 and not game.is_game_over():
+        game.end_game()
+    simulated.clock.advance(simulated.config.turn_duration)
+
+
+def _state(game) -> bytes:
+    # Holdings are a set; only the order in which they were acquired may differ
+    for player in (*game.players, *game.player_manager.eliminated):
+        player.estates = dict(sorted(player.estates.items()))
+    return dump(game)
+
+
+def test_turns_committed_by_a_unit_of_work_reload_as_the_same_game(database, simulated_game):
+    repository = GameRepository(database)
+    simulated = simulated_game()
+    game = simulated.game
+    game_id = repository.add(game)
+
+    with repository.unit_of_work(game_id, game) as unit:
+        while not game.is_game_over() and game.current_turn < simulated.config.max_turns:
+            _play_turn(simulated)
+            unit.commit()
+            assert not unit.pending
+        estate = next(
+            estate for player in game.players for estate in player.estates.values()
+            if hasattr(estate, "build_star")
+        )
+        estate.build_star()
+    assert game.player_manager.eliminated and game.winner
+
+    loaded = repository.get(game_id, clock=VirtualClock())
+    assert _state(loaded) == _state(game)
+    assert repository.funds(game_id) == {
+        player.identity: player.funds.amount
+        for player in (*game.players, *game.player_manager.eliminated)
+    }
+    assert repository.owned_by(game_id, game.winner.identity) == sorted(game.winner.estates)
+
+
+def test_a_commit_writes_only_what_changed(database, simulated_game):
+    repository = GameRepository(database)
+    simulated = simulated_game()
+    game = simulated.game
+    game_id = repository.add(game)
+
+    with repository.unit_of_work(game_id, game) as unit:
+        assert unit.commit() == 0
+        game.current_turn += 1
+        # Changes made without an event are not seen; the next turn's start is
+        assert not unit.pending
+        _play_turn(simulated)
+        games, players, estates = unit.rows()
+        assert len(games) == 1
+        assert 0 < len(players) <= 3
+        # One landing per player on the first turn
+        assert len(estates) <= 3
+        assert unit.commit() == len(games) + len(players) + len(estates)
+
+    game.reset()
+    repository.save(game_id, game)
+    assert _state(repository.get(game_id, clock=VirtualClock())) == _state(game)
+
+
+def test_units_of_several_games_commit_together(database, simulated_game):
+    repository = GameRepository(database)
+    games = [simulated_game(seed) for seed in range(5)]
+    units = [
+        repository.unit_of_work(repository.add(simulated.game), simulated.game)
+        for simulated in games
+    ]
+    for simulated in games:
+        _play_turn(simulated)
+    assert repository.commit(units) >= 2 * len(units)
+    assert not any(unit.pending for unit in units)
+    for simulated, unit in zip(games, units):
+        unit.close()
+        loaded = repository.get(unit.game_id, clock=VirtualClock())
+        assert _state(loaded) == _state(simulated.game)
+
+
+def test_a_failed_commit_keeps_changes_pending(database, monkeypatch, simulated_game):
+    repository = GameRepository(database)
+    simulated = simulated_game()
+    game_id = repository.add(simulated.game)
+    unit = repository.unit_of_work(game_id, simulated.game)
+    _play_turn(simulated)
+
+    def fail(connection, rows):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(GameRepository, "_write", staticmethod(fail))
+    with pytest.raises(OSError):
+        unit.commit()
+    assert unit.pending
+    monkeypatch.undo()
+
+    unit.commit()
+    assert repository.get(game_id).current_turn == 1
+
+
+def test_a_unit_keeps_the_attached_sink_and_gives_it_back(database, simulated_game):
+    repository = GameRepository(database)
+    simulated = simulated_game()
+    game = simulated.game
+    seen = []
+
+    class Sink:
+        def emit(self, event):
+            seen.append(event)
+
+    sink = Sink()
+    game.attach_events(sink)
+    with repository.unit_of_work(repository.add(game), game) as unit:
+        _play_turn(simulated)
+    assert TurnStarted(1) in seen
+    assert game.events is sink
+    assert all(
+        unit not in estate._observers
+        for estates in game.estate_registry.values() for estate in estates
+    )
+
+
+def test_readers_see_committed_state_while_a_write_is_open(database, simulated_game):
+    repository = GameRepository(database)
+    simulated = simulated_game()
+    game_id = repository.add(simulated.game)
+    before = repository.funds(game_id)
+
+    with database.transaction() as connection:
+        connection.execute("UPDATE players SET funds = 0 WHERE game_id = ?", (game_id,))
+        assert repository.funds(game_id) == before
+    assert set(repository.funds(game_id).values()) == {0}
+
+
+def test_reader_pool_is_bounded(tmp_path):
+    with Database(tmp_path / "monopoly.db", readers=1, timeout=0.01) as database:
+        with database.reader():
+            with pytest.raises(NoReaderAvailableError):
+                with database.reader():
+                    pass
+        with database.reader():
+            pass
+        assert database.readers.opened == 1
+
+
+def test_unknown_game(database):
+    with pytest.raises(GameNotFoundError):
+        GameRepository(database).get(404)
+
+
+def test_usernames_are_unique(database):
+    users = SqliteUserRepository(database)
+    user = register_user(users, Username(value="alice"), "alice@example.com")
+    assert users.get_by_username(Username(value="alice")) == user
+    assert users.get_by_username(Username(value="bob")) is None
+
+    with pytest.raises(UsernameTakenError):
+        register_user(users, Username(value="alice"), "other@example.com")
+    # The constraint holds even when the check is skipped, as in a racing registration
+    with pytest.raises(UsernameTakenError):
+        users.add(Username(value="alice"), "other@example.com")
@@ -0,0 +1,193 @@
+# tests/server/test_host.py
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from monopoly.domain.entities.game.time_manager import VirtualClock
+from monopoly.domain.exceptions.estate_exc import EstateAlreadyOwnedException
+from monopoly.server.client import LocalClient
+from monopoly.server.commands import EndTurn
+from monopoly.server.exceptions import (
+    NotYourTurnError,
+    StaleCommandError,
+    TableBusyError,
+    TableClosedError,
+)
+from monopoly.server.host import GameHost
+from monopoly.server.timer_wheel import TimerWheel
+
+
+def _manual_host(clock: VirtualClock, max_pending: int = 256) -> GameHost:
+    # The wheel is ticked by the test instead of its own task
+    return GameHost(TimerWheel(tick=timedelta(minutes=1), slots=8, clock=clock), max_pending)
+
+
+def _advance(host: GameHost, clock: VirtualClock, minutes: int) -> None:
+    for _ in range(minutes):
+        clock.advance(timedelta(minutes=1))
+        host.wheel.tick()
+
+
+def test_commands_bump_the_version_and_stale_ones_are_rejected():
+    async def scenario():
+        host = _manual_host(VirtualClock())
+        table = host.open_table(players=2)
+        first = LocalClient(host, table.table_id, 1)
+        second = LocalClient(host, table.table_id, 2)
+
+        assert await first.buy(1) == 1
+        with pytest.raises(StaleCommandError):
+            await second.end_turn()
+        assert second.version == 1
+        with pytest.raises(NotYourTurnError):
+            await second.end_turn()
+        assert await first.end_turn() == 2
+
+        with pytest.raises(StaleCommandError):
+            await second.buy(2)
+        assert await second.buy(2) == 3
+        with pytest.raises(EstateAlreadyOwnedException):
+            await second.buy(1)
+        assert table.version == 3
+        await host.stop()
+        return table
+
+    table = asyncio.run(scenario())
+    assert [estate.owner for estate in table.game.players[0].estates.values()] == [1]
+    assert list(table.game.players[1].estates) == [2]
+
+
+def test_a_flooded_table_does_not_block_the_others():
+    async def scenario():
+        host = _manual_host(VirtualClock(), max_pending=500)
+        busy = host.open_table(players=2)
+        idle = host.open_table(players=2)
+
+        flood = [host.submit(busy.table_id, EndTurn(player_id=1, version=-1)) for _ in range(500)]
+        assert isinstance(host.submit(busy.table_id, EndTurn(player_id=1, version=0)).exception(),
+                          TableBusyError)
+
+        assert await host.submit(idle.table_id, EndTurn(player_id=1, version=0)) == 1
+        backlog = sum(not future.done() for future in flood)
+        await asyncio.gather(*flood, return_exceptions=True)
+        await host.stop()
+        return backlog
+
+    assert asyncio.run(scenario()) > 400
+
+
+def test_timer_wheel_ends_the_game_and_closes_the_table():
+    async def scenario():
+        clock = VirtualClock()
+        host = _manual_host(clock)
+        table = host.open_table(players=2)
+
+        _advance(host, clock, 45)
+        assert await host.submit(table.table_id, EndTurn(player_id=1, version=0)) == 1
+
+        # The end of the game is applied ahead of commands that are still waiting
+        pending = host.submit(table.table_id, EndTurn(player_id=2, version=1))
+        _advance(host, clock, 1)
+        with pytest.raises(TableClosedError):
+            await pending
+        assert table.closed and table.game.is_game_over()
+        with pytest.raises(TableClosedError):
+            await host.submit(table.table_id, EndTurn(player_id=2, version=1))
+        await host.stop()
+
+    asyncio.run(scenario())
+
+
+def test_timer_wheel_raises_the_tax_rate():
+    async def scenario():
+        clock = VirtualClock()
+        host = _manual_host(clock)
+        table = host.open_table(players=2)
+        # Keep the game running past its regular end, when the tax increase is due
+        for timer in host._timers[table.table_id][1:]:
+            timer.cancel()
+        game = table.game
+
+        _advance(host, clock, 60)
+        await asyncio.sleep(0)
+        assert not game.tax_manager.current_tax_rate
+        _advance(host, clock, 1)
+        await asyncio.sleep(0)
+        assert game.tax_manager.current_tax_rate == game.tax_manager.tax_step
+        assert table.version == 1
+        await host.stop()
+
+    asyncio.run(scenario())
+
+
+def test_timer_wheel_handles_delays_longer_than_one_revolution():
+    clock = VirtualClock()
+    wheel = TimerWheel(tick=timedelta(seconds=1), slots=4, clock=clock)
+    fired: list[str] = []
+    wheel.schedule(timedelta(seconds=10), lambda: fired.append("late"))
+    wheel.schedule(timedelta(seconds=2), lambda: fired.append("early"))
+    wheel.schedule(timedelta(seconds=3), lambda: fired.append("cancelled")).cancel()
+
+    for second in range(1, 11):
+        wheel.tick()
+        if second == 2:
+            assert fired == ["early"]
+    assert fired == ["early", "late"]
+
+
+def test_host_exposes_metrics_of_its_tables():
+    from monopoly.domain.metrics import MetricsRegistry
+
+    async def scenario():
+        host = GameHost(
+            TimerWheel(tick=timedelta(minutes=1), slots=8, clock=VirtualClock()),
+            metrics=MetricsRegistry(),
+        )
+        host.start()
+        table = host.open_table(players=2)
+        first = LocalClient(host, table.table_id, 1)
+        second = LocalClient(host, table.table_id, 2)
+        await first.buy(1)
+        await first.end_turn()
+        second.version = table.version
+        with pytest.raises(EstateAlreadyOwnedException):
+            await second.buy(1)
+        await host.stop()
+        return host.metrics_snapshot()
+
+    snapshot = asyncio.run(scenario())
+    assert 'monopoly_operations_total{operation="buy"} 2' in snapshot
+    assert (
+        'monopoly_rejections_total{error="EstateAlreadyOwnedException",operation="buy"} 1'
+        in snapshot
+    )
+
+
+def test_hosts_sharing_a_registry_run_side_by_side():
+    from monopoly.domain.metrics import MetricsRegistry
+
+    async def scenario():
+        registry = MetricsRegistry()
+        hosts = [
+            GameHost(
+                TimerWheel(tick=timedelta(minutes=1), slots=8, clock=VirtualClock()),
+                metrics=registry,
+            )
+            for _ in range(2)
+        ]
+        for host in hosts:
+            host.start()
+        other = GameHost(metrics=MetricsRegistry())
+        with pytest.raises(RuntimeError):
+            other.start()
+        await other.stop()
+
+        await hosts[0].stop()
+        table = hosts[1].open_table(players=2)
+        await LocalClient(hosts[1], table.table_id, 1).buy(1)
+        await hosts[1].stop()
+        return registry.snapshot()
+
+    assert 'monopoly_operations_total{operation="buy"} 1' in asyncio.run(scenario())
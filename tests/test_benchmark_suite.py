@@ -0,0 +1,49 @@
+# tests/test_benchmark_suite.py
+
+import json
+
+import pytest
+
+from benchmarks import suite
+from benchmarks.suite import Case
+
+
+def _fixed(seconds: float, operations: int):
+    def run(estates: int = 0) -> suite.Sample:
+        return seconds * max(estates, 1), operations
+
+    return run
+
+
+def test_run_reports_best_ns_per_op_and_quick_skips_large_boards():
+    timings = iter([(0.002, 1000), (0.001, 1000), (0.003, 1000)])
+    cases = (
+        Case("noisy", lambda: next(timings)),
+        Case("sized", _fixed(1e-6, 1), ({"estates": 18}, {"estates": 100_000})),
+    )
+    results = suite.run(cases, repeat=3, quick=True)
+
+    assert results == pytest.approx({"noisy": 1000.0, "sized[estates=18]": 18_000.0})
+    assert suite.run(cases[1:], repeat=1, only="100000") == pytest.approx(
+        {"sized[estates=100000]": 1e8}
+    )
+
+
+def test_gate_fails_only_past_the_threshold(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    suite.save(baseline, {"fast": 100.0, "steady": 100.0})
+    assert json.loads(baseline.read_text())["results"]["fast"] == 100.0
+
+    assert suite.gate(baseline, {"fast": 115.0, "steady": 90.0, "added": 5.0}, 0.2) == 0
+    assert suite.gate(baseline, {"fast": 125.0, "steady": 100.0}, 0.2) == 1
+    output = capsys.readouterr().out
+    assert "added" in output and "new" in output
+    assert "fast" in output and "REGRESSED" in output
+
+
+def test_main_saves_a_baseline_and_compares_against_it(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    options = ["--filter", "funds", "--repeat", "1", "--quick"]
+    assert suite.main([*options, "--save", str(baseline)]) == 0
+    assert list(json.loads(baseline.read_text())["results"]) == ["funds.add_subtract"]
+    assert suite.main([*options, "--compare", str(baseline), "--threshold", "10"]) == 0